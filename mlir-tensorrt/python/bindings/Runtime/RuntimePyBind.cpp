@@ -583,7 +583,13 @@ PYBIND11_MODULE(_api, m) {
   py::class_<PyStream>(m, "Stream", py::module_local())
       .def_property_readonly(MTRT_PYTHON_CAPI_PTR_ATTR, &PyStream::getCapsule)
       .def("sync", [](PyStream &stream) {
-        MTRT_Status s = mtrtStreamSynchronize(stream);
+        MTRT_Status s;
+        {
+          // Release the GIL while blocking on the device so that other Python
+          // threads can make progress in the meantime.
+          py::gil_scoped_release release;
+          s = mtrtStreamSynchronize(stream);
+        }
         THROW_IF_MTRT_ERROR(s);
       });
 
@@ -744,9 +750,15 @@ PYBIND11_MODULE(_api, m) {
           [](PyRuntimeClient &self, PyMemRefValue &hostMemRef, PyDevice &device,
              std::optional<MTRT_Stream> stream) {
             MTRT_MemRefValue deviceMemRef{nullptr};
-            MTRT_Status s = mtrtCopyFromHostToDevice(
-                hostMemRef, device, stream ? *stream : mtrtStreamGetNull(),
-                &deviceMemRef);
+            MTRT_Status s;
+            {
+              // Release the GIL during the copy so that other Python threads
+              // can make progress in the meantime.
+              py::gil_scoped_release release;
+              s = mtrtCopyFromHostToDevice(
+                  hostMemRef, device, stream ? *stream : mtrtStreamGetNull(),
+                  &deviceMemRef);
+            }
             THROW_IF_MTRT_ERROR(s);
             return new PyMemRefValue(deviceMemRef);
           },
@@ -757,9 +769,13 @@ PYBIND11_MODULE(_api, m) {
           [](PyRuntimeClient &self, PyMemRefValue &deviceMemRef,
              std::optional<MTRT_Stream> stream) {
             MTRT_MemRefValue hostMemRef{nullptr};
-            MTRT_Status s = mtrtCopyFromDeviceToNewHostMemRef(
-                deviceMemRef, stream ? *stream : mtrtStreamGetNull(),
-                &hostMemRef);
+            MTRT_Status s;
+            {
+              py::gil_scoped_release release;
+              s = mtrtCopyFromDeviceToNewHostMemRef(
+                  deviceMemRef, stream ? *stream : mtrtStreamGetNull(),
+                  &hostMemRef);
+            }
             THROW_IF_MTRT_ERROR(s);
             return new PyMemRefValue(hostMemRef);
           },
@@ -769,9 +785,13 @@ PYBIND11_MODULE(_api, m) {
           "copy_to_host",
           [](PyRuntimeClient &self, PyMemRefValue &deviceMemRef,
              PyMemRefValue &hostMemRef, std::optional<MTRT_Stream> stream) {
-            MTRT_Status s = mtrtCopyFromDeviceToExistingHostMemRef(
-                deviceMemRef, hostMemRef,
-                stream ? *stream : mtrtStreamGetNull());
+            MTRT_Status s;
+            {
+              py::gil_scoped_release release;
+              s = mtrtCopyFromDeviceToExistingHostMemRef(
+                  deviceMemRef, hostMemRef,
+                  stream ? *stream : mtrtStreamGetNull());
+            }
             THROW_IF_MTRT_ERROR(s);
           },
           py::arg("device_memref"), py::arg("existing_host_memref"),
@@ -42,6 +42,7 @@
 #include "mlir-tensorrt-c/Support/Status.h"
 #include "pybind11/pybind11.h"
 #include "pybind11/stl.h"
+#include "llvm/ADT/ScopeExit.h"
 #include "llvm/ADT/Twine.h"
 #include <memory>
 #include <pybind11/attr.h>
@@ -460,6 +461,26 @@ static inline void populateExecutableBindingInModule(py::module &m) {
                  }),
                  py::arg("buffer"),
                  "constructs an executable from a bytes buffer.");
+  executable.def(
+      py::init<>([](py::buffer buffer) -> PyExecutable * {
+        // Accept any contiguous buffer (e.g. a `memoryview` of a
+        // memory-mapped file) without first copying it into a `bytes` object.
+        Py_buffer view;
+        if (PyObject_GetBuffer(buffer.ptr(), &view, PyBUF_SIMPLE) != 0)
+          throw py::error_already_set();
+        auto freeBuffer =
+            llvm::make_scope_exit([&]() { PyBuffer_Release(&view); });
+
+        MTRT_Executable executable;
+        MTRT_StringView bufferStr = mtrtStringViewCreate(
+            static_cast<const char *>(view.buf), view.len);
+        MTRT_Status s = mtrtExecutableCreate(bufferStr, &executable);
+        THROW_IF_MTRT_ERROR(s);
+        return new PyExecutable(executable);
+      }),
+      py::arg("buffer"),
+      "constructs an executable from an object supporting the buffer "
+      "protocol.");
   executable.def(
       "get_signature",
       [](PyExecutable &self, std::string name) {
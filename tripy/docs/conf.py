@@ -28,6 +28,9 @@ import tripy as tp
 from tests import helper
 from tripy.dtype_info import TYPE_VERIFICATION
 
+# `import tripy` loads submodules lazily, so we need to import all of them to populate TYPE_VERIFICATION.
+_ = list(helper.discover_modules())
+
 
 PARAM_PAT = re.compile(":param .*?:")
 
@@ -32,6 +32,8 @@ def load_weights_from_hf(model, model_type, dtype):
     # Load huggingface/transformers model
     model_hf = GPT2LMHeadModel.from_pretrained(model_type)
     hf_state_dict = model_hf.state_dict()
+    # Drop the model so that the state dict holds the only references to the HF weights.
+    del model_hf
     # We ignore some of the keys in the HF checkpoint:
     hf_keys = [
         key for key in hf_state_dict.keys() if not key.endswith(".attn.masked_bias") and not key.endswith(".attn.bias")
@@ -43,17 +45,18 @@ def load_weights_from_hf(model, model_type, dtype):
 
     transposed = ["attn.c_attn.weight", "attn.c_proj.weight", "mlp.c_fc.weight", "mlp.c_proj.weight"]
     torch_dtype = getattr(torch, dtype.name)
-    for key in hf_keys:
-        weight = hf_state_dict[key]
+
+    def transform(key, weight):
         if any(key.endswith(w) for w in transposed):
             with torch.no_grad():
-                weight = hf_state_dict[key].t().contiguous()
+                weight = weight.t().contiguous()
         if "ln" not in key:
             weight = weight.to(torch_dtype)
-        param = tp.Parameter(weight)
-        tripy_state_dict[key] = param
+        return weight
 
-    model.load_from_state_dict(tripy_state_dict)
+    # Weights are converted one at a time as they are loaded. Each HF weight is popped from the state dict as it is
+    # consumed so that it can be freed once converted, rather than keeping the entire HF model alive until the end.
+    model.load_from_iterator(((key, hf_state_dict.pop(key)) for key in hf_keys), transform=transform)
 
 
 def load_quant_weights_from_hf(model, model_type, dtype, quant_mode):
@@ -0,0 +1,264 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 1993-2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import gc
+from types import SimpleNamespace
+
+import cupy as cp
+import mlir_tensorrt.runtime.api as runtime
+import numpy as np
+import pytest
+
+import tripy as tp
+from tripy.backend.mlir.executor import ExecutionQueue, StagingBufferPool
+
+
+def add(a, b):
+    return a + b
+
+
+class RecordingSession:
+    def __init__(self, session):
+        self.session = session
+        self.function_names = []
+
+    def execute_function(self, name, **kwargs):
+        self.function_names.append(name)
+        return self.session.execute_function(name=name, **kwargs)
+
+
+def compile_add(input_shape):
+    return tp.Compiler(add).compile(
+        tp.InputInfo(input_shape, dtype=tp.float32), tp.InputInfo(input_shape, dtype=tp.float32)
+    )
+
+
+class TestExecutor:
+    @pytest.mark.parametrize("input_shape, runs_shape_func", [((2, 2), False), (((1, 2, 3), 2), True)])
+    def test_shape_function_only_run_for_dynamic_shapes(self, input_shape, runs_shape_func):
+        executable = compile_add(input_shape)
+        executor = executable._executor
+        executor.session = RecordingSession(executor.session)
+
+        inp = tp.ones((2, 2), dtype=tp.float32)
+        out = executable(inp, inp)
+
+        assert cp.array_equal(cp.from_dlpack(out), cp.full((2, 2), 2.0, dtype=cp.float32))
+        assert (executor.shape_func_name in executor.session.function_names) == runs_shape_func
+        assert executor.has_dynamic_output_shapes == runs_shape_func
+
+    def test_output_info_precomputed(self):
+        executor = compile_add((2, 3))._executor
+
+        assert executor.num_input_args == 2
+        assert executor.num_output_args == 1
+        assert executor.output_shapes == [(2, 3)]
+        assert executor.output_dtypes == [tp.float32]
+
+    def test_output_info_memoized_by_input_shapes(self, monkeypatch):
+        monkeypatch.setattr(tp.config, "shape_inference_cache_size", 2)
+        executable = compile_add(((1, 2, 3), 2))
+        executor = executable._executor
+        executor.session = RecordingSession(executor.session)
+
+        def run(num_rows):
+            inp = tp.ones((num_rows, 2), dtype=tp.float32)
+            out = executable(inp, inp)
+            assert cp.array_equal(cp.from_dlpack(out), cp.full((num_rows, 2), 2.0, dtype=cp.float32))
+            return executor.session.function_names.count(executor.shape_func_name)
+
+        assert run(1) == 1
+        assert run(1) == 1
+        assert run(2) == 2
+        assert run(1) == 2
+        # The cache holds 2 entries, so this should evict the least recently used shape: (2, 2).
+        assert run(3) == 3
+        assert run(1) == 3
+        assert run(2) == 4
+
+    def test_output_buffer_pool(self, monkeypatch):
+        monkeypatch.setattr(tp.config, "enable_output_buffer_pool", True)
+        executable = compile_add((2, 2))
+        pool = executable._executor.output_buffer_pool
+
+        inp = tp.ones((2, 2), dtype=tp.float32)
+        out = executable(inp, inp)
+        assert (pool.num_allocations, pool.num_reuses) == (1, 0)
+
+        # The buffer can only be reused once the previous output is released.
+        other_out = executable(inp, inp)
+        assert (pool.num_allocations, pool.num_reuses) == (2, 0)
+
+        del out
+        # Tensors contain reference cycles, so they are only released once the garbage collector runs.
+        gc.collect()
+        out = executable(inp, inp)
+        assert (pool.num_allocations, pool.num_reuses) == (2, 1)
+        assert cp.array_equal(cp.from_dlpack(out), cp.full((2, 2), 2.0, dtype=cp.float32))
+        assert cp.array_equal(cp.from_dlpack(other_out), cp.full((2, 2), 2.0, dtype=cp.float32))
+
+
+class FakeStream:
+    def __init__(self):
+        self.num_syncs = 0
+
+    def sync(self):
+        self.num_syncs += 1
+
+
+class FakeSession:
+    def __init__(self):
+        self.num_executions = 0
+
+    def execute_function(self, name, in_args, out_args, stream):
+        self.num_executions += 1
+
+
+class FakeRuntimeClient:
+    def __init__(self):
+        self.host_copies = []
+
+    def create_memref(self, shape, dtype, device, stream):
+        return make_memref(shape)
+
+    def copy_to_device(self, host_memref, device, stream):
+        return make_memref(host_memref.shape)
+
+    def copy_to_host(self, device_memref, existing_host_memref, stream):
+        self.host_copies.append((device_memref, existing_host_memref))
+
+
+def make_memref(shape=(2, 2)):
+    return SimpleNamespace(shape=tuple(shape), dtype=runtime.ScalarTypeCode.f32)
+
+
+def make_output(kind):
+    return SimpleNamespace(device=SimpleNamespace(kind=kind), _pending_execution=None, _memref_value=make_memref())
+
+
+@pytest.fixture
+def queue():
+    stream = FakeStream()
+    return ExecutionQueue(stream, StagingBufferPool(FakeRuntimeClient(), None, stream))
+
+
+class TestExecutionQueue:
+    def test_synchronizes_only_on_wait(self, queue):
+        session = FakeSession()
+        out = make_output("gpu")
+
+        pending = queue.enqueue(session, [], [make_memref()], [out])
+        assert session.num_executions == 1
+        assert queue.stream.num_syncs == 0
+        assert not pending.done
+        assert out._pending_execution is pending
+
+        assert pending.wait() == [out]
+        assert queue.stream.num_syncs == 1
+        assert pending.done
+        assert out._pending_execution is None
+
+        # Waiting again should not synchronize the stream again.
+        pending.wait()
+        assert queue.stream.num_syncs == 1
+
+    def test_single_sync_completes_all_executions(self, queue):
+        session = FakeSession()
+        pendings = [queue.enqueue(session, [], [make_memref()], [make_output("gpu")]) for _ in range(3)]
+
+        pendings[-1].wait()
+        assert queue.stream.num_syncs == 1
+        assert all(pending.done for pending in pendings)
+
+    def test_lock_not_held_while_synchronizing(self, queue):
+        lock_held_during_sync = []
+        queue.stream.sync = lambda: lock_held_during_sync.append(queue.lock.locked())
+
+        queue.enqueue(FakeSession(), [], [make_memref()], [make_output("gpu")]).wait()
+        assert lock_held_during_sync == [False]
+
+    def test_host_outputs_copied_asynchronously(self, queue):
+        pool = queue.staging_buffer_pool
+        out = make_output("cpu")
+        out_arg = pool.acquire(out._memref_value)
+
+        pending = queue.enqueue(FakeSession(), [], [out_arg], [out])
+        # The copy is enqueued on the stream along with the execution.
+        assert pool.runtime_client.host_copies == [(out_arg, out._memref_value)]
+        assert pool.num_bytes_copied_to_host == 16
+        assert queue.stream.num_syncs == 0
+
+        pending.wait()
+        assert pending.done
+
+    def test_reused_output_stays_pending_on_later_execution(self, queue):
+        session = FakeSession()
+        out = make_output("gpu")
+
+        queue.enqueue(session, [], [make_memref()], [out])
+        later = queue.enqueue(session, [], [make_memref()], [out])
+        assert out._pending_execution is later
+
+        later.wait()
+        assert out._pending_execution is None
+
+
+class TestStagingBufferPool:
+    def test_staging_buffers_reused_after_completion(self, queue):
+        pool = queue.staging_buffer_pool
+
+        def run():
+            out = make_output("cpu")
+            return queue.enqueue(FakeSession(), [], [pool.acquire(out._memref_value)], [out])
+
+        pending = run()
+        # The buffer is still in use by the first execution, so a new one must be allocated.
+        run()
+        assert (pool.num_allocations, pool.num_reuses) == (2, 0)
+
+        pending.wait()
+        run()
+        assert (pool.num_allocations, pool.num_reuses) == (2, 1)
+
+    def test_buffers_keyed_by_shape(self, queue):
+        pool = queue.staging_buffer_pool
+        out = make_output("cpu")
+        queue.enqueue(FakeSession(), [], [pool.acquire(out._memref_value)], [out]).wait()
+
+        pool.acquire(make_memref((3, 2)))
+        assert (pool.num_allocations, pool.num_reuses) == (2, 0)
+
+    def test_bytes_copied_to_device_counted(self, queue):
+        pool = queue.staging_buffer_pool
+        pool.copy_to_device(make_memref((4,)))
+        assert pool.num_bytes_copied_to_device == 16
+
+    def test_host_io_through_executor(self):
+        executable = compile_add((2, 2))
+        pool = executable._executor.staging_buffer_pool
+
+        inp = tp.copy(tp.ones((2, 2), dtype=tp.float32), device=tp.device("cpu"))
+        out = tp.copy(tp.zeros((2, 2), dtype=tp.float32), device=tp.device("cpu"))
+        inp.eval()
+        out.eval()
+        for _ in range(3):
+            executable(inp, inp, out=out)
+            assert np.array_equal(np.from_dlpack(out), np.full((2, 2), 2.0, dtype=np.float32))
+
+        assert (pool.num_allocations, pool.num_reuses) == (1, 2)
+        assert pool.num_bytes_copied_to_device == 3 * 2 * 16
+        assert pool.num_bytes_copied_to_host == 3 * 16
@@ -0,0 +1,171 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 1993-2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import os
+
+import cupy as cp
+import numpy as np
+import pytest
+
+import tripy as tp
+from tests import helper
+
+
+def add(a, b):
+    return a + b
+
+
+def sum_rows(a):
+    return tp.sum(a, dim=1)
+
+
+@pytest.fixture(scope="module")
+def bucketed_add():
+    return tp.BucketedExecutable.compile(
+        tp.Compiler(add),
+        inputs={"a": (("batch", "seq"), tp.float32), "b": (("batch", "seq"), tp.float32)},
+        buckets={"batch": [1, 2], "seq": [4, 8]},
+        output_dims=[("batch", "seq")],
+    )
+
+
+class TestBucketedExecutable:
+    @pytest.mark.parametrize("shape", [(1, 1), (1, 4), (2, 3), (2, 8)])
+    def test_outputs_sliced(self, shape, bucketed_add):
+        a = np.arange(np.prod(shape), dtype=np.float32).reshape(shape)
+        out = bucketed_add(tp.Tensor(a), tp.Tensor(a))
+
+        assert cp.array_equal(cp.from_dlpack(out), cp.array(a * 2))
+
+    def test_calls_do_not_compile(self, bucketed_add, monkeypatch):
+        from tripy.backend.mlir.compiler import Compiler
+
+        a = tp.Tensor(np.ones((2, 3), dtype=np.float32))
+
+        # Padding and slicing are part of each bucket's executable, so calls should not need to compile anything.
+        def fail_compile(self, *args, **kwargs):
+            assert False, "Calling a bucketed executable should not compile anything"
+
+        monkeypatch.setattr(Compiler, "compile", fail_compile)
+        assert cp.array_equal(cp.from_dlpack(bucketed_add(a, a)), cp.full((2, 3), 2.0, dtype=cp.float32))
+
+    def test_bucket_hit_counts(self):
+        bucketed = tp.BucketedExecutable.compile(
+            tp.Compiler(add),
+            inputs={"a": (("seq",), tp.float32), "b": (("seq",), tp.float32)},
+            buckets={"seq": [4, 2]},
+        )
+        for size in [1, 2, 3, 4]:
+            a = tp.ones((size,), dtype=tp.float32)
+            bucketed(a, b=a)
+
+        assert bucketed.bucket_hit_counts == {(("seq", 2),): 2, (("seq", 4),): 2}
+
+    def test_outputs_not_sliced_without_output_dims(self):
+        bucketed = tp.BucketedExecutable.compile(
+            tp.Compiler(add),
+            inputs={"a": (("seq",), tp.float32), "b": (("seq",), tp.float32)},
+            buckets={"seq": [4]},
+            pad_value=1,
+        )
+        a = tp.zeros((2,), dtype=tp.float32)
+
+        assert cp.array_equal(cp.from_dlpack(bucketed(a, a)), cp.array([0.0, 0.0, 2.0, 2.0], dtype=cp.float32))
+
+    def test_unnamed_output_dims_not_sliced(self):
+        bucketed = tp.BucketedExecutable.compile(
+            tp.Compiler(sum_rows),
+            inputs={"a": ((2, "seq"), tp.float32)},
+            buckets={"seq": [4]},
+            output_dims=[(None,)],
+        )
+        out = bucketed(tp.ones((2, 3), dtype=tp.float32))
+
+        assert cp.array_equal(cp.from_dlpack(out), cp.array([3.0, 3.0], dtype=cp.float32))
+
+    def test_does_not_fit_into_any_bucket(self, bucketed_add):
+        a = tp.ones((2, 9), dtype=tp.float32)
+        with helper.raises(tp.TripyException, "Dimension: seq does not fit into any bucket."):
+            bucketed_add(a, a)
+
+    def test_inconsistent_dimension_sizes(self, bucketed_add):
+        with helper.raises(tp.TripyException, "Inconsistent sizes for dimension: seq."):
+            bucketed_add(tp.ones((2, 3), dtype=tp.float32), tp.ones((2, 4), dtype=tp.float32))
+
+    def test_incorrect_static_dimension(self):
+        bucketed = tp.BucketedExecutable.compile(
+            tp.Compiler(sum_rows),
+            inputs={"a": ((2, "seq"), tp.float32)},
+            buckets={"seq": [4]},
+        )
+        with helper.raises(tp.TripyException, "Incorrect input shape."):
+            bucketed(tp.ones((3, 3), dtype=tp.float32))
+
+    def test_missing_argument(self, bucketed_add):
+        with helper.raises(tp.TripyException, "Incorrect arguments."):
+            bucketed_add(tp.ones((2, 3), dtype=tp.float32))
+
+    @pytest.mark.parametrize(
+        "inputs, buckets, expected_error",
+        [
+            ({"a": (("seq",), tp.float32)}, {"batch": [1]}, "The dimensions used in input shapes must match"),
+            ({"a": (("seq",), tp.float32)}, {"seq": []}, "Bucket sizes must be positive integers."),
+            ({"a": (("seq",), tp.float32)}, {"seq": [0, 2]}, "Bucket sizes must be positive integers."),
+        ],
+    )
+    def test_invalid_buckets(self, inputs, buckets, expected_error):
+        with helper.raises(tp.TripyException, expected_error):
+            tp.BucketedExecutable.compile(tp.Compiler(tp.relu), inputs=inputs, buckets=buckets)
+
+    def test_file_io(self, bucketed_add, tmp_path):
+        path = os.path.join(tmp_path, "executable.tpbkt")
+        bucketed_add.save(path)
+        loaded = tp.BucketedExecutable.load(path)
+
+        a = tp.ones((2, 5), dtype=tp.float32)
+        assert cp.array_equal(cp.from_dlpack(loaded(a, a)), cp.from_dlpack(bucketed_add(a, a)))
+        assert set(loaded.bucket_hit_counts.keys()) == set(bucketed_add.bucket_hit_counts.keys())
+
+    def test_file_io_preserves_executables(self, bucketed_add, tmp_path):
+        path = os.path.join(tmp_path, "executable.tpbkt")
+        bucketed_add.save(path)
+        loaded = tp.BucketedExecutable.load(path)
+
+        assert loaded._executables.keys() == bucketed_add._executables.keys()
+        for bucket, executable in bucketed_add._executables.items():
+            assert [exe.serialize() for exe in loaded._executables[bucket]._executables] == [
+                exe.serialize() for exe in executable._executables
+            ]
+
+    def test_load_not_bucketed_executable_fails(self, tmp_path):
+        path = os.path.join(tmp_path, "executable.tpexe")
+        tp.Compiler(add).compile(tp.InputInfo((2,), tp.float32), tp.InputInfo((2,), tp.float32)).save(path)
+
+        with helper.raises(tp.TripyException, "is not a bucketed executable"):
+            tp.BucketedExecutable.load(path)
+
+    def test_compile_in_parallel(self):
+        bucketed = tp.BucketedExecutable.compile(
+            tp.Compiler(add),
+            inputs={"a": (("seq",), tp.float32), "b": (("seq",), tp.float32)},
+            buckets={"seq": [2, 4]},
+            output_dims=[("seq",)],
+            num_workers=2,
+        )
+        a = tp.ones((3,), dtype=tp.float32)
+
+        assert cp.array_equal(cp.from_dlpack(bucketed(a, a)), cp.full((3,), 2.0, dtype=cp.float32))
@@ -0,0 +1,190 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 1993-2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import os
+
+import cupy as cp
+import pytest
+
+import tripy as tp
+import tripy.backend.cache as cache_module
+from tripy.backend.cache import (
+    EXECUTABLE_FILE_EXTENSION,
+    ExecutableCache,
+    compute_cache_key,
+    get_environment_fingerprint,
+    get_executable_cache,
+    is_cacheable,
+)
+from tripy.backend.mlir.compiler import Compiler
+from tripy.frontend.trace import Trace
+
+
+def make_flat_ir(values, name_prefix=""):
+    a = tp.Tensor(values, name=f"{name_prefix}a")
+    b = tp.Tensor([2.0, 2.0], name=f"{name_prefix}b")
+    out = a * b
+    return Trace([out]).to_flat_ir()
+
+
+def compile_flat_ir(flat_ir):
+    return Compiler(trt_builder_opt_level=0).compile(flat_ir.to_mlir(), flat_ir=flat_ir)
+
+
+@pytest.fixture
+def compile_counter(monkeypatch):
+    counter = {"count": 0}
+    original_compile = Compiler.compile
+
+    def counting_compile(self, *args, **kwargs):
+        counter["count"] += 1
+        return original_compile(self, *args, **kwargs)
+
+    monkeypatch.setattr(Compiler, "compile", counting_compile)
+    return counter
+
+
+class TestComputeCacheKey:
+    def test_key_independent_of_names(self):
+        assert compute_cache_key(make_flat_ir([1.0, 2.0], "x"), 0) == compute_cache_key(
+            make_flat_ir([1.0, 2.0], "y"), 0
+        )
+
+    def test_key_depends_on_constants(self):
+        assert compute_cache_key(make_flat_ir([1.0, 2.0]), 0) != compute_cache_key(make_flat_ir([1.0, 3.0]), 0)
+
+    def test_key_depends_on_opt_level(self):
+        flat_ir = make_flat_ir([1.0, 2.0])
+        assert compute_cache_key(flat_ir, 0) != compute_cache_key(flat_ir, 3)
+
+    def test_key_depends_on_structure(self):
+        a = tp.Tensor([1.0, 2.0])
+        b = tp.Tensor([2.0, 2.0])
+
+        assert compute_cache_key(Trace([a * b]).to_flat_ir(), 0) != compute_cache_key(Trace([a + b]).to_flat_ir(), 0)
+
+    def test_only_small_constants_cacheable(self, monkeypatch):
+        flat_ir = make_flat_ir([1.0, 2.0])
+        monkeypatch.setattr(tp.config, "executable_cache_max_constant_size", 1 << 20)
+        assert is_cacheable(flat_ir)
+
+        monkeypatch.setattr(tp.config, "executable_cache_max_constant_size", 0)
+        assert not is_cacheable(flat_ir)
+
+    def test_key_depends_on_environment(self, monkeypatch):
+        flat_ir = make_flat_ir([1.0, 2.0])
+        key = compute_cache_key(flat_ir, 0)
+
+        # Executables built with a different runtime or for a different GPU must not be reused.
+        monkeypatch.setattr(cache_module, "get_environment_fingerprint", lambda: ("other",))
+        assert compute_cache_key(flat_ir, 0) != key
+
+    def test_environment_fingerprint_includes_versions_and_device(self):
+        tripy_version, compiler_version, runtime_version, device = get_environment_fingerprint()
+
+        assert tripy_version == tp.__version__
+        assert compiler_version != "unknown"
+        assert runtime_version != "unknown"
+        # Name, compute capability major/minor, and driver version.
+        assert len(device) == 4
+
+
+class TestExecutableCache:
+    def test_lru_eviction_in_memory(self):
+        cache = ExecutableCache(max_entries=2)
+        executable = compile_flat_ir(make_flat_ir([1.0, 2.0]))
+
+        cache.put("a", executable)
+        cache.put("b", executable)
+        # Access "a" so that "b" becomes the least recently used entry.
+        assert cache.get("a") is executable
+        cache.put("c", executable)
+
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") is executable
+        assert cache.get("c") is executable
+
+    def test_persisted_to_disk(self, tmp_path):
+        cache = ExecutableCache(max_entries=4, cache_dir=str(tmp_path), max_disk_size=1 << 30)
+        cache.put("a", compile_flat_ir(make_flat_ir([1.0, 2.0])))
+        assert os.path.exists(os.path.join(tmp_path, "a" + EXECUTABLE_FILE_EXTENSION))
+
+        # A new cache pointing to the same directory should be able to load the executable.
+        new_cache = ExecutableCache(max_entries=4, cache_dir=str(tmp_path), max_disk_size=1 << 30)
+        assert "a" in new_cache
+        assert new_cache.get("a") is not None
+
+    @pytest.mark.skipif("TRIPY_EXECUTABLE_CACHE_DIR" in os.environ, reason="Cache directory is set explicitly")
+    def test_disk_cache_disabled_by_default(self):
+        # Executables embed user data, so they should only be written to disk if requested.
+        assert not tp.config.executable_cache_dir
+
+    def test_cache_dir_only_accessible_by_user(self, tmp_path):
+        cache_dir = os.path.join(tmp_path, "cache")
+        cache = ExecutableCache(max_entries=4, cache_dir=cache_dir, max_disk_size=1 << 30)
+        cache.put("a", compile_flat_ir(make_flat_ir([1.0, 2.0])))
+
+        assert os.stat(cache_dir).st_mode & 0o077 == 0
+
+    def test_disk_size_cap(self, tmp_path):
+        cache = ExecutableCache(max_entries=4, cache_dir=str(tmp_path), max_disk_size=0)
+        cache.put("a", compile_flat_ir(make_flat_ir([1.0, 2.0])))
+
+        assert not os.listdir(tmp_path)
+        # The executable should still be available from memory.
+        assert cache.get("a") is not None
+
+
+class TestEvalCaching:
+    @pytest.fixture(autouse=True)
+    def isolated_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(tp.config, "enable_executable_cache", True)
+        monkeypatch.setattr(tp.config, "executable_cache_dir", str(tmp_path))
+        get_executable_cache().clear()
+
+    def test_identical_graphs_compiled_once(self, compile_counter):
+        outs = [tp.Tensor([1.0, 2.0]) * tp.Tensor([2.0, 2.0]) for _ in range(3)]
+        for out in outs:
+            assert cp.array_equal(cp.from_dlpack(out), cp.array([2.0, 4.0], dtype=cp.float32))
+
+        assert compile_counter["count"] == 1
+
+    def test_different_constants_recompiled(self, compile_counter):
+        out0 = tp.Tensor([1.0, 2.0]) * tp.Tensor([2.0, 2.0])
+        out1 = tp.Tensor([1.0, 2.0]) * tp.Tensor([3.0, 3.0])
+
+        assert cp.array_equal(cp.from_dlpack(out0), cp.array([2.0, 4.0], dtype=cp.float32))
+        assert cp.array_equal(cp.from_dlpack(out1), cp.array([3.0, 6.0], dtype=cp.float32))
+        assert compile_counter["count"] == 2
+
+    def test_cache_disabled(self, compile_counter, monkeypatch):
+        monkeypatch.setattr(tp.config, "enable_executable_cache", False)
+
+        for _ in range(2):
+            (tp.Tensor([1.0, 2.0]) * tp.Tensor([2.0, 2.0])).eval()
+
+        assert compile_counter["count"] == 2
+
+    def test_graphs_with_large_constants_not_cached(self, compile_counter, monkeypatch):
+        monkeypatch.setattr(tp.config, "executable_cache_max_constant_size", 0)
+
+        for _ in range(2):
+            (tp.Tensor([1.0, 2.0]) * tp.Tensor([2.0, 2.0])).eval()
+
+        assert compile_counter["count"] == 2
+        assert len(get_executable_cache()) == 0
@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import asyncio
 import inspect
 import os
 import tempfile
@@ -24,6 +25,8 @@ import pytest
 
 import tripy as tp
 from tests import helper
+from tripy.backend.compiler_api import _EXECUTABLE_DATA_ALIGNMENT, _EXECUTABLE_MAGIC, _EXECUTABLE_PREFIX
+from tripy.utils import json as json_utils
 
 
 def add(a, b):
@@ -91,6 +94,19 @@ class TestInput:
         with helper.raises(tp.TripyException, expected_error):
             tp.InputInfo(shape=shape, dtype=tp.float32)
 
+    def test_extra_profiles(self):
+        inp = tp.InputInfo(((1, 2, 3), 4), dtype=tp.float32, extra_profiles=[((4, 8, 16), 4)])
+
+        assert len(inp.profiles) == 2
+        assert inp.shape_bounds is inp.profiles[0]
+        assert inp.profiles[1].min == (4, 4)
+        assert inp.profiles[1].opt == (8, 4)
+        assert inp.profiles[1].max == (16, 4)
+
+    def test_extra_profiles_with_different_rank_rejected(self):
+        with helper.raises(tp.TripyException, "All optimization profiles of an input must have the same rank."):
+            tp.InputInfo(((1, 2, 3), 4), dtype=tp.float32, extra_profiles=[((4, 8, 16),)])
+
 
 @pytest.fixture(scope="session")
 def single_return_executable():
@@ -175,6 +191,124 @@ class TestExecutable:
             out2 = loaded_executable(inp, inp)
             assert cp.array_equal(cp.from_dlpack(out1), cp.from_dlpack(out2))
 
+    def test_preallocated_output(self, single_return_executable):
+        inp = tp.iota((2, 2), dtype=tp.float32)
+        out = tp.zeros((2, 2), dtype=tp.float32)
+
+        ret = single_return_executable(inp, inp, out=out)
+
+        assert ret is out
+        assert cp.array_equal(cp.from_dlpack(out), cp.from_dlpack(inp) * 2)
+
+    def test_preallocated_outputs_multiple_return(self, multiple_return_executable):
+        inp = tp.iota((2, 2), dtype=tp.float32)
+        outs = [tp.zeros((2, 2), dtype=tp.float32), tp.zeros((2, 2), dtype=tp.float32)]
+
+        rets = multiple_return_executable(inp, inp, out=outs)
+
+        assert all(ret is out for ret, out in zip(rets, outs))
+        expected = multiple_return_executable(inp, inp)
+        for out, exp in zip(outs, expected):
+            assert cp.array_equal(cp.from_dlpack(out), cp.from_dlpack(exp))
+
+    def test_call_async(self, single_return_executable):
+        inp = tp.iota((2, 2), dtype=tp.float32)
+
+        future = single_return_executable.call_async(inp, inp)
+        out = future.result()
+
+        assert future.done()
+        assert future.result() is out
+        assert cp.array_equal(cp.from_dlpack(out), cp.from_dlpack(inp) * 2)
+
+    def test_call_async_multiple_return(self, multiple_return_executable):
+        inp = tp.iota((2, 2), dtype=tp.float32)
+
+        outs = multiple_return_executable.call_async(inp, inp).result()
+        expected = multiple_return_executable(inp, inp)
+
+        assert len(outs) == len(expected)
+        for out, exp in zip(outs, expected):
+            assert cp.array_equal(cp.from_dlpack(out), cp.from_dlpack(exp))
+
+    def test_call_async_await(self, single_return_executable):
+        inp = tp.iota((2, 2), dtype=tp.float32)
+
+        async def run():
+            futures = [single_return_executable.call_async(inp, inp) for _ in range(3)]
+            return [await future for future in futures]
+
+        for out in asyncio.run(run()):
+            assert cp.array_equal(cp.from_dlpack(out), cp.from_dlpack(inp) * 2)
+
+    def test_call_async_preallocated_output(self, single_return_executable):
+        inp = tp.iota((2, 2), dtype=tp.float32)
+        out = tp.zeros((2, 2), dtype=tp.float32)
+
+        future = single_return_executable.call_async(inp, inp, out=out)
+        # Accessing the output memory should wait for the execution even without calling `result()`.
+        assert cp.array_equal(cp.from_dlpack(out), cp.from_dlpack(inp) * 2)
+        assert future.done()
+        assert future.result() is out
+
+    def test_incompatible_preallocated_output(self, single_return_executable):
+        inp = tp.iota((2, 2), dtype=tp.float32)
+
+        with helper.raises(
+            tp.TripyException, match="Output tensor is not compatible with the output of the executable."
+        ):
+            single_return_executable(inp, inp, out=tp.zeros((2, 3), dtype=tp.float32))
+
+    def test_saved_as_binary(self, single_return_executable, tmp_path):
+        exe_file = os.path.join(tmp_path, "executable.tpexe")
+        single_return_executable.save(exe_file)
+
+        with open(exe_file, "rb") as f:
+            contents = f.read()
+
+        _, _, _, data_offset, data_size = _EXECUTABLE_PREFIX.unpack_from(contents)
+        assert contents.startswith(_EXECUTABLE_MAGIC)
+        assert data_offset % _EXECUTABLE_DATA_ALIGNMENT == 0
+        assert contents[data_offset:] == single_return_executable._executable.serialize()
+        assert data_offset + data_size == len(contents)
+
+    def test_binary_round_trip(self, single_return_executable, tmp_path):
+        exe_file = os.path.join(tmp_path, "executable.tpexe")
+        single_return_executable.save(exe_file)
+
+        loaded_executable = tp.Executable.load(exe_file)
+        assert loaded_executable._executable.serialize() == single_return_executable._executable.serialize()
+        assert loaded_executable.get_input_info() == single_return_executable.get_input_info()
+
+        inp = tp.iota((2, 2), dtype=tp.float32)
+        assert cp.array_equal(
+            cp.from_dlpack(single_return_executable(inp, inp)), cp.from_dlpack(loaded_executable(inp, inp))
+        )
+
+    def test_load_json(self, single_return_executable, tmp_path):
+        exe_file = os.path.join(tmp_path, "executable.json")
+        json_utils.save(single_return_executable, exe_file)
+
+        loaded_executable = tp.Executable.load(exe_file)
+        assert loaded_executable.get_input_info() == single_return_executable.get_input_info()
+
+        inp = tp.iota((2, 2), dtype=tp.float32)
+        assert cp.array_equal(
+            cp.from_dlpack(single_return_executable(inp, inp)), cp.from_dlpack(loaded_executable(inp, inp))
+        )
+
+    def test_load_unsupported_format_version_fails(self, single_return_executable, tmp_path):
+        exe_file = os.path.join(tmp_path, "executable.tpexe")
+        single_return_executable.save(exe_file)
+
+        with open(exe_file, "r+b") as f:
+            magic, format_version, *rest = _EXECUTABLE_PREFIX.unpack_from(f.read(_EXECUTABLE_PREFIX.size))
+            f.seek(0)
+            f.write(_EXECUTABLE_PREFIX.pack(magic, format_version + 1, *rest))
+
+        with helper.raises(tp.TripyException, match="uses an unsupported format version"):
+            tp.Executable.load(exe_file)
+
 
 class TestCompile:
     # TODO (#246): Verify that it's actually compiling somehow here and below.
@@ -269,7 +403,6 @@ class TestCompile:
         with helper.raises(tp.TripyException):
             compiled_add(a, a)
 
-    # TODO (#244): Add multi-profile test
     def test_dynamic_shapes(self):
         compiler = tp.Compiler(add)
 
@@ -283,6 +416,47 @@ class TestCompile:
         out = compiled_add(tp.ones((3, 1), dtype=tp.float32), tp.ones((3, 1), dtype=tp.float32))
         assert cp.array_equal(cp.from_dlpack(out), cp.ones((3, 1), dtype=cp.float32) * 2)
 
+    @pytest.fixture(scope="class")
+    def multi_profile_add(self):
+        compiler = tp.Compiler(add)
+        # `b` only has a single profile, which is used for every profile.
+        return compiler.compile(
+            tp.InputInfo(((1, 2, 3), 1), dtype=tp.float32, extra_profiles=[((4, 6, 8), 1)]),
+            tp.InputInfo(((1, 4, 8), 1), dtype=tp.float32),
+        )
+
+    @pytest.mark.parametrize("num_rows", [1, 3, 4, 8])
+    def test_multiple_profiles(self, num_rows, multi_profile_add):
+        out = multi_profile_add(tp.ones((num_rows, 1), dtype=tp.float32), tp.ones((num_rows, 1), dtype=tp.float32))
+        assert cp.array_equal(cp.from_dlpack(out), cp.ones((num_rows, 1), dtype=cp.float32) * 2)
+
+    def test_multiple_profiles_input_info(self, multi_profile_add):
+        assert multi_profile_add.get_input_info()[0].shape_bounds == ((1, 8), (1, 1))
+
+    def test_multiple_profiles_unsupported_shape(self, multi_profile_add):
+        with helper.raises(tp.TripyException, "Input shapes are not supported by any optimization profile"):
+            multi_profile_add(tp.ones((9, 1), dtype=tp.float32), tp.ones((9, 1), dtype=tp.float32))
+
+    def test_multiple_profiles_file_io(self, multi_profile_add, tmp_path):
+        exe_file = os.path.join(tmp_path, "executable.tpexe")
+        multi_profile_add.save(exe_file)
+        loaded_executable = tp.Executable.load(exe_file)
+
+        assert loaded_executable.get_input_info() == multi_profile_add.get_input_info()
+        for num_rows in [2, 6]:
+            inp = tp.ones((num_rows, 1), dtype=tp.float32)
+            assert cp.array_equal(
+                cp.from_dlpack(loaded_executable(inp, inp)), cp.from_dlpack(multi_profile_add(inp, inp))
+            )
+
+    def test_inconsistent_number_of_profiles_rejected(self):
+        compiler = tp.Compiler(add)
+        with helper.raises(tp.TripyException, "Inconsistent number of optimization profiles."):
+            compiler.compile(
+                tp.InputInfo(((1, 2, 3), 1), dtype=tp.float32, extra_profiles=[((4, 6, 8), 1)]),
+                tp.InputInfo(((1, 2, 3), 1), dtype=tp.float32, extra_profiles=[((4, 6, 8), 1), ((9, 9, 9), 1)]),
+            )
+
 
 # TODO (#256): Remove these tests and replace with exhaustive integration testing
 class TestCompiledOps:
@@ -0,0 +1,128 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 1993-2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import json
+import os
+import textwrap
+
+import cupy as cp
+import pytest
+
+import tripy as tp
+from tests import helper
+from tripy.backend.parallel_compile import main
+
+
+def add(a, b):
+    return a + b
+
+
+def returns_nothing(a):
+    return
+
+
+def make_add_job(name, size):
+    return tp.CompileJob(
+        name, tp.Compiler(add), args=[tp.InputInfo((size,), dtype=tp.float32), tp.InputInfo((size,), dtype=tp.float32)]
+    )
+
+
+class TestCompileMany:
+    @pytest.mark.parametrize("num_workers", [1, 2])
+    def test_compile_many(self, num_workers):
+        results = tp.compile_many([make_add_job("add_2", 2), make_add_job("add_3", 3)], num_workers=num_workers)
+
+        assert [result.name for result in results] == ["add_2", "add_3"]
+        for result, size in zip(results, [2, 3]):
+            assert result.succeeded
+            assert result.lower_time > 0 and result.build_time > 0
+
+            a = tp.ones((size,), dtype=tp.float32)
+            assert cp.array_equal(cp.from_dlpack(result.executable(a, a)), cp.full((size,), 2.0, dtype=cp.float32))
+
+    def test_kwargs(self):
+        job = tp.CompileJob(
+            "add", tp.Compiler(add), kwargs={"a": tp.InputInfo((2,), dtype=tp.float32), "b": tp.ones((2,))}
+        )
+        (result,) = tp.compile_many([job], num_workers=1)
+
+        a = tp.ones((2,), dtype=tp.float32)
+        assert cp.array_equal(cp.from_dlpack(result.executable(a)), cp.full((2,), 2.0, dtype=cp.float32))
+
+    def test_failures_reported(self):
+        failing_job = tp.CompileJob("fails", tp.Compiler(returns_nothing), args=[tp.InputInfo((2,), dtype=tp.float32)])
+        results = tp.compile_many([failing_job, make_add_job("add", 2)], num_workers=1)
+
+        assert not results[0].succeeded
+        assert results[0].executable is None
+        assert "Function must return 1 or more Tensors" in results[0].error
+        # Other jobs should not be affected.
+        assert results[1].succeeded
+
+    def test_duplicate_names_rejected(self):
+        with helper.raises(tp.TripyException, match="Job names must be unique."):
+            tp.compile_many([make_add_job("add", 2), make_add_job("add", 3)], num_workers=1)
+
+
+class TestCLI:
+    @pytest.fixture
+    def script(self, tmp_path):
+        path = os.path.join(tmp_path, "jobs.py")
+        with open(path, "w") as f:
+            f.write(
+                textwrap.dedent(
+                    """
+                    import tripy as tp
+
+                    def add(a, b):
+                        return a + b
+
+                    def returns_nothing(a):
+                        return
+
+                    jobs = [
+                        tp.CompileJob("add", tp.Compiler(add), args=[tp.InputInfo((2,), dtype=tp.float32)] * 2),
+                        tp.CompileJob("fails", tp.Compiler(returns_nothing), args=[tp.InputInfo((2,), dtype=tp.float32)]),
+                    ]
+                    """
+                )
+            )
+        return path
+
+    def test_saves_executables_and_report(self, script, tmp_path):
+        output_dir = os.path.join(tmp_path, "out")
+        report_path = os.path.join(tmp_path, "report.json")
+
+        assert main([script, "-o", output_dir, "-j", "1", "--report", report_path]) == 1
+
+        assert os.listdir(output_dir) == ["add.tpexe"]
+        executable = tp.Executable.load(os.path.join(output_dir, "add.tpexe"))
+        a = tp.ones((2,), dtype=tp.float32)
+        assert cp.array_equal(cp.from_dlpack(executable(a, a)), cp.full((2,), 2.0, dtype=cp.float32))
+
+        with open(report_path) as f:
+            report = json.load(f)
+        assert [(entry["name"], entry["succeeded"]) for entry in report] == [("add", True), ("fails", False)]
+        assert report[1]["error"]
+
+    def test_script_without_jobs_rejected(self, tmp_path):
+        script = os.path.join(tmp_path, "empty.py")
+        with open(script, "w") as f:
+            f.write("")
+
+        with helper.raises(tp.TripyException, match="Script does not define any jobs."):
+            main([script, "-o", os.path.join(tmp_path, "out")])
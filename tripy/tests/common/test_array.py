@@ -176,3 +176,20 @@ class TestArray:
     def test_array_unsupported_python_sequence_type(self, dtype):
         with pytest.raises(AssertionError):
             arr = Array([0], shape=None, dtype=dtype, device=tp.device("cpu"))
+
+    @pytest.mark.parametrize("dtype", [tp.float32, tp.int32, tp.int64, tp.bool])
+    def test_data_round_trip(self, dtype):
+        data = [[[1, 0, 1], [0, 1, 1]], [[1, 1, 0], [0, 0, 1]]]
+        arr = Array(data, None, dtype, tp.device("cpu"))
+        assert arr.data() == data
+
+    def test_nested_tuples(self):
+        arr = Array(((1, 2), (3, 4)), None, tp.int32, tp.device("cpu"))
+        assert arr.shape == (2, 2)
+        assert arr.data() == [[1, 2], [3, 4]]
+
+    @pytest.mark.parametrize("np_dtype", [np.float16, np.int8])
+    def test_data_non_list_dtypes(self, np_dtype):
+        np_array = np.arange(6).reshape(2, 3).astype(np_dtype)
+        arr = Array(np_array, None, None, tp.device("cpu"))
+        assert arr.data() == np_array.tolist()
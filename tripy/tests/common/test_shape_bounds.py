@@ -0,0 +1,66 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 1993-2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import pytest
+
+from tripy.common.shape_bounds import ShapeBounds, select_profile
+from tripy.utils import json as json_utils
+
+SHORT = [ShapeBounds((1, 1), (1, 64), (1, 128))]
+LONG = [ShapeBounds((1, 129), (1, 1024), (1, 4096))]
+WIDE = [ShapeBounds((1, 1), (1, 2048), (1, 4096))]
+
+
+class TestShapeBounds:
+    @pytest.mark.parametrize(
+        "shape, expected",
+        [
+            ((1, 1), True),
+            ((1, 128), True),
+            ((1, 129), False),
+            ((2, 64), False),
+            ((1,), False),
+        ],
+    )
+    def test_contains(self, shape, expected):
+        assert SHORT[0].contains(shape) == expected
+
+    def test_json_round_trip(self):
+        assert json_utils.from_json(json_utils.to_json(SHORT)) == SHORT
+
+
+class TestSelectProfile:
+    @pytest.mark.parametrize(
+        "profiles, shapes, expected",
+        [
+            ([SHORT, LONG], [(1, 10)], 0),
+            ([SHORT, LONG], [(1, 2000)], 1),
+            # The profile whose optimum shape is closest should be preferred.
+            ([WIDE, SHORT], [(1, 100)], 1),
+            ([WIDE, SHORT], [(1, 2000)], 0),
+            # Ties are broken in favor of the earlier profile.
+            ([SHORT, SHORT], [(1, 64)], 0),
+            # All inputs need to be within the bounds of the profile.
+            ([SHORT + LONG, LONG + LONG], [(1, 10), (1, 1024)], 0),
+            ([SHORT + LONG, LONG + LONG], [(1, 1024), (1, 1024)], 1),
+        ],
+    )
+    def test_select(self, profiles, shapes, expected):
+        assert select_profile(profiles, shapes) == expected
+
+    def test_no_matching_profile(self):
+        assert select_profile([SHORT, LONG], [(2, 10)]) is None
@@ -17,6 +17,7 @@
 
 import pytest
 import struct
+import sys
 from collections import ChainMap
 from textwrap import dedent
 
@@ -30,7 +31,9 @@ import tripy.common.datatype
 from tests import helper
 from tripy.common.datatype import DATA_TYPES
 from tripy.common.exception import TripyException
+from tripy.utils import volume
 from tripy.common.utils import (
+    convert_buffer_to_list,
     convert_frontend_dtype_to_tripy_dtype,
     convert_list_to_array,
     Float16MemoryView,
@@ -182,3 +185,31 @@ def test_float16_memoryview():
     buffer = struct.pack("e", negative_value)
     mv = Float16MemoryView(buffer)
     assert mv[0] == pytest.approx(negative_value)
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+@pytest.mark.parametrize(
+    "torch_dtype, dtype",
+    [
+        (torch.bool, tripy.common.datatype.bool),
+        (torch.int8, tripy.common.datatype.int8),
+        (torch.int32, tripy.common.datatype.int32),
+        (torch.int64, tripy.common.datatype.int64),
+        (torch.float16, tripy.common.datatype.float16),
+        (torch.bfloat16, tripy.common.datatype.bfloat16),
+        pytest.param(helper.TORCH_FLOAT8, tripy.common.datatype.float8, marks=helper.requires_torch_float8),
+        (torch.float32, tripy.common.datatype.float32),
+    ],
+)
+@pytest.mark.parametrize("shape", [(), (0,), (2, 0, 3), (5,), (2, 3, 4)])
+def test_convert_buffer_to_list(torch_dtype, dtype, shape, use_numpy, monkeypatch):
+    values = torch.arange(-12, 12, dtype=torch.float32)[: volume(shape)].reshape(shape) / 4
+    tensor = values.to(torch_dtype)
+    buffer = tensor.reshape(-1).view(torch.uint8).numpy().tobytes()
+    expected = tensor.to(torch.float32).tolist() if tensor.is_floating_point() else tensor.tolist()
+
+    if not use_numpy:
+        # Setting a module to None in sys.modules makes importing it raise an ImportError.
+        monkeypatch.setitem(sys.modules, "numpy", None)
+
+    assert convert_buffer_to_list(buffer, dtype, shape) == expected
@@ -15,9 +15,15 @@
 # limitations under the License.
 #
 
+import cupy as cp
+import numpy as np
+import pytest
+from mlir_tensorrt.compiler import ir
+
 import tripy as tp
 from tripy.frontend.trace import Trace
 from tripy.flat_ir.ops import ConstantOp
+from tripy.flat_ir.ops.constant import _bool_to_int32
 
 
 class TestConstantOp:
@@ -56,3 +62,45 @@ class TestConstantOp:
         conversion = "%0 = stablehlo.convert %c : (tensor<2xi32>) -> tensor<2xi1>"
         assert int_constant in mlir_text
         assert conversion in mlir_text
+
+    def test_prepare(self):
+        out = tp.Tensor([True, False], dtype=tp.bool, name="out")
+
+        flat_ir = Trace([out]).to_flat_ir()
+        const = flat_ir.ops[0]
+        assert isinstance(const, ConstantOp)
+
+        const.prepare()
+        assert const._host_buffer.tolist() == [1, 0]
+
+        flat_ir.to_mlir()
+        # The prepared buffer should be released once it has been embedded into MLIR.
+        assert const._host_buffer is None
+
+    def test_bool_to_int32(self):
+        values = np.array([True, False, False, True, True], dtype=np.bool_)
+        assert _bool_to_int32(values).tolist() == [1, 0, 0, 1, 1]
+
+    @pytest.mark.parametrize("dtype", [tp.float32, tp.bool])
+    def test_mlir_zero_copy(self, dtype, monkeypatch):
+        monkeypatch.setattr(tp.config, "zero_copy_constant_threshold", 0)
+
+        out = tp.Tensor([1, 0, 1], dtype=dtype, name="out")
+
+        trace = Trace([out])
+        flat_ir = trace.to_flat_ir()
+        mlir_text = str(flat_ir.to_mlir())
+
+        if hasattr(getattr(ir, "DenseResourceElementsAttr", None), "get_from_buffer"):
+            assert "dense_resource<out" in mlir_text
+            assert "dense<" not in mlir_text
+        else:
+            # Without resource blobs in the MLIR bindings, constants fall back to dense attributes.
+            assert "dense_resource" not in mlir_text
+            assert "dense<" in mlir_text
+
+    def test_zero_copy_results_match(self, monkeypatch):
+        monkeypatch.setattr(tp.config, "zero_copy_constant_threshold", 0)
+
+        out = tp.Tensor(np.arange(16, dtype=np.float32)) + tp.cast(tp.Tensor([True, False] * 8), tp.float32)
+        assert np.array_equal(cp.from_dlpack(out).get(), np.arange(16, dtype=np.float32) + np.array([1, 0] * 8))
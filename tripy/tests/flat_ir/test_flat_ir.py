@@ -16,6 +16,7 @@
 #
 
 import tripy as tp
+from tripy.flat_ir.ops import ConstantOp
 from tripy.frontend.trace import Trace
 
 
@@ -39,3 +40,119 @@ class TestFlatIR:
         # Check that `out` is connected to `b`
         assert flat_ir.ops[2].inputs[0].producer is flat_ir.ops[1]
         assert flat_ir.ops[2].inputs[0] is flat_ir.ops[1].outputs[0]
+
+    def test_fingerprint_independent_of_names(self):
+        def make_flat_ir():
+            return Trace([tp.tanh(tp.Tensor([1.0, 2.0]) + tp.Tensor([3.0, 4.0]))]).to_flat_ir()
+
+        assert make_flat_ir().fingerprint() == make_flat_ir().fingerprint()
+
+    def test_fingerprint_depends_on_shapes(self):
+        a = Trace([tp.ones((2, 3)) + tp.ones((2, 3))]).to_flat_ir()
+        b = Trace([tp.ones((3, 2)) + tp.ones((3, 2))]).to_flat_ir()
+
+        assert a.fingerprint() != b.fingerprint()
+
+    def test_canonicalize(self):
+        flat_ir = Trace([tp.tanh(tp.Tensor([1.0, 2.0]))]).to_flat_ir()
+        fingerprint = flat_ir.fingerprint()
+        flat_ir.canonicalize()
+
+        assert set(flat_ir.tensor_map.keys()) == {"%0", "%1"}
+        assert flat_ir.outputs[0].name == "%1"
+        assert flat_ir.ops[-1].trace_output_names == ["%1"]
+        assert flat_ir.fingerprint() == fingerprint
+
+    def test_to_mlir_independent_of_constant_prep_workers(self, monkeypatch):
+        def make_mlir_text(num_workers):
+            monkeypatch.setattr(tp.config, "constant_prep_workers", num_workers)
+            values = [tp.Tensor([float(index), 2.0], name=f"c{index}") for index in range(4)]
+            out = values[0]
+            for value in values[1:]:
+                out = out + value
+            return str(Trace([out]).to_flat_ir().to_mlir())
+
+        assert make_mlir_text(1) == make_mlir_text(4)
+
+    def test_eliminate_dead_ops(self):
+        a = tp.Tensor([1.0, 2.0], name="a")
+        b = tp.tanh(a)
+        b.name = "b"
+        c = tp.exp(tp.tanh(a))
+        c.name = "c"
+
+        flat_ir = Trace([b, c]).to_flat_ir()
+        # Dropping `c` from the outputs makes everything that only `c` depends on dead.
+        flat_ir.outputs = flat_ir.outputs[:1]
+        num_ops = len(flat_ir.ops)
+        assert flat_ir.eliminate_dead_ops() > 0
+        assert len(flat_ir.ops) < num_ops
+
+        output_names = {out.name for op in flat_ir.ops for out in op.outputs}
+        assert {"a", "b"} <= output_names
+        assert "c" not in output_names
+        assert "c" not in flat_ir.tensor_map
+        # Eliminating again should be a no-op.
+        assert flat_ir.eliminate_dead_ops() == 0
+
+    def test_eliminate_dead_ops_keeps_live_graph(self):
+        flat_ir = Trace([tp.tanh(tp.Tensor([1.0, 2.0]) + tp.Tensor([3.0, 4.0]))]).to_flat_ir()
+        num_ops = len(flat_ir.ops)
+
+        assert flat_ir.eliminate_dead_ops() == 0
+        assert len(flat_ir.ops) == num_ops
+
+    def test_deduplicate_constants(self):
+        a = tp.Tensor([1.0, 2.0], name="a")
+        b = tp.Tensor([1.0, 2.0], name="b")
+        c = tp.Tensor([1.0, 3.0], name="c")
+        d = tp.Tensor([1, 2], dtype=tp.int32, name="d")
+        out = tp.cast(d, tp.float32) + (c + (a + b))
+
+        flat_ir = Trace([out]).to_flat_ir()
+        # `b` is a duplicate of `a`, but there may also be duplicated shape constants.
+        assert flat_ir.deduplicate_constants() >= 8
+
+        constant_names = {op.outputs[0].name for op in flat_ir.ops if isinstance(op, ConstantOp)}
+        assert {"a", "c", "d"} <= constant_names
+        assert "b" not in constant_names
+        assert "b" not in flat_ir.tensor_map
+        assert all(inp.name != "b" for op in flat_ir.ops for inp in op.inputs)
+        # Deduplicating again should be a no-op.
+        assert flat_ir.deduplicate_constants() == 0
+
+    def test_deduplicate_constants_keeps_outputs(self):
+        a = tp.Tensor([1.0, 2.0], name="a")
+        b = tp.Tensor([1.0, 2.0], name="b")
+
+        flat_ir = Trace([a + b, b]).to_flat_ir()
+        flat_ir.deduplicate_constants()
+
+        constant_names = {op.outputs[0].name for op in flat_ir.ops if isinstance(op, ConstantOp)}
+        assert {"a", "b"} <= constant_names
+
+    def test_device_constants_copied_to_host_once(self, monkeypatch):
+        import tripy.flat_ir.ops.constant as constant_module
+
+        a = tp.Tensor(tp.ones((2,), dtype=tp.float32).eval(), name="a")
+        b = tp.Tensor(tp.ones((2,), dtype=tp.float32).eval(), name="b")
+
+        flat_ir = Trace([a + b]).to_flat_ir()
+        flat_ir.deduplicate_constants()
+
+        # Preparing the constants must reuse the host copies made while deduplicating them.
+        class NoCopyRuntimeClient:
+            def copy_to_host(self, *args, **kwargs):
+                assert False, "Constant data should only be copied to the host once"
+
+        monkeypatch.setattr(constant_module.runtime, "RuntimeClient", NoCopyRuntimeClient)
+        for op in flat_ir.ops:
+            if isinstance(op, ConstantOp) and op.outputs[0].name in {"a", "b"}:
+                op.prepare()
+
+    def test_deduplicated_constants_produce_same_result(self):
+        a = tp.Tensor([1.0, 2.0])
+        b = tp.Tensor([1.0, 2.0])
+
+        out = a * b
+        assert tp.allclose(out, tp.Tensor([1.0, 4.0]))
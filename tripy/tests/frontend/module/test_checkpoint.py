@@ -0,0 +1,156 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 1993-2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import mmap
+import os
+
+import pytest
+import torch
+
+import tripy as tp
+from tests import helper
+from tripy.common.array import Array
+from tripy.frontend.module.checkpoint import (
+    WEIGHTS_DATA_ALIGNMENT,
+    WEIGHTS_PREFIX,
+    read_checkpoint,
+    read_safetensors,
+    read_weights,
+    save_weights,
+)
+
+DTYPES = [
+    (torch.bool, tp.bool),
+    (torch.int8, tp.int8),
+    (torch.int32, tp.int32),
+    (torch.int64, tp.int64),
+    pytest.param(helper.TORCH_FLOAT8, tp.float8, marks=helper.requires_torch_float8),
+    (torch.float16, tp.float16),
+    (torch.bfloat16, tp.bfloat16),
+    (torch.float32, tp.float32),
+]
+
+
+def make_tensors(torch_dtype):
+    return {
+        "a": torch.arange(6, dtype=torch.float32).reshape(2, 3).to(torch_dtype),
+        "b": torch.ones((5,), dtype=torch.float32).to(torch_dtype),
+        "empty": torch.ones((0, 2), dtype=torch.float32).to(torch_dtype),
+        "scalar": torch.tensor(1.0).to(torch_dtype),
+    }
+
+
+def check_arrays(arrays, tensors, dtype):
+    assert list(arrays.keys()) == list(tensors.keys())
+    for name, tensor in tensors.items():
+        arr = arrays[name]
+        assert arr.dtype == dtype
+        assert arr.shape == tuple(tensor.shape)
+        assert arr.device.kind == "cpu"
+        expected = tensor.to(torch.float32).tolist() if tensor.is_floating_point() else tensor.tolist()
+        assert arr.data() == expected
+
+
+@pytest.mark.parametrize("torch_dtype, dtype", DTYPES)
+def test_read_safetensors(torch_dtype, dtype, tmp_path):
+    path = os.path.join(tmp_path, "model.safetensors")
+    tensors = make_tensors(torch_dtype)
+    helper.write_safetensors(path, tensors)
+
+    check_arrays(dict(read_safetensors(path)), tensors, dtype)
+
+
+def test_read_safetensors_does_not_copy(tmp_path):
+    path = os.path.join(tmp_path, "model.safetensors")
+    helper.write_safetensors(path, {"a": torch.ones((1024,))})
+
+    ((_, arr),) = read_safetensors(path)
+    # The array should be a view of the memory-mapped file.
+    assert isinstance(arr.data_ref, mmap.mmap)
+
+
+def test_read_safetensors_unsupported_dtype(tmp_path):
+    path = os.path.join(tmp_path, "model.safetensors")
+    helper.write_safetensors(path, {"a": torch.ones((2,))})
+    # Patch the header to use a data type that Tripy does not support.
+    with open(path, "r+b") as f:
+        contents = f.read().replace(b'"F32"', b'"U16"', 1)
+        f.seek(0)
+        f.write(contents)
+
+    with helper.raises(tp.TripyException, match="Unsupported data type: 'U16' for tensor: 'a'"):
+        list(read_safetensors(path))
+
+
+def test_read_sharded_checkpoint(tmp_path):
+    helper.write_safetensors(os.path.join(tmp_path, "shard0.safetensors"), {"a": torch.ones((2,))})
+    helper.write_safetensors(
+        os.path.join(tmp_path, "shard1.safetensors"), {"b": torch.zeros((2,)), "c": torch.zeros((3,))}
+    )
+    index_path = os.path.join(tmp_path, "model.safetensors.index.json")
+    with open(index_path, "w") as f:
+        f.write('{"weight_map": {"a": "shard0.safetensors", "b": "shard1.safetensors", "c": "shard1.safetensors"}}')
+
+    assert [name for name, _ in read_checkpoint(index_path)] == ["a", "b", "c"]
+
+
+class TestWeights:
+    @pytest.mark.parametrize("torch_dtype, dtype", DTYPES)
+    def test_round_trip(self, torch_dtype, dtype, tmp_path):
+        path = os.path.join(tmp_path, "weights.tpwts")
+        tensors = make_tensors(torch_dtype)
+        save_weights(path, {name: Array(tensor) for name, tensor in tensors.items()})
+
+        check_arrays(dict(read_weights(path)), tensors, dtype)
+
+    def test_device_arrays(self, tmp_path):
+        path = os.path.join(tmp_path, "weights.tpwts")
+        tensor = torch.arange(4, dtype=torch.float32, device="cuda")
+        save_weights(path, {"a": Array(tensor)})
+
+        ((_, arr),) = read_weights(path)
+        assert arr.device.kind == "cpu"
+        assert arr.data() == tensor.tolist()
+
+    def test_data_is_aligned_and_not_copied(self, tmp_path):
+        path = os.path.join(tmp_path, "weights.tpwts")
+        save_weights(path, {"a": Array(torch.ones((3,))), "b": Array(torch.ones((5,), dtype=torch.float16))})
+
+        _, _, _, data_offset = WEIGHTS_PREFIX.unpack_from(open(path, "rb").read(WEIGHTS_PREFIX.size))
+        assert data_offset % WEIGHTS_DATA_ALIGNMENT == 0
+
+        for _, arr in read_weights(path):
+            assert isinstance(arr.data_ref, mmap.mmap)
+
+    def test_not_a_weights_file(self, tmp_path):
+        path = os.path.join(tmp_path, "model.safetensors")
+        helper.write_safetensors(path, {"a": torch.ones((2,))})
+
+        with helper.raises(tp.TripyException, match="is not a Tripy weights file"):
+            list(read_weights(path))
+
+    def test_newer_format_version(self, tmp_path):
+        path = os.path.join(tmp_path, "weights.tpwts")
+        save_weights(path, {"a": Array(torch.ones((2,)))})
+
+        with open(path, "r+b") as f:
+            magic, _, header_size, data_offset = WEIGHTS_PREFIX.unpack(f.read(WEIGHTS_PREFIX.size))
+            f.seek(0)
+            f.write(WEIGHTS_PREFIX.pack(magic, 1000, header_size, data_offset))
+
+        with helper.raises(tp.TripyException, match="uses an unsupported format version"):
+            list(read_weights(path))
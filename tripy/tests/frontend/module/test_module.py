@@ -15,14 +15,25 @@
 # limitations under the License.
 #
 
+import json
+import mmap
+import os
+
 import cupy as cp
 import numpy as np
+import torch
 
 import tripy as tp
 from tests import helper
+from tripy.frontend.trace.ops import Storage
 from textwrap import dedent
 
 
+def to_numpy(tensor):
+    # Loaded parameters may be on either the host or the device.
+    return np.array(tensor.data().data())
+
+
 class TestModule:
     def test_basic(self, all_network_modes):
         test_net, call_args, inputs = all_network_modes
@@ -79,6 +90,82 @@ class TestModule:
         network.load_from_state_dict(state_dict)
         assert network.dummy1.nested.param is state_dict["dummy1.nested.param"]
 
+    def test_load_from_iterator(self, network):
+        def read_weights():
+            yield "param", np.zeros((2,), dtype=np.float32)
+            yield "dummy1.nested.param", tp.Parameter(tp.ones((2,), dtype=tp.float32))
+
+        network.load_from_iterator(read_weights())
+        assert np.array_equal(to_numpy(network.param), np.zeros((2,), dtype=np.float32))
+        assert np.array_equal(to_numpy(network.dummy1.nested.param), np.ones((2,), dtype=np.float32))
+
+    def test_load_from_iterator_applies_transform(self, network):
+        transformed = []
+
+        def transform(name, value):
+            transformed.append(name)
+            return value * 2
+
+        network.load_from_iterator([("param", tp.ones((2,), dtype=tp.float32))], transform=transform)
+
+        assert transformed == ["param"]
+        # The transformed value should be evaluated immediately so it does not reference the source data.
+        assert isinstance(network.param.trace_tensor.producer, Storage)
+        assert np.array_equal(to_numpy(network.param), np.full((2,), 2, dtype=np.float32))
+
+    def test_load_from_iterator_is_streamed(self, network):
+        yielded = {}
+
+        def read_weights():
+            for name in ["param", "dummy1.nested.param", "dummy2.nested.param"]:
+                # Each weight should be assigned before the next one is read.
+                assert all(network.state_dict()[prev] is param for prev, param in yielded.items())
+                yielded[name] = tp.Parameter(tp.zeros((2,), dtype=tp.float32))
+                yield name, yielded[name]
+
+        network.load_from_iterator(read_weights())
+        assert all(network.state_dict()[name] is param for name, param in yielded.items())
+
+    def test_load_from_checkpoint(self, network, tmp_path):
+        path = os.path.join(tmp_path, "model.safetensors")
+        helper.write_safetensors(
+            path,
+            {
+                "param": torch.full((2,), 3.0),
+                "dummy1.nested.param": torch.full((2,), 4.0),
+            },
+        )
+
+        network.load_from_checkpoint(path)
+        assert np.array_equal(to_numpy(network.param), np.full((2,), 3.0, dtype=np.float32))
+        assert np.array_equal(to_numpy(network.dummy1.nested.param), np.full((2,), 4.0, dtype=np.float32))
+
+    def test_load_from_sharded_checkpoint(self, network, tmp_path):
+        helper.write_safetensors(os.path.join(tmp_path, "shard0.safetensors"), {"param": torch.full((2,), 3.0)})
+        helper.write_safetensors(
+            os.path.join(tmp_path, "shard1.safetensors"), {"dummy2.nested.param": torch.full((2,), 5.0)}
+        )
+        index_path = os.path.join(tmp_path, "model.safetensors.index.json")
+        with open(index_path, "w") as f:
+            json.dump({"weight_map": {"param": "shard0.safetensors", "dummy2.nested.param": "shard1.safetensors"}}, f)
+
+        network.load_from_checkpoint(index_path)
+        assert np.array_equal(to_numpy(network.param), np.full((2,), 3.0, dtype=np.float32))
+        assert np.array_equal(to_numpy(network.dummy2.nested.param), np.full((2,), 5.0, dtype=np.float32))
+
+    def test_save_and_load_weights(self, network, tmp_path):
+        path = os.path.join(tmp_path, "network.tpwts")
+        network.save_weights(path)
+
+        new_network = type(network)()
+        new_network.param = tp.Parameter(tp.zeros((2,), dtype=tp.float32))
+        new_network.load_weights(path)
+
+        for name, param in network.state_dict().items():
+            assert np.array_equal(to_numpy(new_network.state_dict()[name]), to_numpy(param))
+            # Loaded parameters should be views of the memory-mapped file.
+            assert isinstance(new_network.state_dict()[name].trace_tensor.producer.data.data_ref, mmap.mmap)
+
     def test_load_from_state_dict_with_different_shapes_fails(
         self,
         network,
@@ -57,6 +57,20 @@ class TestParameter:
 
         assert bool(param._is_compatible(other)) == is_compatible
 
+    def test_is_compatible_does_not_compile_for_static_shapes(self, monkeypatch):
+        from tripy.backend.mlir.compiler import Compiler
+
+        def fail_compile(*args, **kwargs):
+            assert False, "Shapes of constant parameters should be determined without compiling"
+
+        param = tp.Parameter(tp.Tensor(cp.ones((1, 2), dtype=cp.float32)))
+        other = tp.Parameter(tp.Tensor(cp.ones((2, 2), dtype=cp.float32)))
+        monkeypatch.setattr(Compiler, "compile", fail_compile)
+
+        assert param._is_compatible(param)
+        assert not param._is_compatible(other)
+        assert DefaultParameter((1, 2), dtype=tp.float32)._is_compatible(param)
+
 
 class TestDefaultParameter:
     @pytest.mark.parametrize(
@@ -187,6 +187,15 @@ class TestTensor:
         assert find_frame("ones").code.strip() == "return full(shape, 1, dtype)"
         assert find_frame("test_stack_depth_sanity").code.strip() == "a = tp.ones((2, 3))"
 
+    def test_stack_info_disabled(self, monkeypatch):
+        monkeypatch.setattr(tp.config, "enable_stack_info", False)
+
+        a = tp.Tensor([1.0, 2.0])
+        b = a + 1.0
+        assert not a.stack_info
+        assert not b.stack_info
+        assert cp.from_dlpack(b).get().tolist() == [2.0, 3.0]
+
     @pytest.mark.parametrize(
         "tensor",
         [
@@ -18,10 +18,12 @@
 from textwrap import dedent
 
 import cupy as cp
+import pytest
 
 import tripy as tp
 from tests import helper
 from tripy.frontend.trace import Trace
+from tripy.frontend.trace.ops import Reshape, Storage
 
 
 class TestTrace:
@@ -215,3 +217,148 @@ class TestTrace:
             has_stack_info_for=[a, b],
         ):
             Trace([c])
+
+    def test_fingerprint_independent_of_names(self):
+        def make_trace(prefix):
+            a = tp.Tensor([1.0, 2.0], name=f"{prefix}a")
+            b = tp.Tensor([3.0, 4.0], name=f"{prefix}b")
+            return Trace([tp.tanh(a + b)])
+
+        assert make_trace("x").fingerprint() == make_trace("y").fingerprint()
+
+    def test_fingerprint_depends_on_constants(self):
+        a = Trace([tp.Tensor([1.0, 2.0]) + tp.Tensor([3.0, 4.0])])
+        b = Trace([tp.Tensor([1.0, 2.0]) + tp.Tensor([3.0, 5.0])])
+
+        assert a.fingerprint() != b.fingerprint()
+
+    def test_fingerprint_depends_on_op_fields(self):
+        a = tp.Tensor([1.0, 2.0])
+
+        assert Trace([tp.tanh(a)]).fingerprint() != Trace([tp.exp(a)]).fingerprint()
+
+    def test_canonicalize(self):
+        a = tp.Tensor([1.0, 2.0], name="a")
+        b = tp.Tensor([3.0, 4.0], name="b")
+        c = a + b
+        c.name = "c"
+
+        trace = Trace([c])
+        fingerprint = trace.fingerprint()
+        trace.canonicalize()
+
+        assert [op.outputs[0].name for op in trace.ops] == ["%0", "%1", "%2"]
+        assert c.name == "%2"
+        assert trace.fingerprint() == fingerprint
+
+
+class TestFoldConstants:
+    def test_shape_arithmetic_folded(self):
+        a = tp.Tensor([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+        out = (a + a).shape[0] * 2 + (a + a).shape[1]
+
+        trace = Trace([out])
+        assert trace.fold_constants() > 0
+
+        assert len(trace.ops) == 1
+        assert isinstance(trace.ops[0], Storage)
+        assert trace.ops[0].data.data() == 7
+
+    def test_inputs_not_folded(self):
+        inp = tp.Tensor([1.0, 2.0], name="inp")
+        out = inp.shape[0] + 1
+
+        trace = Trace([out], inputs=[inp])
+        assert trace.fold_constants() == 0
+
+    def test_float_arithmetic_not_folded(self):
+        trace = Trace([tp.Tensor([1.0, 2.0]) + tp.Tensor([3.0, 4.0])])
+        assert trace.fold_constants() == 0
+
+    @pytest.mark.parametrize(
+        "func",
+        [
+            lambda a: a.shape,
+            lambda a: a.shape[0] * 2 - a.shape[1],
+            lambda a: a.shape[1:],
+            lambda a: a.shape[::-1],
+            lambda a: a.shape + a.shape,
+            lambda a: tp.reshape(a, (3, 2)).shape,
+            lambda a: tp.maximum(a.shape, tp.Tensor([3, 1])),
+        ],
+    )
+    def test_folding_preserves_results(self, func, monkeypatch):
+        def evaluate():
+            return cp.from_dlpack(func(tp.Tensor([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]))).get()
+
+        expected = evaluate()
+        monkeypatch.setattr(tp.config, "enable_constant_folding", False)
+        assert cp.array_equal(evaluate(), expected)
+
+
+class TestEliminateCommonSubexpressions:
+    def test_duplicate_ops_merged(self):
+        a = tp.Tensor([1.0, 2.0])
+        out = tp.exp(a) + tp.exp(a)
+
+        trace = Trace([out])
+        assert trace.eliminate_common_subexpressions() == 1
+
+        add = trace.ops[-1]
+        assert add.inputs[0] is add.inputs[1]
+
+    def test_identical_constants_merged(self):
+        out = tp.Tensor([1.0, 2.0]) + tp.Tensor([1.0, 2.0])
+
+        trace = Trace([out])
+        assert trace.eliminate_common_subexpressions() == 1
+        assert len(trace.ops) == 2
+
+    def test_chains_merged(self):
+        a = tp.Tensor([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+        out = tp.reshape(a, (a.shape[1], a.shape[0])) + tp.reshape(a, (a.shape[1], a.shape[0]))
+
+        trace = Trace([out])
+        assert trace.eliminate_common_subexpressions() > 0
+
+        add = trace.ops[-1]
+        assert add.inputs[0] is add.inputs[1]
+        # The shape extractions feeding each reshape are merged too, so only a single reshape remains.
+        assert len([op for op in trace.ops if isinstance(op, Reshape)]) == 1
+
+    def test_different_parameters_not_merged(self):
+        a = tp.Tensor([1.0, 2.0])
+        trace = Trace([tp.exp(a) + tp.tanh(a)])
+        assert trace.eliminate_common_subexpressions() == 0
+
+    def test_outputs_not_merged(self):
+        a = tp.Tensor([1.0, 2.0])
+        outs = [tp.exp(a), tp.exp(a)]
+
+        trace = Trace(outs)
+        assert trace.eliminate_common_subexpressions() == 0
+        assert [out.producer for out in trace.outputs] == [out.trace_tensor.producer for out in outs]
+
+    def test_inputs_not_merged(self):
+        a = tp.Tensor([1.0, 2.0], name="a")
+        b = tp.Tensor([1.0, 2.0], name="b")
+
+        trace = Trace([tp.exp(a) + tp.exp(b)], inputs=[a, b])
+        assert trace.eliminate_common_subexpressions() == 0
+
+    @pytest.mark.parametrize(
+        "func",
+        [
+            lambda a: tp.exp(a) * tp.exp(a),
+            lambda a: tp.softmax(a, dim=1) + tp.softmax(a, dim=1),
+            lambda a: tp.var(a, dim=0) - tp.mean(a, dim=0),
+            lambda a: tp.reshape(a, (a.shape[1], a.shape[0])) - tp.reshape(a, (a.shape[1], -1)),
+        ],
+    )
+    def test_elimination_preserves_results(self, func, monkeypatch):
+        def evaluate():
+            return cp.from_dlpack(func(tp.Tensor([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]))).get()
+
+        expected = evaluate()
+        monkeypatch.setattr(tp.config, "enable_common_subexpression_elimination", False)
+        assert cp.array_equal(evaluate(), expected)
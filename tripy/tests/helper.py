@@ -21,8 +21,10 @@ import glob
 import importlib
 import inspect
 import io
+import json
 import os
 import pkgutil
+import struct
 from textwrap import dedent, indent
 from typing import Any, Callable, Dict, List, Optional, Sequence, Set
 
@@ -109,6 +111,46 @@ TORCH_DTYPES = {
 }
 
 
+# `torch.float8_e4m3fn` was only added in torch 2.1, so it is `None` with older versions.
+TORCH_FLOAT8 = getattr(torch, "float8_e4m3fn", None)
+requires_torch_float8 = pytest.mark.skipif(TORCH_FLOAT8 is None, reason="torch.float8_e4m3fn requires torch 2.1+")
+
+
+def write_safetensors(path: str, tensors: Dict[str, torch.Tensor]) -> None:
+    """
+    Writes tensors to a file in the safetensors format.
+    """
+    SAFETENSORS_DTYPES = {
+        torch.bool: "BOOL",
+        torch.int8: "I8",
+        torch.int32: "I32",
+        torch.int64: "I64",
+        torch.float16: "F16",
+        torch.bfloat16: "BF16",
+        torch.float32: "F32",
+    }
+    if TORCH_FLOAT8 is not None:
+        SAFETENSORS_DTYPES[TORCH_FLOAT8] = "F8_E4M3"
+
+    header = {}
+    offset = 0
+    for name, tensor in tensors.items():
+        nbytes = tensor.numel() * tensor.element_size()
+        header[name] = {
+            "dtype": SAFETENSORS_DTYPES[tensor.dtype],
+            "shape": list(tensor.shape),
+            "data_offsets": [offset, offset + nbytes],
+        }
+        offset += nbytes
+
+    header_bytes = json.dumps(header).encode()
+    with open(path, "wb") as f:
+        f.write(struct.pack("<Q", len(header_bytes)))
+        f.write(header_bytes)
+        for tensor in tensors.values():
+            f.write(tensor.contiguous().reshape(-1).view(torch.uint8).numpy().tobytes())
+
+
 class DocstringCodeBlock(str):
     def code(self) -> str:
         # Special directives can be used in the code blocks and they should be
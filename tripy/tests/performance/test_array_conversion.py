@@ -0,0 +1,54 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 1993-2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import time
+
+import numpy as np
+import pytest
+
+import tripy as tp
+from tripy.common.array import Array
+
+SIZES = [10**3, 10**4, 10**5, 10**6, 10**7]
+
+
+def timed(func):
+    start = time.perf_counter()
+    ret = func()
+    end = time.perf_counter()
+    return ret, end - start
+
+
+@pytest.mark.l1
+@pytest.mark.parametrize("size", SIZES)
+def test_list_construction(size):
+    data = [[float(index)] * 1000 for index in range(size // 1000)]
+
+    arr, duration = timed(lambda: Array(data, None, tp.float32, tp.device("cpu")))
+    print(f"Constructing an Array from a list of {size} elements took: {duration * 1e3:.3f} ms")
+    assert arr.shape == (size // 1000, 1000)
+
+
+@pytest.mark.l1
+@pytest.mark.parametrize("np_dtype", [np.float32, np.float16])
+@pytest.mark.parametrize("size", SIZES)
+def test_data(size, np_dtype):
+    arr = Array(np.ones((size // 1000, 1000), dtype=np_dtype), None, None, tp.device("cpu"))
+
+    data, duration = timed(arr.data)
+    print(f"Converting an Array of {size} {np_dtype.__name__} elements to a list took: {duration * 1e3:.3f} ms")
+    assert len(data) == size // 1000
@@ -0,0 +1,51 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 1993-2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import time
+
+import numpy as np
+import pytest
+
+import tripy as tp
+from tripy.backend.mlir.compiler import Compiler
+from tripy.frontend.trace import Trace
+
+
+def make_normalization_blocks(num_layers):
+    # Mimics models that normalize the same activations in several places, e.g. a residual branch and a
+    # gating branch, each of which recomputes the same composite ops and shape extractions.
+    x = tp.Tensor(np.ones((2, 8, 16), dtype=np.float32))
+    for _ in range(num_layers):
+        branch0 = tp.softmax(x, dim=2) * tp.reshape(tp.mean(x, dim=2), (x.shape[0], x.shape[1], 1))
+        branch1 = tp.softmax(x, dim=2) * tp.reshape(tp.var(x, dim=2), (x.shape[0], x.shape[1], 1))
+        x = branch0 + branch1
+    return x
+
+
+@pytest.mark.l1
+@pytest.mark.parametrize("enable_cse", [True, False], ids=["eliminated", "not_eliminated"])
+def test_compile_repeated_subexpressions(enable_cse):
+    trace = Trace([make_normalization_blocks(num_layers=8)])
+    if enable_cse:
+        print(f"Eliminated {trace.eliminate_common_subexpressions()} operations")
+
+    start = time.perf_counter()
+    flat_ir = trace.to_flat_ir()
+    Compiler(trt_builder_opt_level=0).compile(flat_ir.to_mlir(), flat_ir=flat_ir)
+    end = time.perf_counter()
+
+    print(f"FlatIR contains {len(flat_ir.ops)} operations. Lowering and compiling took: {end - start:.3f} seconds")
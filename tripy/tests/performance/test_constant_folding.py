@@ -0,0 +1,52 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 1993-2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import time
+
+import numpy as np
+import pytest
+
+import tripy as tp
+from tripy.backend.mlir.compiler import Compiler
+from tripy.frontend.trace import Trace
+
+
+def make_attention_reshapes(num_layers):
+    # Mimics the reshapes in the attention blocks of GPT, which split and merge heads using the input shape.
+    NUM_HEADS = 4
+    HEAD_DIM = 4
+    x = tp.Tensor(np.ones((2, 8, NUM_HEADS * HEAD_DIM), dtype=np.float32))
+    for _ in range(num_layers):
+        batch, seq_len = x.shape[0], x.shape[1]
+        x = tp.reshape(x, (batch, seq_len, NUM_HEADS, HEAD_DIM))
+        x = tp.reshape(x, (batch, seq_len, NUM_HEADS * HEAD_DIM))
+    return x
+
+
+@pytest.mark.l1
+@pytest.mark.parametrize("enable_constant_folding", [True, False], ids=["folded", "not_folded"])
+def test_compile_shape_arithmetic(enable_constant_folding):
+    trace = Trace([make_attention_reshapes(num_layers=8)])
+    if enable_constant_folding:
+        trace.fold_constants()
+
+    flat_ir = trace.to_flat_ir()
+    start = time.perf_counter()
+    Compiler(trt_builder_opt_level=0).compile(flat_ir.to_mlir(), flat_ir=flat_ir)
+    end = time.perf_counter()
+
+    print(f"FlatIR contains {len(flat_ir.ops)} operations. Lowering and compiling took: {end - start:.3f} seconds")
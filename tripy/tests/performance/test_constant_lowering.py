@@ -0,0 +1,125 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 1993-2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import resource
+import time
+
+import numpy as np
+import pytest
+
+import tripy as tp
+from tripy.frontend.trace import Trace
+
+
+def get_peak_rss_bytes():
+    # On Linux, `ru_maxrss` is reported in kilobytes.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+@pytest.mark.l1
+@pytest.mark.parametrize("zero_copy_constant_threshold", [1 << 20, -1], ids=["zero_copy", "copy"])
+def test_lowering_large_constants(zero_copy_constant_threshold, monkeypatch):
+    monkeypatch.setattr(tp.config, "zero_copy_constant_threshold", zero_copy_constant_threshold)
+
+    NUM_CONSTANTS = 16
+    CONSTANT_SIZE = (1 << 30) // NUM_CONSTANTS
+
+    # Host constants are used so that the data does not need to be copied from the device first.
+    # Each constant has distinct contents so that none of them are deduplicated.
+    def make_host_constant(index):
+        return tp.Tensor(np.full((CONSTANT_SIZE // 4,), index, dtype=np.float32))
+
+    out = make_host_constant(0)
+    for index in range(1, NUM_CONSTANTS):
+        out = out + make_host_constant(index)
+
+    flat_ir = Trace([out]).to_flat_ir()
+
+    rss_before = get_peak_rss_bytes()
+    start = time.perf_counter()
+    flat_ir.to_mlir()
+    end = time.perf_counter()
+    rss_increase = get_peak_rss_bytes() - rss_before
+
+    print(
+        f"Lowering {NUM_CONSTANTS * CONSTANT_SIZE / (1 << 30):.2f} GiB of constants took: {end - start:.3f} seconds "
+        f"and increased peak RSS by: {rss_increase / (1 << 20):.2f} MiB"
+    )
+
+    if zero_copy_constant_threshold >= 0:
+        assert rss_increase < (NUM_CONSTANTS * CONSTANT_SIZE) // 4
+
+
+@pytest.mark.l1
+@pytest.mark.parametrize("constant_prep_workers", [1, 8])
+def test_lowering_device_constants(constant_prep_workers, monkeypatch):
+    monkeypatch.setattr(tp.config, "constant_prep_workers", constant_prep_workers)
+    # Copy constants into the MLIR context so that host copies are released once they have been embedded.
+    monkeypatch.setattr(tp.config, "zero_copy_constant_threshold", -1)
+
+    NUM_CONSTANTS = 64
+    CONSTANT_SIZE = (1 << 28) // NUM_CONSTANTS
+
+    # Device constants need to be copied to the host before they can be embedded into MLIR.
+    # Each constant has a distinct shape so that none of them are candidates for deduplication.
+    def make_device_constant(index):
+        return tp.Tensor(tp.full((CONSTANT_SIZE // 4 - index,), float(index), dtype=tp.float32).eval())
+
+    out = tp.sum(make_device_constant(0))
+    for index in range(1, NUM_CONSTANTS):
+        out = out + tp.sum(make_device_constant(index))
+
+    flat_ir = Trace([out]).to_flat_ir()
+
+    rss_before = get_peak_rss_bytes()
+    start = time.perf_counter()
+    flat_ir.to_mlir()
+    end = time.perf_counter()
+    rss_increase = get_peak_rss_bytes() - rss_before
+
+    print(
+        f"Lowering {NUM_CONSTANTS} device constants with {constant_prep_workers} worker(s) took: {end - start:.3f} seconds "
+        f"and increased peak RSS by: {rss_increase / (1 << 20):.2f} MiB"
+    )
+
+    # The MLIR context holds one copy of every constant. Since constants are only prepared a few at a time,
+    # host copies should add at most `constant_prep_workers + 1` constants on top of that, rather than another
+    # copy of every constant.
+    assert rss_increase < NUM_CONSTANTS * CONSTANT_SIZE * 3 // 2
+
+
+@pytest.mark.l1
+def test_lowering_duplicate_constants():
+    NUM_LAYERS = 32
+    MASK_SIZE = 1024
+    # Mimics a network that creates an identical mask in every layer, like the causal mask in GPT.
+    out = tp.ones((MASK_SIZE, MASK_SIZE), dtype=tp.float32)
+    for _ in range(NUM_LAYERS):
+        out = out + tp.Tensor(np.tril(np.ones((MASK_SIZE, MASK_SIZE), dtype=np.float32)))
+
+    flat_ir = Trace([out]).to_flat_ir()
+
+    start = time.perf_counter()
+    num_bytes = flat_ir.deduplicate_constants()
+    mlir_text = str(flat_ir.to_mlir())
+    end = time.perf_counter()
+
+    print(
+        f"Deduplicated {num_bytes / (1 << 20):.2f} MiB of constants. Lowering took: {end - start:.3f} seconds "
+        f"and produced a module of {len(mlir_text) / (1 << 20):.2f} MiB"
+    )
+    assert num_bytes >= (NUM_LAYERS - 1) * MASK_SIZE * MASK_SIZE * 4
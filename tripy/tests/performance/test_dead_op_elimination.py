@@ -0,0 +1,46 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 1993-2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import time
+
+import numpy as np
+import pytest
+
+import tripy as tp
+from tripy.frontend.trace import Trace
+
+
+@pytest.mark.l1
+def test_lowering_broadcast_helpers():
+    NUM_LAYERS = 32
+    # Broadcasting binary operations emit helper shape computations in FlatIR, not all of which are used.
+    x = tp.Tensor(np.ones((2, 8, 16), dtype=np.float32))
+    for _ in range(NUM_LAYERS):
+        x = tp.tanh(x * tp.Tensor(np.ones((16,), dtype=np.float32)) + tp.Tensor(np.ones((8, 1), dtype=np.float32)))
+
+    flat_ir = Trace([x]).to_flat_ir()
+    num_ops = len(flat_ir.ops)
+
+    start = time.perf_counter()
+    num_removed = flat_ir.eliminate_dead_ops()
+    mlir_text = str(flat_ir.to_mlir())
+    end = time.perf_counter()
+
+    print(
+        f"Eliminated {num_removed} of {num_ops} operations. Lowering took: {end - start:.3f} seconds "
+        f"and produced a module of {len(mlir_text) / (1 << 10):.2f} KiB"
+    )
@@ -0,0 +1,74 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 1993-2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import time
+
+import pytest
+
+import tripy as tp
+from tripy.function_registry import FunctionRegistry
+
+NUM_CALLS = 10000
+
+
+def time_per_call(func, clear_cache=None):
+    start = time.perf_counter()
+    for _ in range(NUM_CALLS):
+        if clear_cache:
+            clear_cache()
+        func()
+    end = time.perf_counter()
+    return (end - start) / NUM_CALLS
+
+
+@pytest.mark.l1
+@pytest.mark.parametrize("num_overloads", [1, 2])
+def test_dispatch_overhead(num_overloads):
+    registry = FunctionRegistry()
+
+    def impl(a: int, b: "tripy.Tensor", c: float = 1.0):
+        return a
+
+    def other_impl(a: int, d: "tripy.Tensor"):
+        return a
+
+    registry("func")(impl)
+    if num_overloads > 1:
+        registry("func")(other_impl)
+
+    tensor = tp.Tensor([1.0])
+    call = lambda: registry["func"](1, b=tensor)
+    direct_time = time_per_call(lambda: impl(1, b=tensor))
+    uncached_time = time_per_call(call, clear_cache=registry.dispatch_cache.clear)
+    cached_time = time_per_call(call)
+
+    print(
+        f"With {num_overloads} overload(s), dispatch overhead per call was: {(cached_time - direct_time) * 1e6:.3f} us "
+        f"(without dispatch cache: {(uncached_time - direct_time) * 1e6:.3f} us)"
+    )
+    assert cached_time < uncached_time
+
+
+@pytest.mark.l1
+def test_tensor_op_dispatch_overhead():
+    a = tp.Tensor([1.0, 2.0])
+    b = tp.Tensor([2.0, 3.0])
+
+    # Warm up the dispatch cache.
+    a + b
+    per_op_time = time_per_call(lambda: a + b)
+    print(f"Tracing `a + b` took: {per_op_time * 1e6:.3f} us per op")
@@ -0,0 +1,66 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 1993-2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+Measures the Python overhead of executing a compiled function.
+
+The runtime session is replaced with a stand-in that does not launch any work so that only
+the time spent in Tripy is measured.
+"""
+
+import time
+
+import pytest
+
+import tripy as tp
+
+
+class NopSession:
+    def __init__(self, session, shape_func_name):
+        self.session = session
+        self.shape_func_name = shape_func_name
+
+    def execute_function(self, name, **kwargs):
+        # Shape functions run on the host and are part of the per-call overhead we want to measure.
+        if name == self.shape_func_name:
+            self.session.execute_function(name=name, **kwargs)
+
+
+@pytest.mark.l1
+@pytest.mark.parametrize("input_shape", [(2, 2), ((1, 2, 3), 2)], ids=["static", "dynamic"])
+def test_executor_per_call_overhead(input_shape):
+    NUM_ITERS = 1000
+
+    executable = tp.Compiler(lambda a, b: a + b).compile(
+        tp.InputInfo(input_shape, dtype=tp.float32), tp.InputInfo(input_shape, dtype=tp.float32)
+    )
+    executor = executable._executor
+    executor.session = NopSession(executor.session, executor.shape_func_name)
+
+    inp = tp.ones((2, 2), dtype=tp.float32)
+    inp.eval()
+    output_devices = [None]
+
+    # Warm up
+    executor.execute(output_devices, [inp, inp])
+
+    start = time.perf_counter()
+    for _ in range(NUM_ITERS):
+        executor.execute(output_devices, [inp, inp])
+    end = time.perf_counter()
+
+    print(f"Per-call executor overhead: {(end - start) / NUM_ITERS * 1e6:.2f} us")
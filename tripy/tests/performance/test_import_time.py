@@ -0,0 +1,57 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 1993-2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import re
+import subprocess
+import sys
+
+import pytest
+
+from tests import helper
+
+IMPORT_TIME_PAT = re.compile(r"import time:\s*(\d+)\s*\|\s*(\d+)\s*\|(\s*)(\S+)")
+
+
+def get_import_times(code):
+    """
+    Runs `code` under `python -X importtime` and returns a mapping of top-level module names to their
+    cumulative import times in microseconds.
+    """
+    status = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], cwd=helper.ROOT_DIR, capture_output=True, text=True
+    )
+    assert status.returncode == 0, status.stderr
+
+    times = {}
+    for line in status.stderr.splitlines():
+        match = IMPORT_TIME_PAT.match(line)
+        # Only top-level imports have a single space of indentation.
+        if match and len(match.group(3)) == 1:
+            times[match.group(4)] = times.get(match.group(4), 0) + int(match.group(2))
+    return times
+
+
+@pytest.mark.l1
+def test_import_time():
+    lazy_time = get_import_times("import tripy")["tripy"]
+    # Import everything that was previously imported eagerly for comparison.
+    eager_times = get_import_times("import tripy; from tests import helper; _ = list(helper.discover_modules())")
+    eager_time = sum(eager_times.values())
+
+    print(f"`import tripy` took: {lazy_time / 1e3:.3f} ms, importing all submodules took: {eager_time / 1e3:.3f} ms")
+
+    assert lazy_time < eager_time
@@ -0,0 +1,62 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 1993-2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import time
+
+import cupy as cp
+import pytest
+
+import tripy as tp
+from tripy.backend.mlir.compiler import Compiler
+
+
+class LargeModule(tp.Module):
+    def __init__(self, num_layers, hidden_size):
+        super().__init__()
+        self.layers = [tp.Linear(hidden_size, hidden_size) for _ in range(num_layers)]
+
+
+@pytest.mark.l1
+def test_load_from_state_dict_does_not_compile(monkeypatch):
+    NUM_LAYERS = 256
+    HIDDEN_SIZE = 256
+
+    module = LargeModule(NUM_LAYERS, HIDDEN_SIZE)
+    state_dict = {
+        f"layers.{index}.{name}": tp.Parameter(tp.Tensor(cp.ones(shape, dtype=cp.float32)))
+        for index in range(NUM_LAYERS)
+        for name, shape in [("weight", (HIDDEN_SIZE, HIDDEN_SIZE)), ("bias", (HIDDEN_SIZE,))]
+    }
+
+    num_compiles = 0
+    original_compile = Compiler.compile
+
+    def counting_compile(self, *args, **kwargs):
+        nonlocal num_compiles
+        num_compiles += 1
+        return original_compile(self, *args, **kwargs)
+
+    monkeypatch.setattr(Compiler, "compile", counting_compile)
+
+    start = time.perf_counter()
+    module.load_from_state_dict(state_dict)
+    # Loading a second time checks compatibility between constant parameters.
+    module.load_from_state_dict(state_dict)
+    end = time.perf_counter()
+    print(f"Loading {len(state_dict)} parameters twice took: {end - start:.3f} seconds")
+
+    assert num_compiles == 0
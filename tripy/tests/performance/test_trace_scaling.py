@@ -0,0 +1,96 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 1993-2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+Benchmarks that check that building a Trace scales linearly with the size of the graph.
+
+The graphs are built directly out of trace tensors and a minimal trace operation so that
+the benchmarks measure only the cost of `Trace` construction.
+"""
+
+import time
+from dataclasses import dataclass
+from types import SimpleNamespace
+
+import pytest
+
+import tripy as tp
+from tripy.frontend.trace import Trace
+from tripy.frontend.trace.ops import BaseTraceOp
+from tripy.frontend.trace.tensor import TraceTensor
+
+
+@dataclass(repr=False)
+class NopOp(BaseTraceOp):
+    def infer_devices(self):
+        self.outputs[0].device = self.inputs[0].device if self.inputs else tp.device("gpu")
+
+    def to_flat_ir(self, inputs, outputs):
+        pass
+
+
+def make_tensor(name, inputs):
+    out = TraceTensor(name, None, tp.float32, None, 1, None)
+    out.producer = NopOp(inputs, [out])
+    return out
+
+
+def make_chain(num_ops):
+    tensor = make_tensor("t0", [])
+    for index in range(1, num_ops):
+        tensor = make_tensor(f"t{index}", [tensor])
+    return tensor
+
+
+def make_diamonds(num_ops):
+    # Each diamond contributes 3 ops: two branches that consume the same tensor and a join.
+    tensor = make_tensor("t0", [])
+    for index in range(num_ops // 3):
+        left = make_tensor(f"l{index}", [tensor])
+        right = make_tensor(f"r{index}", [tensor])
+        tensor = make_tensor(f"j{index}", [left, right])
+    return tensor
+
+
+def time_trace(build_graph, num_ops):
+    out = build_graph(num_ops)
+    start = time.perf_counter()
+    trace = Trace([SimpleNamespace(trace_tensor=out)])
+    end = time.perf_counter()
+    return trace, end - start
+
+
+@pytest.mark.parametrize("build_graph", [make_chain, make_diamonds])
+def test_ops_topologically_sorted(build_graph):
+    trace, _ = time_trace(build_graph, 3000)
+
+    emitted = set()
+    for op in trace.ops:
+        assert all(id(inp.producer) in emitted for inp in op.inputs)
+        emitted.add(id(op))
+    assert len(trace.ops) == len(emitted)
+
+
+@pytest.mark.l1
+@pytest.mark.parametrize("build_graph", [make_chain, make_diamonds])
+def test_trace_construction_scales_linearly(build_graph):
+    timings = {num_ops: min(time_trace(build_graph, num_ops)[1] for _ in range(3)) for num_ops in [1000, 10000, 100000]}
+    print(f"Trace construction time for {build_graph.__name__}: {timings}")
+
+    # A 10x larger graph should take roughly 10x longer. We allow a generous margin for noise,
+    # but a quadratic implementation would take ~100x longer.
+    assert timings[100000] < 30 * timings[10000]
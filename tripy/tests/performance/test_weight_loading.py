@@ -0,0 +1,90 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 1993-2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+import torch
+
+from tests import helper
+
+NUM_LAYERS = 48
+HIDDEN_SIZE = 4096  # Each layer is 64 MiB in float32, so the checkpoint is 3 GiB in total.
+NUM_SHARDS = 4
+
+LOAD_SCRIPT = """
+import resource
+import sys
+import time
+
+import tripy as tp
+
+class Model(tp.Module):
+    def __init__(self):
+        super().__init__()
+        self.layers = [tp.Linear({hidden_size}, {hidden_size}, bias=False) for _ in range({num_layers})]
+
+model = Model()
+rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+start = time.perf_counter()
+model.load_from_checkpoint(sys.argv[1])
+end = time.perf_counter()
+
+rss_increase = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024 - rss_before
+print(end - start, rss_increase)
+"""
+
+
+def run_load(index_path):
+    script = LOAD_SCRIPT.format(hidden_size=HIDDEN_SIZE, num_layers=NUM_LAYERS)
+    status = subprocess.run(
+        [sys.executable, "-c", script, index_path], cwd=helper.ROOT_DIR, capture_output=True, text=True
+    )
+    assert status.returncode == 0, status.stderr
+    duration, rss_increase = status.stdout.split()
+    return float(duration), int(rss_increase)
+
+
+@pytest.mark.l1
+def test_streaming_weight_loading(tmp_path):
+    weight_map = {}
+    layers_per_shard = NUM_LAYERS // NUM_SHARDS
+    for shard in range(NUM_SHARDS):
+        shard_name = f"model-{shard}.safetensors"
+        tensors = {
+            f"layers.{layer}.weight": torch.ones((HIDDEN_SIZE, HIDDEN_SIZE))
+            for layer in range(shard * layers_per_shard, (shard + 1) * layers_per_shard)
+        }
+        helper.write_safetensors(os.path.join(tmp_path, shard_name), tensors)
+        weight_map.update({name: shard_name for name in tensors})
+
+    index_path = os.path.join(tmp_path, "model.safetensors.index.json")
+    with open(index_path, "w") as f:
+        json.dump({"weight_map": weight_map}, f)
+
+    checkpoint_size = NUM_LAYERS * HIDDEN_SIZE * HIDDEN_SIZE * 4
+    duration, rss_increase = run_load(index_path)
+    print(
+        f"Streaming {checkpoint_size / (1 << 30):.2f} GiB of weights took: {duration:.3f} seconds "
+        f"and increased peak RSS by: {rss_increase / (1 << 20):.2f} MiB"
+    )
+
+    assert rss_increase < checkpoint_size // 4
@@ -23,6 +23,7 @@ import inspect
 import pytest
 from tests.spec_verification.object_builders import create_obj
 from tripy.dtype_info import TYPE_VERIFICATION, RETURN_VALUE
+from tests import helper
 
 # imports necessary for creating inputs and running exec:
 import tripy as tp
@@ -30,6 +31,9 @@ import numpy as np
 import cupy as cp
 import pytest
 
+# `import tripy` loads submodules lazily, so we need to import all of them to populate TYPE_VERIFICATION.
+_ = list(helper.discover_modules())
+
 
 def method_handler(kwargs, func_obj):
     """
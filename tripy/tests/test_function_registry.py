@@ -208,6 +208,61 @@ class TestFunctionRegistry:
         assert func_overload.annotations
         assert func_overload.annotations["a"] == AnnotationInfo(int, False, inspect.Parameter.POSITIONAL_OR_KEYWORD)
 
+    def test_dispatch_cached_by_arg_types(self, int_float_registry, monkeypatch):
+        from tripy.function_registry import FuncOverload
+
+        num_checks = 0
+        original_matches_arg_types = FuncOverload.matches_arg_types
+
+        def counting_matches_arg_types(self, args, kwargs):
+            nonlocal num_checks
+            num_checks += 1
+            return original_matches_arg_types(self, args, kwargs)
+
+        monkeypatch.setattr(FuncOverload, "matches_arg_types", counting_matches_arg_types)
+
+        assert int_float_registry["transform"](1) == 2
+        assert num_checks == 2
+
+        # Subsequent calls with the same argument types should not need to type check again.
+        assert int_float_registry["transform"](2) == 3
+        assert num_checks == 2
+
+        # Keyword arguments are part of the cache key.
+        assert int_float_registry["transform"](a=2) == 3
+        assert num_checks == 4
+
+        assert int_float_registry["transform"](1.0) == 0.0
+        assert num_checks == 6
+
+    def test_cached_dispatch_still_errors_on_mismatch(self, registry):
+        @registry("test")
+        def func(a: int):
+            return a + 1
+
+        assert registry["test"](0) == 1
+
+        with pytest.raises(
+            TripyException,
+            match="For parameter: 'a', expected an instance of type: 'int' but got argument of type: 'str'.",
+        ):
+            registry["test"]("0")
+
+    def test_dispatch_cache_invalidated_by_new_overload(self, registry):
+        @registry("test")
+        def func(a: int):
+            return 0
+
+        assert registry["test"](True) == 0
+
+        @registry("test")
+        def func(a: bool):
+            return 1
+
+        # `bool` is a subclass of `int`, so both overloads now match. The cached decision must not be reused.
+        with pytest.raises(TripyException, match="Ambiguous overload"):
+            registry["test"](True)
+
     def test_doc_of_non_overloaded_func(self, registry):
         # When there is no overload, the registry function should
         # use the docstring as-is
@@ -0,0 +1,80 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 1993-2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+import tripy as tp
+from tests import helper
+from tripy.export import PUBLIC_APIS
+
+
+def run_in_subprocess(code):
+    status = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)], cwd=helper.ROOT_DIR, capture_output=True, text=True
+    )
+    assert status.returncode == 0, status.stderr
+    return status.stdout
+
+
+class TestLazyLoading:
+    def test_public_api_modules_up_to_date(self):
+        _ = list(helper.discover_modules())
+
+        exported_names = {api.qualname.split(".")[-1] for api in PUBLIC_APIS if api.qualname.count(".") <= 1}
+        assert exported_names == set(tp.PUBLIC_API_MODULES.keys())
+
+    @pytest.mark.parametrize("name", tp.PUBLIC_API_MODULES.keys())
+    def test_defined_in_listed_module(self, name):
+        obj = getattr(tp, name)
+        module = sys.modules[tp.PUBLIC_API_MODULES[name]]
+        assert obj is module or any(value is obj for value in vars(module).values())
+
+    def test_import_does_not_load_submodules(self):
+        out = run_in_subprocess(
+            """
+            import sys
+            import tripy
+
+            print(sorted(name for name in sys.modules if name.startswith("tripy.")))
+            """
+        )
+        assert "tripy.backend" not in out
+        assert "tripy.frontend" not in out
+
+    def test_tensor_methods_registered(self):
+        run_in_subprocess(
+            """
+            import tripy as tp
+
+            for method in ["__add__", "__matmul__", "__getitem__", "shape"]:
+                assert hasattr(tp.Tensor, method), method
+            """
+        )
+
+    def test_dir_includes_unloaded_apis(self):
+        run_in_subprocess(
+            """
+            import tripy as tp
+
+            assert "Tensor" in dir(tp)
+            assert "Tensor" in tp.__all__
+            """
+        )
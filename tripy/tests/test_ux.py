@@ -31,6 +31,9 @@ import tripy as tp
 from tests import helper
 from tripy.export import PUBLIC_APIS
 
+# `import tripy` loads submodules lazily, so we need to import all of them to populate PUBLIC_APIS.
+_ = list(helper.discover_modules())
+
 
 class TestReadme:
     @pytest.mark.parametrize("readme", helper.MARKDOWN_FILES)
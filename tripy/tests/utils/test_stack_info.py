@@ -15,6 +15,7 @@
 # limitations under the License.
 #
 
+import pickle
 import sys
 
 import pytest
@@ -63,3 +64,26 @@ class TestGetStackInfo:
         assert num_frames_with_code == max(
             USER_FRAME_INDEX - include_code_index if include_code_index is not None else USER_FRAME_INDEX, 1
         )
+
+    def test_code_is_retrieved_lazily(self):
+        stack_info = tripy.utils.get_stack_info()
+
+        # The code should only be read from the source file once it is accessed.
+        assert "code" not in vars(stack_info[0])
+        assert stack_info[0].code == "        stack_info = tripy.utils.get_stack_info()"
+        assert "code" in vars(stack_info[0])
+
+    def test_column_range_can_be_set_before_code_is_retrieved(self):
+        stack_info = tripy.utils.get_stack_info()
+
+        stack_info[0].column_range = (8, 20)
+        assert stack_info[0].code == "        stack_info = tripy.utils.get_stack_info()"
+        assert stack_info[0].column_range == (8, 20)
+
+    def test_deferred_code_can_be_pickled(self):
+        stack_info = tripy.utils.get_stack_info()
+
+        restored = pickle.loads(pickle.dumps(stack_info[0]))
+        assert "_code_location" not in vars(stack_info[0])
+        assert restored.code == "        stack_info = tripy.utils.get_stack_info()"
+        assert restored == stack_info[0]
@@ -17,37 +17,126 @@
 
 __version__ = "0.0.1"
 
-# export.public_api() will expose things here. To make sure that happens, we just need to
-# import all the submodules so that the decorator is actually executed.
-__all__ = []
-
 import tripy
 
+# Maps the name of each public API to the module that defines it. export.public_api() exposes APIs here once
+# their defining module has been imported, so rather than eagerly importing every submodule, `__getattr__`
+# below imports the defining module the first time an API is accessed.
+#
+# NOTE: This must be kept in sync with the `export.public_api` decorators. `tests/test_init.py` verifies this.
+PUBLIC_API_MODULES = {
+    "ArgInfo": "tripy.backend.compiler_api",
+    "BucketedExecutable": "tripy.backend.bucketed_executable",
+    "CompileJob": "tripy.backend.parallel_compile",
+    "CompileResult": "tripy.backend.parallel_compile",
+    "Compiler": "tripy.backend.compiler_api",
+    "Conv": "tripy.frontend.module.convolution",
+    "ConvTranspose": "tripy.frontend.module.conv_transpose",
+    "Embedding": "tripy.frontend.module.embedding",
+    "Executable": "tripy.backend.compiler_api",
+    "ExecutionFuture": "tripy.backend.compiler_api",
+    "GroupNorm": "tripy.frontend.module.groupnorm",
+    "InputInfo": "tripy.backend.compiler_api",
+    "LayerNorm": "tripy.frontend.module.layernorm",
+    "Linear": "tripy.frontend.module.linear",
+    "Module": "tripy.frontend.module.module",
+    "Parameter": "tripy.frontend.module.parameter",
+    "Shape": "tripy.frontend.shape",
+    "Tensor": "tripy.frontend.tensor",
+    "TripyException": "tripy.common.exception",
+    "abs": "tripy.frontend.trace.ops.unary_elementwise",
+    "all": "tripy.frontend.trace.ops.reduce",
+    "allclose": "tripy.frontend.ops.allclose",
+    "any": "tripy.frontend.trace.ops.reduce",
+    "arange": "tripy.frontend.ops.tensor_initializers",
+    "argmax": "tripy.frontend.trace.ops.reduce",
+    "argmin": "tripy.frontend.trace.ops.reduce",
+    "bfloat16": "tripy.common.datatype",
+    "bool": "tripy.common.datatype",
+    "cast": "tripy.frontend.trace.ops.cast",
+    "compile_many": "tripy.backend.parallel_compile",
+    "concatenate": "tripy.frontend.trace.ops.concatenate",
+    "config": "tripy.config",
+    "copy": "tripy.frontend.trace.ops.copy",
+    "cos": "tripy.frontend.trace.ops.unary_elementwise",
+    "dequantize": "tripy.frontend.trace.ops.dequantize",
+    "device": "tripy.common.device",
+    "dtype": "tripy.common.datatype",
+    "exp": "tripy.frontend.trace.ops.unary_elementwise",
+    "expand": "tripy.frontend.trace.ops.expand",
+    "flip": "tripy.frontend.trace.ops.flip",
+    "float16": "tripy.common.datatype",
+    "float32": "tripy.common.datatype",
+    "float8": "tripy.common.datatype",
+    "full": "tripy.frontend.trace.ops.fill",
+    "full_like": "tripy.frontend.trace.ops.fill",
+    "gather": "tripy.frontend.trace.ops.gather",
+    "gelu": "tripy.frontend.ops.gelu",
+    "int32": "tripy.common.datatype",
+    "int4": "tripy.common.datatype",
+    "int64": "tripy.common.datatype",
+    "int8": "tripy.common.datatype",
+    "iota": "tripy.frontend.trace.ops.iota",
+    "iota_like": "tripy.frontend.trace.ops.iota",
+    "log": "tripy.frontend.trace.ops.unary_elementwise",
+    "logger": "tripy.logging.logger",
+    "masked_fill": "tripy.frontend.trace.ops.where",
+    "max": "tripy.frontend.trace.ops.reduce",
+    "maximum": "tripy.frontend.trace.ops.binary_elementwise",
+    "mean": "tripy.frontend.trace.ops.reduce",
+    "minimum": "tripy.frontend.trace.ops.binary_elementwise",
+    "ones": "tripy.frontend.ops.tensor_initializers",
+    "ones_like": "tripy.frontend.ops.tensor_initializers",
+    "permute": "tripy.frontend.trace.ops.permute",
+    "plugin": "tripy.frontend.trace.ops.plugin",
+    "prod": "tripy.frontend.trace.ops.reduce",
+    "quantize": "tripy.frontend.trace.ops.quantize",
+    "relu": "tripy.frontend.ops.relu",
+    "reshape": "tripy.frontend.trace.ops.reshape",
+    "rsqrt": "tripy.frontend.trace.ops.unary_elementwise",
+    "sigmoid": "tripy.frontend.ops.sigmoid",
+    "silu": "tripy.frontend.ops.silu",
+    "sin": "tripy.frontend.trace.ops.unary_elementwise",
+    "softmax": "tripy.frontend.ops.softmax",
+    "split": "tripy.frontend.trace.ops.split",
+    "sqrt": "tripy.frontend.trace.ops.unary_elementwise",
+    "squeeze": "tripy.frontend.trace.ops.reshape",
+    "sum": "tripy.frontend.trace.ops.reduce",
+    "tanh": "tripy.frontend.trace.ops.unary_elementwise",
+    "transpose": "tripy.frontend.trace.ops.permute",
+    "tril": "tripy.frontend.ops.tensor_initializers",
+    "triu": "tripy.frontend.ops.tensor_initializers",
+    "unsqueeze": "tripy.frontend.trace.ops.unsqueeze",
+    "var": "tripy.frontend.trace.ops.reduce",
+    "where": "tripy.frontend.trace.ops.where",
+    "zeros": "tripy.frontend.ops.tensor_initializers",
+    "zeros_like": "tripy.frontend.ops.tensor_initializers",
+}
 
-def __discover_modules():
-    import importlib
-    import pkgutil
-
-    mods = [tripy]
-    while mods:
-        mod = mods.pop(0)
-
-        yield mod
+__all__ = list(PUBLIC_API_MODULES.keys())
 
-        if hasattr(mod, "__path__"):
-            mods.extend(
-                [
-                    importlib.import_module(f"{mod.__name__}.{submod.name}")
-                    for submod in pkgutil.iter_modules(mod.__path__)
-                ]
-            )
 
+def __getattr__(name: str):
+    import importlib
 
-_ = list(__discover_modules())
+    if name in PUBLIC_API_MODULES:
+        importlib.import_module(PUBLIC_API_MODULES[name])
+        if name in globals():
+            return globals()[name]
 
+    # Submodules are not attributes of the package until they are imported, so `from tripy import <submodule>`
+    # will end up here. Import it directly rather than going through `search_for_missing_attr`.
+    try:
+        return importlib.import_module(f"{__name__}.{name}")
+    except ModuleNotFoundError as err:
+        if err.name != f"{__name__}.{name}":
+            raise
 
-def __getattr__(name: str):
     from tripy.common.exception import search_for_missing_attr
 
     look_in = [(tripy, "tripy")]
     search_for_missing_attr("tripy", name, look_in)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(PUBLIC_API_MODULES))
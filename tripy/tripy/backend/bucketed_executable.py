@@ -0,0 +1,426 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 1993-2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import bisect
+import inspect
+import itertools
+from collections import defaultdict
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+
+import mlir_tensorrt.runtime.api as runtime
+
+import tripy
+import tripy.config as cfg
+from tripy import export, utils
+from tripy.backend.compiler_api import (
+    Compiler,
+    Executable,
+    InputInfo,
+    _load_executable_file,
+    _save_executable_file,
+)
+from tripy.backend.mlir import Compiler as MLIRCompiler
+from tripy.backend.parallel_compile import _compile_in_subprocess, _make_process_pool
+from tripy.common.exception import raise_error
+from tripy.frontend import Tensor
+from tripy.logging import logger
+
+# Bucketed executables are saved in the same layout as executables: a fixed-size prefix, a JSON header,
+# and then the serialized executables of all buckets, each aligned.
+_BUCKETED_EXECUTABLE_MAGIC = b"TRIPYBKT"
+# Version 2 compiled padding and slicing into the executable of each bucket.
+_BUCKETED_EXECUTABLE_FORMAT_VERSION = 2
+
+
+def _pad(tensor: Tensor, target_shape: Sequence[int], dynamic_dims: Sequence[int], pad_value: Any) -> Tensor:
+    from tripy.frontend.trace.ops.concatenate import concatenate
+    from tripy.frontend.trace.ops.fill import full
+    from tripy.frontend.trace.ops.reshape import reshape
+
+    if not dynamic_dims:
+        return tensor
+
+    shape = [tensor.shape[dim] if dim in dynamic_dims else size for dim, size in enumerate(target_shape)]
+    for dim in dynamic_dims:
+        # Dimensions before `dim` have already been padded.
+        pad_shape = list(target_shape[:dim]) + [target_shape[dim] - shape[dim]] + shape[dim + 1 :]
+        tensor = concatenate([tensor, full(pad_shape, pad_value, dtype=tensor.dtype)], dim=dim)
+    # Reshaping to the static bucket shape lets the rest of the function be compiled for static shapes.
+    return reshape(tensor, list(target_shape))
+
+
+def _make_bucket_function(
+    compiler: Compiler,
+    inputs: Dict[str, Tuple[Sequence[Union[int, str]], "tripy.dtype"]],
+    bucket_sizes: Dict[str, int],
+    output_dims: Optional[Sequence[Sequence[Optional[str]]]],
+    pad_value: Any,
+):
+    # Pads the inputs of the function to the sizes of the bucket and slices its outputs back to the sizes of
+    # the inputs, so that both are compiled into the executable of the bucket.
+    def bucket_function(**kwargs):
+        sizes = {}
+        padded_kwargs = {}
+        for name, tensor in kwargs.items():
+            shape, _ = inputs[name]
+            dynamic_dims = [dim for dim, size in enumerate(shape) if isinstance(size, str)]
+            for dim in dynamic_dims:
+                sizes.setdefault(shape[dim], tensor.shape[dim])
+            target_shape = [bucket_sizes.get(size, size) for size in shape]
+            padded_kwargs[name] = _pad(tensor, target_shape, dynamic_dims, pad_value)
+
+        outputs = compiler.func(**padded_kwargs)
+        if output_dims is None:
+            return outputs
+
+        output_list = utils.make_list(outputs)
+        if len(output_list) != len(output_dims):
+            raise_error(
+                "Incorrect number of output dimension names.",
+                [f"The function has {len(output_list)} outputs, but `output_dims` has {len(output_dims)} entries"],
+            )
+
+        sliced_outputs = [
+            out[tuple(slice(None) if dim is None else slice(0, sizes[dim]) for dim in dims)]
+            for out, dims in zip(output_list, output_dims)
+        ]
+        return sliced_outputs[0] if len(sliced_outputs) == 1 else sliced_outputs
+
+    # The runtime inputs keep the names and order of the parameters of the original function.
+    bucket_function.__signature__ = compiler._signature.replace(
+        parameters=[param for param in compiler._signature.parameters.values() if param.name in inputs]
+    )
+    return bucket_function
+
+
+@export.public_api(document_under="compiler")
+class BucketedExecutable:
+    """
+    A collection of executables compiled for static input shapes, called buckets, which together
+    support a range of input shapes. Inputs are padded up to the smallest bucket that fits them and
+    outputs are sliced back to the sizes of the inputs. Padding and slicing are compiled into the
+    executable of each bucket, so calls do not require any additional compilation.
+
+    Static shapes often allow for better kernels than a single executable with dynamic shapes.
+
+    .. seealso:: :class:`Compiler`
+    """
+
+    # The constructor is intentionally undocumented because it is not meant to be called by users.
+    def __init__(
+        self,
+        executables: Dict[Tuple[int, ...], Executable],
+        inputs: Dict[str, Tuple[Sequence[Union[int, str]], "tripy.dtype"]],
+        buckets: Dict[str, Sequence[int]],
+    ) -> None:
+        self._executables = executables
+        self._inputs = inputs
+        self._buckets = buckets
+        self._hit_counts = defaultdict(int)
+
+        # All executables share the same signature.
+        self._signature = inspect.signature(next(iter(self._executables.values())))
+        self._arg_names = list(self._signature.parameters.keys())
+        self.__signature__ = self._signature
+
+    @staticmethod
+    def compile(
+        compiler: Compiler,
+        inputs: Dict[str, Tuple[Sequence[Union[int, str]], "tripy.dtype"]],
+        buckets: Dict[str, Sequence[int]],
+        output_dims: Optional[Sequence[Sequence[Optional[str]]]] = None,
+        pad_value: Any = 0,
+        num_workers: int = 1,
+    ) -> "tripy.BucketedExecutable":
+        """
+        Compiles a function for every combination of bucket sizes.
+
+        Args:
+            compiler: The compiler for the function.
+            inputs: Maps the names of the runtime inputs of the function to their shapes and data types.
+                Each dimension of a shape is either a fixed size or the name of a dimension from ``buckets``.
+                Dimensions with the same name must have the same size at runtime.
+            buckets: Maps the name of each dynamic dimension to the sizes it should be compiled for.
+                At runtime, a dimension is padded up to the smallest of these sizes that is large enough.
+            output_dims: The names of the dimensions of each output of the function, with ``None`` for dimensions
+                that should not be sliced. Named dimensions are sliced back to their sizes at runtime.
+                If this is not provided, the padded outputs are returned as-is.
+            pad_value: The value with which inputs are padded.
+            num_workers: The number of processes to use to build executables in parallel. Tracing and lowering
+                are always performed in this process. If this is 1, executables are built in this process.
+
+        Returns:
+            The bucketed executable.
+
+        .. code-block:: python
+            :linenos:
+            :caption: Example
+
+            def add(a, b):
+                return a + b
+
+            # doc: no-print-locals bucketed_add
+            bucketed_add = tp.BucketedExecutable.compile(
+                tp.Compiler(add),
+                inputs={"a": (("seq", 2), tp.float32), "b": (("seq", 2), tp.float32)},
+                buckets={"seq": [2, 4]},
+                output_dims=[("seq", None)],
+            )
+
+            # This uses the executable compiled for a sequence length of 4.
+            a = tp.ones((3, 2), dtype=tp.float32)
+            out = bucketed_add(a, a)
+            assert cp.from_dlpack(out).shape == (3, 2)
+        """
+        dim_names = list(buckets.keys())
+        used_dim_names = {dim for shape, _ in inputs.values() for dim in shape if isinstance(dim, str)}
+        if used_dim_names != set(dim_names):
+            raise_error(
+                "The dimensions used in input shapes must match those in `buckets`.",
+                [f"Input shapes used: {sorted(used_dim_names)}, but buckets were provided for: {sorted(dim_names)}"],
+            )
+
+        for dim_name, sizes in buckets.items():
+            if not sizes or any(not isinstance(size, int) or size <= 0 for size in sizes):
+                raise_error(
+                    "Bucket sizes must be positive integers.",
+                    [f"For dimension: {dim_name}, bucket sizes were: {sizes}"],
+                )
+        buckets = {dim_name: sorted(set(sizes)) for dim_name, sizes in buckets.items()}
+
+        # Tracing is not thread-safe, so we trace and lower every bucket here and only build the executables in parallel.
+        lowered_functions = {}
+        for bucket in itertools.product(*buckets.values()):
+            sizes = dict(zip(dim_names, bucket))
+            logger.verbose(f"Lowering bucket: {sizes}")
+            # Each bucket accepts the sizes that are larger than those of the previous bucket.
+            min_sizes = {}
+            for dim_name, size in sizes.items():
+                index = buckets[dim_name].index(size)
+                min_sizes[dim_name] = buckets[dim_name][index - 1] + 1 if index else 1
+
+            bucket_compiler = Compiler(
+                _make_bucket_function(compiler, inputs, sizes, output_dims, pad_value), compiler.optimization_level
+            )
+            lowered_functions[bucket] = bucket_compiler._lower(
+                **{
+                    name: InputInfo(
+                        [(min_sizes[dim], sizes[dim], sizes[dim]) if isinstance(dim, str) else dim for dim in shape],
+                        dtype,
+                    )
+                    for name, (shape, dtype) in inputs.items()
+                }
+            )
+
+        if num_workers > 1:
+            with _make_process_pool(num_workers) as executor:
+                futures = {
+                    bucket: [
+                        executor.submit(
+                            _compile_in_subprocess,
+                            str(mlir),
+                            compiler.optimization_level,
+                            cfg.timing_cache_file_path,
+                        )
+                        for mlir, _ in lowered.modules
+                    ]
+                    for bucket, lowered in lowered_functions.items()
+                }
+                built_executables = {
+                    bucket: [runtime.Executable(future.result()[0]) for future in bucket_futures]
+                    for bucket, bucket_futures in futures.items()
+                }
+        else:
+            mlir_compiler = MLIRCompiler(trt_builder_opt_level=compiler.optimization_level)
+            built_executables = {
+                bucket: [mlir_compiler.compile(mlir, flat_ir=flat_ir) for mlir, flat_ir in lowered.modules]
+                for bucket, lowered in lowered_functions.items()
+            }
+
+        executables = {
+            bucket: lowered.make_executable(built_executables[bucket]) for bucket, lowered in lowered_functions.items()
+        }
+        return BucketedExecutable(executables, inputs, buckets)
+
+    def __call__(self, *args, **kwargs) -> Union[Tensor, Sequence[Tensor]]:
+        """
+        Invokes the executable for the smallest bucket that fits the specified tensor arguments.
+
+        Args:
+            *args: Positional arguments. Must be of type :class:`Tensor` .
+            **kwargs: Keyword arguments. Must be of type :class:`Tensor` .
+
+        Returns:
+            The output :class:`Tensor` s of the compiled function.
+        """
+        try:
+            arguments = self._signature.bind(*args, **kwargs).arguments
+        except TypeError as err:
+            raise_error("Incorrect arguments.", [f"{err}.\nNote: Expected the following arguments: {self._arg_names}"])
+
+        sizes = {}
+        for name, tensor in arguments.items():
+            input_shape = tensor.eval().shape
+            expected_shape = self._inputs[name][0]
+            if len(input_shape) != len(expected_shape):
+                raise_error(
+                    "Incorrect input rank.",
+                    [f"For parameter {name}, expected a shape of: {expected_shape} but got: {input_shape}"],
+                )
+
+            for size, expected_size in zip(input_shape, expected_shape):
+                if isinstance(expected_size, str):
+                    if sizes.setdefault(expected_size, size) != size:
+                        raise_error(
+                            f"Inconsistent sizes for dimension: {expected_size}.",
+                            [f"Got sizes: {sizes[expected_size]} and {size}"],
+                        )
+                elif size != expected_size:
+                    raise_error(
+                        "Incorrect input shape.",
+                        [f"For parameter {name}, expected a shape of: {expected_shape} but got: {input_shape}"],
+                    )
+
+        bucket = []
+        for dim_name, bucket_sizes in self._buckets.items():
+            index = bisect.bisect_left(bucket_sizes, sizes[dim_name])
+            if index == len(bucket_sizes):
+                raise_error(
+                    f"Dimension: {dim_name} does not fit into any bucket.",
+                    [f"Size was: {sizes[dim_name]}, but the largest bucket is: {bucket_sizes[-1]}"],
+                )
+            bucket.append(bucket_sizes[index])
+        bucket = tuple(bucket)
+        self._hit_counts[bucket] += 1
+
+        return self._executables[bucket](**arguments)
+
+    @property
+    def bucket_hit_counts(self) -> Dict[Tuple[Tuple[str, int], ...], int]:
+        """
+        The number of calls that were dispatched to each bucket, keyed by the size of each dimension in the bucket.
+
+        .. code-block:: python
+            :linenos:
+            :caption: Example
+
+            def add(a, b):
+                return a + b
+
+            # doc: no-print-locals bucketed_add
+            bucketed_add = tp.BucketedExecutable.compile(
+                tp.Compiler(add),
+                inputs={"a": (("seq",), tp.float32), "b": (("seq",), tp.float32)},
+                buckets={"seq": [2, 4]},
+            )
+
+            a = tp.ones((3,), dtype=tp.float32)
+            bucketed_add(a, a)
+            assert bucketed_add.bucket_hit_counts[(("seq", 4),)] == 1
+            assert bucketed_add.bucket_hit_counts[(("seq", 2),)] == 0
+        """
+        return {tuple(zip(self._buckets.keys(), bucket)): self._hit_counts[bucket] for bucket in self._executables}
+
+    def save(self, path: str) -> None:
+        """
+        Saves the executables for all buckets to a single file.
+
+        Args:
+            path: The name of the file to save the bucketed executable to.
+        """
+        entries = []
+        executables = []
+        for bucket, executable in self._executables.items():
+            entries.append(
+                {
+                    "bucket": bucket,
+                    "arg_names": executable._arg_names,
+                    "output_devices": executable._output_devices,
+                    "profiles": executable._profiles,
+                    "num_executables": len(executable._executables),
+                }
+            )
+            executables.extend(executable._executables)
+
+        _save_executable_file(
+            path,
+            _BUCKETED_EXECUTABLE_MAGIC,
+            _BUCKETED_EXECUTABLE_FORMAT_VERSION,
+            {"inputs": self._inputs, "buckets": self._buckets, "executables": entries},
+            executables,
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "tripy.BucketedExecutable":
+        """
+        Loads a bucketed executable from a file.
+
+        Args:
+            path: The name of the file to load the bucketed executable from.
+
+        Returns:
+            The bucketed executable loaded from the file. Bucket hit counts start from zero.
+
+        .. code-block:: python
+            :linenos:
+            :caption: Save and load bucketed executable
+
+            import os, tempfile
+
+            def add(a, b):
+                return a + b
+
+            # doc: no-print-locals bucketed_add executable_file
+            bucketed_add = tp.BucketedExecutable.compile(
+                tp.Compiler(add),
+                inputs={"a": (("seq",), tp.float32), "b": (("seq",), tp.float32)},
+                buckets={"seq": [2, 4]},
+            )
+
+            with tempfile.TemporaryDirectory() as temp_dir:
+                executable_file = os.path.join(temp_dir, "executable.tpbkt")
+                bucketed_add.save(executable_file)
+                loaded_bucketed_add = tp.BucketedExecutable.load(executable_file)
+        """
+        loaded = _load_executable_file(
+            path, _BUCKETED_EXECUTABLE_MAGIC, _BUCKETED_EXECUTABLE_FORMAT_VERSION, "Bucketed executable"
+        )
+        if loaded is None:
+            raise_error(f"File: {path} is not a bucketed executable.")
+
+        header, runtime_executables = loaded
+
+        executables = {}
+        offset = 0
+        for entry in header["executables"]:
+            if "num_executables" not in entry:
+                # Before version 2, executables expected padded inputs and their outputs were sliced separately.
+                raise_error(
+                    f"Bucketed executable file: {path} was saved by an older version of Tripy and cannot be loaded.",
+                    ["Please compile the bucketed executable again."],
+                )
+            num_executables = entry["num_executables"]
+            executables[tuple(entry["bucket"])] = Executable(
+                runtime_executables[offset : offset + num_executables],
+                entry["arg_names"],
+                entry["output_devices"],
+                entry["profiles"],
+            )
+            offset += num_executables
+
+        inputs = {name: (tuple(shape), dtype) for name, (shape, dtype) in header["inputs"].items()}
+        return BucketedExecutable(executables, inputs, header["buckets"])
@@ -0,0 +1,275 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 1993-2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import ctypes
+import functools
+import hashlib
+import importlib.metadata
+import os
+import tempfile
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import mlir_tensorrt.runtime.api as runtime
+
+import tripy
+import tripy.config as cfg
+from tripy import utils
+from tripy.logging import logger
+
+G_EXECUTABLE_CACHE = None
+G_EXECUTABLE_CACHE_OPTIONS = None
+
+EXECUTABLE_FILE_EXTENSION = ".tpexe"
+
+
+def _get_package_version(name: str) -> str:
+    try:
+        return importlib.metadata.version(name)
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _get_device_identity() -> Tuple:
+    # The runtime does not expose device properties, so we query the CUDA driver directly.
+    # Executables are only valid for the GPU architecture and driver they were built for.
+    CU_DEVICE_ATTRIBUTE_COMPUTE_CAPABILITY_MAJOR = 75
+    CU_DEVICE_ATTRIBUTE_COMPUTE_CAPABILITY_MINOR = 76
+
+    try:
+        libcuda = ctypes.CDLL("libcuda.so.1")
+    except OSError:
+        return ("unknown",)
+
+    device = ctypes.c_int()
+    name = ctypes.create_string_buffer(256)
+    major = ctypes.c_int()
+    minor = ctypes.c_int()
+    driver_version = ctypes.c_int()
+    if any(
+        status != 0
+        for status in (
+            libcuda.cuInit(0),
+            libcuda.cuDeviceGet(ctypes.byref(device), 0),
+            libcuda.cuDeviceGetName(name, len(name), device),
+            libcuda.cuDeviceGetAttribute(ctypes.byref(major), CU_DEVICE_ATTRIBUTE_COMPUTE_CAPABILITY_MAJOR, device),
+            libcuda.cuDeviceGetAttribute(ctypes.byref(minor), CU_DEVICE_ATTRIBUTE_COMPUTE_CAPABILITY_MINOR, device),
+            libcuda.cuDriverGetVersion(ctypes.byref(driver_version)),
+        )
+    ):
+        return ("unknown",)
+    return (name.value.decode(), major.value, minor.value, driver_version.value)
+
+
+@functools.lru_cache(maxsize=None)
+def get_environment_fingerprint() -> Tuple:
+    """
+    Returns the properties of the environment that executables depend on: the versions of Tripy and
+    MLIR-TensorRT (which determines the TensorRT version) along with the identity of the GPU.
+    """
+    return (
+        tripy.__version__,
+        _get_package_version("mlir-tensorrt-compiler"),
+        _get_package_version("mlir-tensorrt-runtime"),
+        _get_device_identity(),
+    )
+
+
+def compute_cache_key(flat_ir: "FlatIR", trt_builder_opt_level: int) -> str:
+    """
+    Computes a key that identifies the executable generated for the given FlatIR.
+
+    The key is derived from the fingerprint of the FlatIR and so does *not* depend on tensor names;
+    two graphs that perform the same computation map to the same key. The key also depends on
+    the software versions and GPU in use so that incompatible executables are never reused.
+
+    Args:
+        flat_ir: The FlatIR to compute a key for.
+        trt_builder_opt_level: The TensorRT builder optimization level the FlatIR will be compiled with.
+
+    Returns:
+        A hex digest identifying the executable.
+    """
+    return hashlib.sha256(
+        repr((get_environment_fingerprint(), trt_builder_opt_level, flat_ir.fingerprint())).encode()
+    ).hexdigest()
+
+
+def is_cacheable(flat_ir: "FlatIR") -> bool:
+    """
+    Returns whether the executable for the given FlatIR should be cached.
+
+    Only graphs whose constants are small enough are cached. This avoids hashing, and for device constants,
+    copying large amounts of data just to compute a key. It also avoids keeping user data alive in the
+    cache, since executables embed the constants of the graph they were compiled from.
+
+    Args:
+        flat_ir: The FlatIR to check.
+
+    Returns:
+        Whether the executable should be cached.
+    """
+    from tripy.flat_ir.ops import ConstantOp
+
+    constant_size = 0
+    for op in flat_ir.ops:
+        if isinstance(op, ConstantOp):
+            constant_size += utils.volume(op.data.shape) * op.outputs[0].dtype.itemsize
+            if constant_size > cfg.executable_cache_max_constant_size:
+                return False
+    return True
+
+
+class ExecutableCache:
+    """
+    A least-recently-used cache of compiled executables.
+
+    Executables are kept in memory and, if a cache directory is provided, are also persisted to disk
+    so that they can be reused across processes.
+    """
+
+    def __init__(self, max_entries: int, cache_dir: Optional[str] = None, max_disk_size: int = 0) -> None:
+        """
+        Args:
+            max_entries: The maximum number of executables to keep in memory.
+            cache_dir: The directory in which to persist executables. If this is empty, nothing is written to disk.
+            max_disk_size: The maximum total size, in bytes, of executables persisted to disk.
+        """
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.max_disk_size = max_disk_size
+        self._entries: "OrderedDict[str, runtime.Executable]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries or (self.cache_dir and os.path.exists(self._path(key)))
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + EXECUTABLE_FILE_EXTENSION)
+
+    def _insert(self, key: str, executable: runtime.Executable) -> None:
+        self._entries[key] = executable
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, key: str) -> Optional[runtime.Executable]:
+        """
+        Retrieves an executable from the cache.
+
+        Args:
+            key: The key of the executable, as computed by `compute_cache_key`.
+
+        Returns:
+            The executable if it was found and None otherwise.
+        """
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            logger.verbose(f"Found executable: {key} in the in-memory executable cache.")
+            return self._entries[key]
+
+        if not self.cache_dir:
+            return None
+
+        path = self._path(key)
+        try:
+            executable_bytes = utils.load_file(path, mode="rb")
+        except OSError:
+            return None
+
+        try:
+            executable = runtime.Executable(executable_bytes)
+        except Exception as err:
+            logger.warning(f"Could not load cached executable from: {path}, ignoring.\nNote: Error was: {err}")
+            return None
+
+        # Update the modification time so that eviction from disk is also least-recently-used.
+        os.utime(path)
+        logger.verbose(f"Loaded executable: {key} from the on-disk executable cache.")
+        self._insert(key, executable)
+        return executable
+
+    def put(self, key: str, executable: runtime.Executable) -> None:
+        """
+        Adds an executable to the cache, evicting the least recently used executables if needed.
+
+        Args:
+            key: The key of the executable, as computed by `compute_cache_key`.
+            executable: The executable.
+        """
+        self._insert(key, executable)
+
+        if not self.cache_dir:
+            return
+
+        try:
+            # Only the current user should be able to add executables to the cache.
+            os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+            # Write to a temporary file first so that concurrent readers never see a partially written executable.
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir)
+            with os.fdopen(fd, "wb") as f:
+                f.write(executable.serialize())
+            os.replace(tmp_path, self._path(key))
+        except OSError as err:
+            logger.warning(f"Could not write executable to cache directory: {self.cache_dir}.\nNote: Error was: {err}")
+            return
+
+        self._evict_from_disk()
+
+    def _evict_from_disk(self) -> None:
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(EXECUTABLE_FILE_EXTENSION):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_disk_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total_size -= size
+            logger.verbose(f"Evicted: {path} from the on-disk executable cache.")
+
+    def clear(self) -> None:
+        """
+        Removes all executables from the in-memory cache. Executables persisted on disk are not affected.
+        """
+        self._entries.clear()
+
+
+def get_executable_cache() -> ExecutableCache:
+    """
+    Returns the global executable cache, creating it if the relevant configuration options have changed.
+    """
+    global G_EXECUTABLE_CACHE, G_EXECUTABLE_CACHE_OPTIONS
+
+    options = (cfg.executable_cache_max_entries, cfg.executable_cache_dir, cfg.executable_cache_max_disk_size)
+    if G_EXECUTABLE_CACHE is None or G_EXECUTABLE_CACHE_OPTIONS != options:
+        G_EXECUTABLE_CACHE = ExecutableCache(*options)
+        G_EXECUTABLE_CACHE_OPTIONS = options
+    return G_EXECUTABLE_CACHE
@@ -15,24 +15,64 @@
 # limitations under the License.
 #
 
+import asyncio
 import base64
 import inspect
+import mmap
 import numbers
+import struct
 from dataclasses import dataclass
-from typing import Callable, Sequence, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 import mlir_tensorrt.runtime.api as runtime
 
+import tripy
+import tripy.config as cfg
 from tripy import export, utils
 from tripy.backend.mlir import Compiler as MLIRCompiler
 from tripy.backend.mlir import Executor
 from tripy.backend.mlir import utils as mlir_utils
 from tripy.common.exception import raise_error
-from tripy.common.shape_bounds import ShapeBounds
+from tripy.common.shape_bounds import ShapeBounds, select_profile
 from tripy.frontend import Tensor, Trace
+from tripy.logging import logger
 from tripy.utils import json as json_utils
 
 
+def _parse_shape_bounds(shape: Sequence[Union[int, Tuple[int, int, int]]]) -> ShapeBounds:
+    min_shape = []
+    opt_shape = []
+    max_shape = []
+    for elem in shape:
+        if isinstance(elem, numbers.Number):
+            elem = (elem,) * 3
+        elif isinstance(elem, Sequence):
+            if not all(isinstance(val, numbers.Number) for val in elem):
+                raise_error(
+                    "Shape values must be numbers.",
+                    [f"Shape: {shape} contains an element: {repr(elem)} with non-numerical value(s)"],
+                )
+            if len(elem) != 3:
+                raise_error(
+                    "Incorrect number of shape values provided.",
+                    [
+                        f"Exactly 3 shape values must be provided for each dimension (min/opt/max)"
+                        f" but got: {len(elem)} values in shape: {shape}. "
+                    ],
+                )
+        else:
+            raise_error(
+                "Shape values should be either a single number or a Tuple specifying min/opt/max bounds.",
+                [f"Shape: {shape} contains an invalid element: {elem}"],
+            )
+
+        min_shape.append(elem[0])
+        opt_shape.append(elem[1])
+        max_shape.append(elem[2])
+
+    return ShapeBounds(tuple(min_shape), tuple(opt_shape), tuple(max_shape))
+
+
 @export.public_api(document_under="compiler")
 class InputInfo:
     """
@@ -40,13 +80,22 @@ class InputInfo:
     """
 
     def __init__(
-        self, shape: Sequence[Union[int, Tuple[int], Tuple[int, int], Tuple[int, int, int]]], dtype: "tripy.dtype"
+        self,
+        shape: Sequence[Union[int, Tuple[int], Tuple[int, int], Tuple[int, int, int]]],
+        dtype: "tripy.dtype",
+        extra_profiles: Sequence[Sequence[Union[int, Tuple[int, int, int]]]] = [],
     ) -> None:
         """
         Args:
             shape: The shape of the input.
                 To indicate dynamic dimensions, provide the minimum, optimum, and maximum values for the dimension.
             dtype: The data type of the input.
+            extra_profiles: The shapes of the input for additional optimization profiles, specified in the same
+                format as ``shape``. A separate engine is built for each profile and the compiled function
+                selects the one best suited to the shapes of its inputs at runtime. This can improve
+                performance when inputs vary widely in size, at the cost of longer compile times and larger executables.
+                Since engines do not share weights, each profile holds its own copy of the function's constants,
+                so an executable with ``N`` profiles needs roughly ``N`` times the device memory for weights.
 
         .. code-block:: python
             :linenos:
@@ -66,39 +115,27 @@ class InputInfo:
             assert inp.shape_bounds.min == (1, 4)
             assert inp.shape_bounds.opt == (2, 4)
             assert inp.shape_bounds.max == (3, 4)
+
+        .. code-block:: python
+            :linenos:
+            :caption: Multiple Optimization Profiles
+
+            # Short sequences will use the first profile while long sequences will use the second.
+            inp = tp.InputInfo((1, (1, 64, 128)), dtype=tp.float32, extra_profiles=[(1, (129, 1024, 4096))])
+            assert len(inp.profiles) == 2
+            assert inp.profiles[1].opt == (1, 1024)
         """
         # TODO (#252): Allow `shape` to be a shape tensor
-        min_shape = []
-        opt_shape = []
-        max_shape = []
-        for elem in shape:
-            if isinstance(elem, numbers.Number):
-                elem = (elem,) * 3
-            elif isinstance(elem, Sequence):
-                if not all(isinstance(val, numbers.Number) for val in elem):
-                    raise_error(
-                        "Shape values must be numbers.",
-                        [f"Shape: {shape} contains an element: {repr(elem)} with non-numerical value(s)"],
-                    )
-                if len(elem) != 3:
-                    raise_error(
-                        "Incorrect number of shape values provided.",
-                        [
-                            f"Exactly 3 shape values must be provided for each dimension (min/opt/max)"
-                            f" but got: {len(elem)} values in shape: {shape}. "
-                        ],
-                    )
-            else:
+        self.profiles = [_parse_shape_bounds(shape)] + [_parse_shape_bounds(profile) for profile in extra_profiles]
+
+        for profile in self.profiles[1:]:
+            if len(profile.min) != len(self.profiles[0].min):
                 raise_error(
-                    "Shape values should be either a single number or a Tuple specifying min/opt/max bounds.",
-                    [f"Shape: {shape} contains an invalid element: {elem}"],
+                    "All optimization profiles of an input must have the same rank.",
+                    [f"Shape bounds were: {', '.join(str(profile) for profile in self.profiles)}"],
                 )
 
-            min_shape.append(elem[0])
-            opt_shape.append(elem[1])
-            max_shape.append(elem[2])
-
-        self.shape_bounds = ShapeBounds(tuple(min_shape), tuple(opt_shape), tuple(max_shape))
+        self.shape_bounds = self.profiles[0]
         self.dtype = dtype
 
     def __str__(self) -> str:
@@ -115,6 +152,52 @@ class ArgInfo:
     """The datatype of the argument"""
 
 
+@export.public_api(document_under="compiler")
+class ExecutionFuture:
+    """
+    The result of an asynchronous invocation of an :class:`Executable` .
+    It can also be awaited from a coroutine.
+
+    .. seealso:: :func:`Executable.call_async`
+    """
+
+    # The constructor is intentionally undocumented because it is not meant to be called by users.
+    def __init__(self, pending, out):
+        self._pending = pending
+        self._out = out
+        self._result = None
+
+    def done(self) -> bool:
+        """
+        Returns:
+            Whether the execution has completed.
+        """
+        return self._pending.done
+
+    def result(self) -> Union[Tensor, Sequence[Tensor]]:
+        """
+        Waits for the execution to complete.
+
+        Returns:
+            The output :class:`Tensor` s of the compiled function. If ``out`` was provided, it is returned.
+        """
+        if self._result is None:
+            outputs = self._pending.wait()
+            if self._out is not None:
+                output_tensors = self._out
+            else:
+                # TODO (#192): avoid get_stack_info in runtime
+                output_tensors = [Tensor(output) for output in outputs]
+            self._result = output_tensors[0] if len(output_tensors) == 1 else output_tensors
+        return self._result
+
+    def __await__(self):
+        # Synchronize on a worker thread. Note that this only frees up the event loop while waiting if the
+        # runtime releases the GIL during stream synchronization, which requires a recent MLIR-TensorRT runtime.
+        yield from asyncio.get_running_loop().run_in_executor(None, self._pending.wait).__await__()
+        return self.result()
+
+
 @export.public_api(document_under="compiler")
 class Executable:
     """
@@ -125,9 +208,14 @@ class Executable:
 
     # The constructor is intentionally undocumented because it is not meant to be called by users.
     # TODO(#155): output_devices is not needed after they can be queried from executable
-    def __init__(self, executable, arg_names, output_devices):
-        self._executable = executable
-        self._executor = Executor(self._executable)
+    def __init__(self, executable, arg_names, output_devices, profiles=None):
+        # An executable compiled with multiple optimization profiles contains one MLIR-TRT executable per profile.
+        # `profiles` then holds the shape bounds of every input for each of those executables.
+        self._executables = list(executable) if isinstance(executable, Sequence) else [executable]
+        self._executors = [Executor(exe) for exe in self._executables]
+        self._profiles = profiles
+        self._executable = self._executables[0]
+        self._executor = self._executors[0]
         self._arg_names = arg_names
         self._output_devices = output_devices
         self._executable_signature = self._executable.get_signature("main")
@@ -141,16 +229,19 @@ class Executable:
 
         self.__signature__ = inspect.Signature(params, return_annotation=return_annotation)
 
-    def __call__(self, *args, **kwargs) -> Union[Tensor, Sequence[Tensor]]:
+    def __call__(self, *args, out: Union[Tensor, Sequence[Tensor]] = None, **kwargs) -> Union[Tensor, Sequence[Tensor]]:
         """
         Invokes the executable with the specified tensor arguments.
 
         Args:
             *args: Positional arguments. Must be of type :class:`Tensor` .
+            out: Tensor(s) to write the outputs into. These must have the same shapes and data types as the outputs.
+                If this is not provided, new output tensors are allocated.
+                If the compiled function has a parameter called ``out``, it is treated as that parameter instead.
             **kwargs: Keyword arguments. Must be of type :class:`Tensor` .
 
         Returns:
-            The output :class:`Tensor` s of the compiled function.
+            The output :class:`Tensor` s of the compiled function. If ``out`` was provided, it is returned.
 
 
         .. code-block:: python
@@ -168,7 +259,66 @@ class Executable:
             b = tp.ones((1,), dtype=tp.float32)
 
             out = compiled_add(a, b)
+
+        .. code-block:: python
+            :linenos:
+            :caption: Writing Into Preallocated Outputs
+
+            def add(a, b):
+                return a + b
+
+            # doc: no-print-locals compiler compiled_add
+            compiler = tp.Compiler(add)
+            compiled_add = compiler.compile(tp.InputInfo((1,), dtype=tp.float32), tp.InputInfo((1,), dtype=tp.float32))
+
+            a = tp.ones((1,), dtype=tp.float32)
+            b = tp.ones((1,), dtype=tp.float32)
+            out = tp.zeros((1,), dtype=tp.float32)
+
+            compiled_add(a, b, out=out)
+            assert np.array_equal(cp.from_dlpack(out).get(), np.array([2.0], dtype=np.float32))
         """
+        return self.call_async(*args, out=out, **kwargs).result()
+
+    def call_async(self, *args, out: Union[Tensor, Sequence[Tensor]] = None, **kwargs) -> "ExecutionFuture":
+        """
+        Enqueues the executable with the specified tensor arguments without waiting for it to complete.
+        This allows host work, like preparing the next batch of inputs, to overlap with execution on the device.
+
+        Accessing the memory of an output, for example through DLPack, waits for the execution to complete.
+
+        Args:
+            *args: Positional arguments. Must be of type :class:`Tensor` .
+            out: Tensor(s) to write the outputs into. These must have the same shapes and data types as the outputs.
+                If this is not provided, new output tensors are allocated.
+                If the compiled function has a parameter called ``out``, it is treated as that parameter instead.
+            **kwargs: Keyword arguments. Must be of type :class:`Tensor` .
+
+        Returns:
+            A future for the output :class:`Tensor` s of the compiled function.
+
+        .. code-block:: python
+            :linenos:
+            :caption: Example
+
+            def add(a, b):
+                return a + b
+
+            # doc: no-print-locals compiler compiled_add future
+            compiler = tp.Compiler(add)
+            compiled_add = compiler.compile(tp.InputInfo((1,), dtype=tp.float32), tp.InputInfo((1,), dtype=tp.float32))
+
+            a = tp.ones((1,), dtype=tp.float32)
+            b = tp.ones((1,), dtype=tp.float32)
+
+            future = compiled_add.call_async(a, b)
+            out = future.result()
+            assert np.array_equal(cp.from_dlpack(out).get(), np.array([2.0], dtype=np.float32))
+        """
+        if out is not None and "out" in self._arg_names:
+            kwargs["out"] = out
+            out = None
+
         input_tensors = []
 
         input_tensors.extend(args)
@@ -206,8 +356,33 @@ class Executable:
         for tensor in input_tensors:
             tensor.eval()
 
+        out_arrays = None
+        if out is not None:
+            out = list(out) if isinstance(out, Sequence) else [out]
+            out_arrays = [tensor.eval() for tensor in out]
+
+        executor = self._executor
+        if len(self._executors) > 1:
+            input_shapes = [tensor.trace_tensor.producer.data.shape for tensor in input_tensors]
+            profile_index = select_profile(self._profiles, input_shapes)
+            if profile_index is None:
+                raise_error(
+                    "Input shapes are not supported by any optimization profile of the executable.",
+                    [f"Input shapes were: {input_shapes}.\n"]
+                    + [
+                        f"Note: Profile {index} supports: "
+                        + ", ".join(
+                            f"{name}: (min={bounds.min}, max={bounds.max})"
+                            for name, bounds in zip(self._arg_names, profile)
+                        )
+                        + "\n"
+                        for index, profile in enumerate(self._profiles)
+                    ],
+                )
+            executor = self._executors[profile_index]
+
         try:
-            executor_outputs = self._executor.execute(self._output_devices, input_tensors)
+            pending = executor.enqueue(self._output_devices, input_tensors, out_arrays)
         except runtime.MTRTException as err:
             # TODO: Evaluate whether this should be moved into the executor
             if "function expects a memref type with element type" in str(err):
@@ -224,17 +399,19 @@ class Executable:
                         )
             raise
 
-        # TODO (#192): avoid get_stack_info in runtime
-        output_tensors = [Tensor(output) for output in executor_outputs]
-        if len(output_tensors) == 1:
-            output_tensors = output_tensors[0]
-        return output_tensors
+        return ExecutionFuture(pending, out)
 
     def _get_arg_info(self, idx):
         arg = self._executable_signature.get_arg(idx)
         arg = runtime.MemRefType(arg)
-        arg_bound = self._executable_signature.get_arg_bound(idx)
-        shape_bounds = tuple(zip(arg_bound.min(), arg_bound.max()))
+        # With multiple optimization profiles, the supported shapes are the union of those of all profiles.
+        arg_bounds = [exe.get_signature("main").get_arg_bound(idx) for exe in self._executables]
+        shape_bounds = tuple(
+            (min(mins), max(maxes))
+            for mins, maxes in zip(
+                zip(*[arg_bound.min() for arg_bound in arg_bounds]), zip(*[arg_bound.max() for arg_bound in arg_bounds])
+            )
+        )
         return ArgInfo(shape_bounds, mlir_utils.convert_runtime_dtype_to_tripy_dtype(arg.dtype))
 
     def get_input_info(self) -> Sequence[ArgInfo]:
@@ -307,11 +484,23 @@ class Executable:
             compiled_add = compiler.compile(tp.InputInfo(([1, 2, 3],), dtype=tp.float32), tp.InputInfo(([1, 2, 3],), dtype=tp.float32))
 
             with tempfile.TemporaryDirectory() as temp_dir:
-                executable_file = os.path.join(temp_dir, "executable.json")
+                executable_file = os.path.join(temp_dir, "executable.tpexe")
                 compiled_add.save(executable_file)
                 assert os.path.exists(executable_file)
         """
-        json_utils.save(self, path)
+        _save_executable_file(
+            path,
+            _EXECUTABLE_MAGIC,
+            _EXECUTABLE_FORMAT_VERSION,
+            {
+                "arg_names": self._arg_names,
+                "output_devices": self._output_devices,
+                "num_input_args": self._executable_signature.get_num_input_args(),
+                "num_output_args": self._executable_signature.get_num_output_args(),
+                "profiles": self._profiles,
+            },
+            self._executables,
+        )
 
     @classmethod
     def load(cls, path: str) -> "tripy.Executable":
@@ -338,12 +527,121 @@ class Executable:
             compiled_add = compiler.compile(tp.InputInfo(([1, 2, 3],), dtype=tp.float32), tp.InputInfo(([1, 2, 3],), dtype=tp.float32))
 
             with tempfile.TemporaryDirectory() as temp_dir:
-                executable_file = os.path.join(temp_dir, "executable.json")
+                executable_file = os.path.join(temp_dir, "executable.tpexe")
                 compiled_add.save(executable_file)
                 assert os.path.exists(executable_file)
                 loaded_executable = tp.Executable.load(executable_file)
         """
-        return json_utils.load(path)
+        loaded = _load_executable_file(path, _EXECUTABLE_MAGIC, _EXECUTABLE_FORMAT_VERSION, "Executable")
+        if loaded is None:
+            # Executables used to be saved as JSON, so we continue to support loading those.
+            return json_utils.load(path)
+
+        header, executables = loaded
+        return Executable(
+            executables,
+            header["arg_names"],
+            header["output_devices"],
+            header.get("profiles"),
+        )
+
+
+def _save_executable_file(
+    path: str, magic: bytes, format_version: int, header: Dict[str, Any], executables: Sequence[runtime.Executable]
+) -> None:
+    """
+    Saves executables to a file in the layout described by `_EXECUTABLE_PREFIX`. The Tripy version and
+    the location of each executable in the file are added to `header`.
+    """
+    # Executables are stored back-to-back, each one aligned.
+    executables_bytes = [exe.serialize() for exe in executables]
+    executable_ranges = []
+    data_size = 0
+    for executable_bytes in executables_bytes:
+        data_size += -data_size % _EXECUTABLE_DATA_ALIGNMENT
+        executable_ranges.append((data_size, len(executable_bytes)))
+        data_size += len(executable_bytes)
+
+    header = json_utils.to_json(
+        {"tripy_version": tripy.__version__, **header, "executable_ranges": executable_ranges}
+    ).encode()
+
+    prefix_size = _EXECUTABLE_PREFIX.size + len(header)
+    padding = -prefix_size % _EXECUTABLE_DATA_ALIGNMENT
+    with open(path, "wb") as f:
+        f.write(_EXECUTABLE_PREFIX.pack(magic, format_version, len(header), prefix_size + padding, data_size))
+        f.write(header)
+        f.write(b"\0" * padding)
+        data_start = f.tell()
+        for (offset, _), executable_bytes in zip(executable_ranges, executables_bytes):
+            # Seeking past the end of the file zero-fills the gap.
+            f.seek(data_start + offset)
+            f.write(executable_bytes)
+
+
+def _load_executable_file(
+    path: str, magic: bytes, format_version: int, description: str
+) -> Optional[Tuple[Dict[str, Any], List[runtime.Executable]]]:
+    """
+    Loads a file saved by `_save_executable_file`, returning its header and executables,
+    or None if the file does not start with `magic`.
+    """
+    with open(path, "rb") as f:
+        if f.read(len(magic)) != magic:
+            return None
+
+        # Map the file rather than reading it so that the serialized executables are passed
+        # to the runtime directly from the page cache.
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as contents:
+            _, file_format_version, header_size, data_offset, data_size = _EXECUTABLE_PREFIX.unpack_from(contents)
+            if file_format_version > format_version:
+                raise_error(
+                    f"{description} file: {path} uses an unsupported format version.",
+                    [
+                        f"Note: File format version was: {file_format_version}, "
+                        f"but this version of Tripy only supports versions up to: {format_version}"
+                    ],
+                )
+
+            header_start = _EXECUTABLE_PREFIX.size
+            header = json_utils.from_json(contents[header_start : header_start + header_size].decode())
+            if header["tripy_version"] != tripy.__version__:
+                logger.warning(
+                    f"{description} file: {path} was saved with Tripy version: {header['tripy_version']}, "
+                    f"but the current version is: {tripy.__version__}."
+                )
+
+            # Files saved before multiple optimization profiles were supported contain a single executable.
+            executable_ranges = header.get("executable_ranges", [(0, data_size)])
+            executables = []
+            with memoryview(contents) as view:
+                for offset, size in executable_ranges:
+                    start = data_offset + offset
+                    # The views must be released before the mapping can be closed.
+                    with view[start : start + size] as executable_view:
+                        executables.append(_make_runtime_executable(executable_view))
+
+    return header, executables
+
+
+def _make_runtime_executable(buffer: memoryview) -> runtime.Executable:
+    # The runtime copies the executable, so the buffer only needs to live for the duration of this call.
+    try:
+        return runtime.Executable(buffer)
+    except TypeError:
+        # Older runtimes can only construct executables from `bytes`.
+        return runtime.Executable(bytes(buffer))
+
+
+# Executables are saved as a fixed-size prefix, followed by a JSON header and then the serialized executables.
+# The prefix contains: magic bytes, format version, header size, offset of the executable data, and its size.
+# Files containing other kinds of executables, like bucketed executables, use the same layout with different magic bytes.
+_EXECUTABLE_MAGIC = b"TRIPYEXE"
+# Version 2 added support for storing one executable per optimization profile.
+_EXECUTABLE_FORMAT_VERSION = 2
+_EXECUTABLE_PREFIX = struct.Struct("<8sIIQQ")
+# The executable data is aligned so that it can be used in-place from a memory-mapped file.
+_EXECUTABLE_DATA_ALIGNMENT = 64
 
 
 @json_utils.Encoder.register(Executable)
@@ -351,20 +649,38 @@ def encode_executable(executable):
     return {
         "arg_names": executable._arg_names,
         "output_devices": executable._output_devices,
-        "executable": base64.b64encode(executable._executable.serialize()).decode(),
+        "profiles": executable._profiles,
+        "executables": [base64.b64encode(exe.serialize()).decode() for exe in executable._executables],
     }
 
 
 @json_utils.Decoder.register(Executable)
 def decode_executable(executable_dict):
-    executable_bytes = base64.b64decode(executable_dict["executable"])
+    encoded_executables = executable_dict.get("executables", [executable_dict.get("executable")])
     return Executable(
-        runtime.Executable(executable_bytes),
+        [runtime.Executable(base64.b64decode(encoded)) for encoded in encoded_executables],
         executable_dict["arg_names"],
         executable_dict["output_devices"],
+        executable_dict.get("profiles"),
     )
 
 
+@dataclass
+class _LoweredFunction:
+    """
+    A function that has been traced and lowered to MLIR, but not yet compiled.
+    """
+
+    arg_names: List[str]
+    output_devices: List["tripy.device"]
+    profiles: Optional[List[List[ShapeBounds]]]
+    modules: List[Tuple["ir.Module", "FlatIR"]]
+    """The MLIR module and corresponding FlatIR for each optimization profile"""
+
+    def make_executable(self, executables: List[runtime.Executable]) -> Executable:
+        return Executable(executables, self.arg_names, output_devices=self.output_devices, profiles=self.profiles)
+
+
 # TODO (#230): Support collections of tensors in args/kwargs
 @export.public_api(document_under="compiler/index.rst")
 class Compiler:
@@ -484,10 +800,19 @@ class Compiler:
             # Note that we cannot provide `b` as an argument to the compiled function.
             out = compiled_add(a)
         """
+        lowered = self._lower(*args, **kwargs)
+
+        compiler = MLIRCompiler(trt_builder_opt_level=self.optimization_level)
+        return lowered.make_executable([compiler.compile(mlir, flat_ir=flat_ir) for mlir, flat_ir in lowered.modules])
+
+    def _lower(self, *args, **kwargs) -> "_LoweredFunction":
+        """
+        Traces the function with the provided arguments and lowers it to MLIR, once per optimization profile.
+        Takes the same arguments as `compile`.
+        """
 
-        shapes = []
         trace_input_map = {}
-        input_names = set()
+        input_info_map = {}
 
         def process_arg(name, arg):
             if isinstance(arg, InputInfo):
@@ -500,8 +825,7 @@ class Compiler:
                 tensor.name = name
 
                 trace_input_map[name] = tensor
-                shapes.append(arg.shape_bounds)
-                input_names.add(name)
+                input_info_map[name] = arg
 
                 return tensor
             return arg
@@ -516,7 +840,24 @@ class Compiler:
 
         # Figure out the signature of the compiled function. This should include only the arguments that were provided
         # as `InputInfo`s, but the order needs to match the signature of the original function.
-        compiled_arg_names = [name for name in self._signature.parameters.keys() if name in input_names]
+        compiled_arg_names = [name for name in self._signature.parameters.keys() if name in input_info_map]
+
+        # Inputs with a single profile use it for every optimization profile.
+        input_infos = [input_info_map[name] for name in compiled_arg_names]
+        num_profiles = max([len(info.profiles) for info in input_infos], default=1)
+        for name, info in zip(compiled_arg_names, input_infos):
+            if len(info.profiles) not in (1, num_profiles):
+                raise_error(
+                    "Inconsistent number of optimization profiles.",
+                    [
+                        f"All inputs must have either 1 or {num_profiles} profiles, "
+                        f"but input: {name} has {len(info.profiles)} profiles."
+                    ],
+                )
+        profiles = [
+            [info.profiles[index if len(info.profiles) > 1 else 0] for info in input_infos]
+            for index in range(num_profiles)
+        ]
 
         trace_outputs = utils.make_list(self.func(*new_args, **new_kwargs))
 
@@ -535,15 +876,23 @@ class Compiler:
 
         # Order of trace inputs also needs to match that of the compiled_arg_names
         trace_inputs = [trace_input_map[name] for name in compiled_arg_names]
-        trace = Trace(trace_outputs, trace_inputs, shapes=shapes)
-
-        flat_ir = trace.to_flat_ir()
-        mlir = flat_ir.to_mlir()
-        compiler = MLIRCompiler(trt_builder_opt_level=self.optimization_level)
-        executable = compiler.compile(mlir, flat_ir=flat_ir)
-
-        return Executable(
-            executable,
+        trace = Trace(trace_outputs, trace_inputs, shapes=profiles[0])
+        if cfg.enable_constant_folding:
+            trace.fold_constants()
+        if cfg.enable_common_subexpression_elimination:
+            trace.eliminate_common_subexpressions()
+
+        # MLIR-TRT only supports a single shape profile per function argument, so we build
+        # a separate executable for each optimization profile.
+        modules = []
+        for shapes in profiles:
+            trace.shapes = shapes
+            flat_ir = trace.to_flat_ir()
+            modules.append((flat_ir.to_mlir(), flat_ir))
+
+        return _LoweredFunction(
             compiled_arg_names,
-            output_devices=[out.device for out in trace.outputs],
+            [out.device for out in trace.outputs],
+            profiles if num_profiles > 1 else None,
+            modules,
         )
@@ -15,15 +15,19 @@
 # limitations under the License.
 #
 
-from typing import List
+import threading
+import weakref
+from collections import OrderedDict, defaultdict
+from typing import List, Optional
 
 import mlir_tensorrt.compiler.api as compiler
 import mlir_tensorrt.runtime.api as runtime
 
+import tripy.config as cfg
 from tripy.backend.utils import TensorInfo
 from tripy.common import Array, datatype, device
 from tripy.common.exception import raise_error
-from tripy.utils import log_time, make_tuple
+from tripy.utils import log_time, make_tuple, volume
 
 G_RUNTIME_CLIENT = None
 
@@ -36,15 +40,259 @@ def _get_runtime_client() -> runtime.RuntimeClient:
     return G_RUNTIME_CLIENT
 
 
+class OutputBufferPool:
+    """
+    Recycles output buffers across executions.
+
+    A buffer is returned to the pool once the `Array` wrapping it is garbage collected,
+    i.e. once the caller no longer holds on to the corresponding output tensor.
+    """
+
+    # The maximum number of unused buffers to retain for each shape/data type/device.
+    MAX_FREE_BUFFERS_PER_KEY = 4
+
+    def __init__(self) -> None:
+        self.free_buffers = defaultdict(list)
+        self.num_allocations = 0
+        self.num_reuses = 0
+
+    def allocate(self, shape, dtype: "tripy.dtype", out_device: device) -> Array:
+        key = (tuple(shape), dtype, out_device.kind, out_device.index)
+        free_buffers = self.free_buffers[key]
+        if free_buffers:
+            self.num_reuses += 1
+            array = Array._from_memref(free_buffers.pop(), shape, dtype)
+        else:
+            self.num_allocations += 1
+            array = Array(None, shape=shape, dtype=dtype, device=out_device)
+
+        weakref.finalize(array, self._release, key, array.memref_value)
+        return array
+
+    def _release(self, key, memref) -> None:
+        free_buffers = self.free_buffers[key]
+        if len(free_buffers) < self.MAX_FREE_BUFFERS_PER_KEY:
+            free_buffers.append(memref)
+
+
+class StagingBufferPool:
+    """
+    Stages host-resident inputs and outputs of an executor on the device.
+
+    All copies are enqueued on the executor's stream so that they are ordered with respect to executions
+    without blocking the host. The device buffers that host outputs are written into are recycled
+    across executions once the executions using them have completed.
+    """
+
+    # The maximum number of unused buffers to retain for each shape/data type.
+    MAX_FREE_BUFFERS_PER_KEY = 4
+
+    def __init__(self, runtime_client, device, stream) -> None:
+        self.runtime_client = runtime_client
+        self.device = device
+        self.stream = stream
+        self.free_buffers = defaultdict(list)
+        self.num_allocations = 0
+        self.num_reuses = 0
+        self.num_bytes_copied_to_device = 0
+        self.num_bytes_copied_to_host = 0
+
+    @staticmethod
+    def _nbytes(memref) -> int:
+        from tripy.backend.mlir.utils import convert_runtime_dtype_to_tripy_dtype
+
+        return int(volume(memref.shape) * convert_runtime_dtype_to_tripy_dtype(memref.dtype).itemsize)
+
+    def copy_to_device(self, host_memref):
+        """
+        Enqueues a copy of a host input to newly allocated device memory.
+        """
+        # NOTE: The runtime cannot copy into an existing device buffer, so inputs cannot be staged in pooled buffers.
+        self.num_bytes_copied_to_device += self._nbytes(host_memref)
+        return self.runtime_client.copy_to_device(host_memref=host_memref, device=self.device, stream=self.stream)
+
+    def acquire(self, host_memref):
+        """
+        Returns a device buffer with the same shape and data type as the specified host output.
+        The contents of the buffer are uninitialized since the execution overwrites them.
+        """
+        key = (tuple(host_memref.shape), host_memref.dtype)
+        free_buffers = self.free_buffers[key]
+        if free_buffers:
+            self.num_reuses += 1
+            return free_buffers.pop()
+
+        self.num_allocations += 1
+        return self.runtime_client.create_memref(
+            shape=list(host_memref.shape), dtype=host_memref.dtype, device=self.device, stream=self.stream
+        )
+
+    def copy_to_host(self, device_memref, host_memref) -> None:
+        """
+        Enqueues a copy of a staged output back to its host memory.
+        """
+        self.num_bytes_copied_to_host += self._nbytes(device_memref)
+        self.runtime_client.copy_to_host(
+            device_memref=device_memref, existing_host_memref=host_memref, stream=self.stream
+        )
+
+    def release(self, device_memref) -> None:
+        """
+        Returns a buffer to the pool. This must only be called once all work using the buffer has completed.
+        """
+        free_buffers = self.free_buffers[(tuple(device_memref.shape), device_memref.dtype)]
+        if len(free_buffers) < self.MAX_FREE_BUFFERS_PER_KEY:
+            free_buffers.append(device_memref)
+
+
+class PendingExecution:
+    """
+    An execution that has been enqueued on a stream but whose outputs may not be ready yet.
+    """
+
+    def __init__(self, queue: "ExecutionQueue", outputs: List[Array], args: List, staging_buffers: List) -> None:
+        self.queue = queue
+        self.outputs = outputs
+        # The arguments must stay alive until the execution has completed since they may be
+        # temporary copies of the inputs and outputs or host memory that is still being copied.
+        self.args = args
+        self.staging_buffers = staging_buffers
+        self.done = False
+
+    def wait(self) -> List[Array]:
+        """
+        Blocks until the execution has completed.
+
+        Returns:
+            The output arrays.
+        """
+        if not self.done:
+            self.queue.synchronize()
+        return self.outputs
+
+    def _finish(self) -> None:
+        for out in self.outputs:
+            # An array may have been reused as the output of a later execution.
+            if out._pending_execution is self:
+                out._pending_execution = None
+
+        for memref in self.staging_buffers:
+            self.queue.staging_buffer_pool.release(memref)
+
+        self.args = None
+        self.staging_buffers = None
+        self.done = True
+
+
+class ExecutionQueue:
+    """
+    Tracks the executions enqueued on a stream that have not been synchronized yet.
+
+    Since work on a stream completes in order, synchronizing the stream once completes every
+    execution enqueued so far.
+    """
+
+    def __init__(self, stream, staging_buffer_pool: StagingBufferPool) -> None:
+        self.stream = stream
+        self.staging_buffer_pool = staging_buffer_pool
+        self.in_flight: List[PendingExecution] = []
+        self.lock = threading.Lock()
+
+    def enqueue(
+        self, session, in_args: List, out_args: List, outputs: List[Array], host_inputs: List = []
+    ) -> PendingExecution:
+        """
+        Enqueues the main function of the session on the stream without waiting for it to complete.
+        Accessing the memory of any of the outputs will wait for the execution to complete.
+        """
+        with self.lock:
+            session.execute_function("main", in_args=in_args, out_args=out_args, stream=self.stream)
+
+            # For outputs that were on the host, enqueue the copy back from their staging buffers.
+            # TODO(#155): MLIR-TensorRT should allow output tensor placements on host.
+            staging_buffers = []
+            for out, out_arg in zip(outputs, out_args):
+                if out.device.kind != "gpu":
+                    # Access the memref directly since waiting on a pending execution here would deadlock.
+                    # Any earlier execution writing to it was enqueued on the same stream, so it is ordered before this copy.
+                    self.staging_buffer_pool.copy_to_host(out_arg, out._memref_value)
+                    staging_buffers.append(out_arg)
+
+            pending = PendingExecution(self, outputs, in_args + out_args + list(host_inputs), staging_buffers)
+            for out in outputs:
+                out._pending_execution = pending
+            self.in_flight.append(pending)
+        return pending
+
+    def synchronize(self) -> None:
+        """
+        Waits for all enqueued executions to complete.
+        """
+        with self.lock:
+            in_flight, self.in_flight = self.in_flight, []
+
+        # Synchronize without holding the lock so that other threads can keep enqueueing work in the meantime.
+        # Executions enqueued after the swap above stay in flight even if they complete here.
+        self.stream.sync()
+
+        # Finishing updates the pending execution of outputs, which `enqueue` may be doing concurrently.
+        with self.lock:
+            for pending in in_flight:
+                pending._finish()
+
+
 class Executor:
     def __init__(self, executable: runtime.Executable) -> None:
+        from tripy.backend.mlir.utils import convert_runtime_dtype_to_tripy_dtype
+
         self.runtime_client = _get_runtime_client()
         self.stream = self.runtime_client.create_stream()
         session_options = runtime.RuntimeSessionOptions(num_devices=1, device_id=0)
         self.session = runtime.RuntimeSession(session_options, executable)
         self.device = self.runtime_client.get_devices()[0]  # Assume a single device is available.
+        self.staging_buffer_pool = StagingBufferPool(self.runtime_client, self.device, self.stream)
+        self.queue = ExecutionQueue(self.stream, self.staging_buffer_pool)
         self.signature = executable.get_signature("main")
 
+        # The signature does not change between calls, so we precompute everything we can here
+        # and only resolve dynamic dimensions when executing.
+        self.num_input_args = self.signature.get_num_input_args()
+        self.num_output_args = self.signature.get_num_output_args()
+        self.shape_func_name = self.signature.get_shape_func_name()
+
+        self.output_memref_types = []
+        for output_index in range(self.num_output_args):
+            arg = self.signature.get_arg(output_index + self.num_input_args)
+            assert compiler.MemRefType.isinstance(arg) or compiler.ScalarType.isinstance(
+                arg
+            ), "Argument must be either MemRefType or ScalarType"
+            assert compiler.MemRefType.isinstance(
+                arg
+            ), "ScalarType argument are not yet supported"  # 158: Add scalar type output argument support.
+            self.output_memref_types.append(compiler.MemRefType(arg))
+
+        self.output_dtypes = [convert_runtime_dtype_to_tripy_dtype(memref.dtype) for memref in self.output_memref_types]
+        self.output_shapes = [tuple(memref.shape) for memref in self.output_memref_types]
+        self.output_device_kinds = [
+            "gpu" if memref.address_space == runtime.PointerType.device else "cpu"
+            for memref in self.output_memref_types
+        ]
+        self.has_dynamic_output_shapes = any(dim < 0 for shape in self.output_shapes for dim in shape)
+
+        self.output_buffer_pool = OutputBufferPool() if cfg.enable_output_buffer_pool else None
+
+        # Output tensor information only depends on the shapes of the inputs, so we can memoize it.
+        # Maps (input shapes, output device kinds) to a list of TensorInfos, ordered from least to most recently used.
+        self.output_tensor_info_cache = OrderedDict()
+        self.output_tensor_info_cache_size = cfg.shape_inference_cache_size
+
+        if not self.shape_func_name:
+            for shape in self.output_shapes:
+                assert (
+                    all(dim >= 0 for dim in shape)
+                    and f"Output shape {shape} must be statically known if shape inference function is missing. "
+                )
+
     def _get_inputs_shape_memref(self, inputs):
         inputs_shape_memref = []
         for input in inputs:
@@ -58,106 +306,123 @@ class Executor:
         return inputs_shape_memref
 
     def _get_outputs_shape_memref(self):
-        offset = self.signature.get_num_input_args()
         outputs_shape_memref = []
-        for output_index in range(self.signature.get_num_output_args()):
-            arg_index = output_index + offset
-            arg = self.signature.get_arg(arg_index)
-            assert compiler.MemRefType.isinstance(arg)
-            memref = runtime.MemRefType(arg)
-            rank = len(memref.shape)
-            if len(memref.shape) > 0:
-                output_shape = Array(memref.shape, shape=make_tuple(rank), dtype=datatype.int64, device=device("cpu"))
+        for shape in self.output_shapes:
+            rank = len(shape)
+            if rank > 0:
+                output_shape = Array(list(shape), shape=make_tuple(rank), dtype=datatype.int64, device=device("cpu"))
                 outputs_shape_memref.append(output_shape.memref_value)
             else:
                 outputs_shape_memref.append(None)
         return outputs_shape_memref
 
-    def _execute_shape_inference(self, inputs_shape_memref, outputs_shape_memref):
-        # Only execute shape inference if shape function name is valid.
-        if not self.signature.get_shape_func_name():
-            for memref in outputs_shape_memref:
-                if memref is not None:
-                    assert (
-                        all(dim >= 0 for dim in memref.shape)
-                        and f"Output shape {memref.shape} must be statically known if shape inference function is missing. "
-                    )
+    def _execute_shape_inference(self, inputs):
+        # Shape inference is only required if some output dimensions are not statically known.
+        if not self.has_dynamic_output_shapes:
             return None
 
+        inputs_shape_memref = self._get_inputs_shape_memref(inputs)
+        outputs_shape_memref = self._get_outputs_shape_memref()
         self.session.execute_function(
-            name=self.signature.get_shape_func_name(), in_args=inputs_shape_memref, out_args=outputs_shape_memref
+            name=self.shape_func_name, in_args=inputs_shape_memref, out_args=outputs_shape_memref
         )
 
-        outputs_shapes_host = [
-            Array(memoryview(s).tolist(), shape=s.shape, dtype=datatype.int64, device=device("cpu"))
-            for s in outputs_shape_memref
-        ]
-
-        outputs_runtime_shape = [s.data() for s in outputs_shapes_host]
+        outputs_runtime_shape = [memoryview(s).tolist() if s is not None else [] for s in outputs_shape_memref]
         return outputs_runtime_shape
 
     def _get_output_tensor_info(self, outputs_runtime_shape, output_devices):
-        from tripy.backend.mlir.utils import convert_runtime_dtype_to_tripy_dtype
-
-        offset = self.signature.get_num_input_args()
         outputs_tensor_info = []
-        for output_index in range(self.signature.get_num_output_args()):
-            arg_index = output_index + offset
-            arg = self.signature.get_arg(arg_index)
-            assert compiler.MemRefType.isinstance(arg) or compiler.ScalarType.isinstance(
-                arg
-            ), "Argument must be either MemRefType or ScalarType"
-            assert compiler.MemRefType.isinstance(
-                arg
-            ), "ScalarType argument are not yet supported"  # 158: Add scalar type output argument support.
-            memref = compiler.MemRefType(arg)
-            dtype = convert_runtime_dtype_to_tripy_dtype(memref.dtype)
-            device_type = "gpu" if memref.address_space == runtime.PointerType.device else "cpu"
+        for output_index, shape in enumerate(self.output_shapes):
+            device_type = self.output_device_kinds[output_index]
             if output_devices[output_index]:
                 device_type = output_devices[output_index].kind
-            is_static_shape = all(dim >= 0 for dim in memref.shape)
-            if is_static_shape:
-                outputs_tensor_info.append(
-                    TensorInfo(len(memref.shape), tuple(memref.shape), dtype, device(device_type))
-                )
-            else:
-                runtime_shape = [
-                    rs if dim < 0 else dim for dim, rs in zip(memref.shape, outputs_runtime_shape[output_index])
-                ]
-                outputs_tensor_info.append(
-                    TensorInfo(
-                        len(runtime_shape),
-                        tuple(runtime_shape),
-                        dtype,
-                        device(device_type),
-                    )
-                )
+
+            if outputs_runtime_shape is not None:
+                shape = tuple(rs if dim < 0 else dim for dim, rs in zip(shape, outputs_runtime_shape[output_index]))
+
+            outputs_tensor_info.append(
+                TensorInfo(len(shape), shape, self.output_dtypes[output_index], device(device_type))
+            )
         return outputs_tensor_info
 
     def get_output_tensor_runtime_info(self, inputs, output_devices=List[device]):
-        inputs_shape_memref = self._get_inputs_shape_memref(
-            inputs
-        )  # Can we use executable signature inputs to retrieve this information?
-        outputs_shape_memref = self._get_outputs_shape_memref()
-        outputs_runtime_shape = self._execute_shape_inference(inputs_shape_memref, outputs_shape_memref)
+        cache_key = (
+            tuple(tuple(input.trace_tensor.producer.data.shape) for input in inputs),
+            tuple(out_device.kind if out_device else None for out_device in output_devices),
+        )
+        output_tensor_info = self.output_tensor_info_cache.get(cache_key)
+        if output_tensor_info is not None:
+            self.output_tensor_info_cache.move_to_end(cache_key)
+            return output_tensor_info
+
+        outputs_runtime_shape = self._execute_shape_inference(inputs)
         output_tensor_info = self._get_output_tensor_info(outputs_runtime_shape, output_devices)
+
+        self.output_tensor_info_cache[cache_key] = output_tensor_info
+        while len(self.output_tensor_info_cache) > self.output_tensor_info_cache_size:
+            self.output_tensor_info_cache.popitem(last=False)
         return output_tensor_info
 
+    def _check_preallocated_outputs(self, outputs: List[Array], out_tensor_info: List[TensorInfo]) -> None:
+        if len(outputs) != len(out_tensor_info):
+            raise_error(
+                "Incorrect number of output tensors.",
+                [f"Expected {len(out_tensor_info)} output tensors but got {len(outputs)}."],
+            )
+
+        for index, (out, info) in enumerate(zip(outputs, out_tensor_info)):
+            if tuple(out.shape) != tuple(info.shape) or out.dtype != info.dtype:
+                raise_error(
+                    "Output tensor is not compatible with the output of the executable.",
+                    [
+                        f"For output {index}, expected shape: {tuple(info.shape)} and data type: {info.dtype}, "
+                        f"but got shape: {tuple(out.shape)} and data type: {out.dtype}."
+                    ],
+                )
+
+    def execute(
+        self, output_devices=List[device], inputs: List["Tensor"] = [], outputs: Optional[List[Array]] = None
+    ) -> List[Array]:
+        """
+        Executes the executable and waits for it to complete.
+
+        Args:
+            output_devices: The devices on which to allocate outputs. Entries may be None to use the default device.
+            inputs: The input tensors. These must already be evaluated.
+            outputs: Preallocated arrays to write the outputs into. If this is not provided, outputs are allocated.
+
+        Returns:
+            The output arrays.
+        """
+        return self.enqueue(output_devices, inputs, outputs).wait()
+
     @log_time
-    def execute(self, output_devices=List[device], inputs: List["Tensor"] = []) -> List[Array]:
+    def enqueue(
+        self, output_devices=List[device], inputs: List["Tensor"] = [], outputs: Optional[List[Array]] = None
+    ) -> PendingExecution:
+        """
+        Enqueues the executable on this executor's stream without waiting for it to complete.
+
+        Args:
+            output_devices: The devices on which to allocate outputs. Entries may be None to use the default device.
+            inputs: The input tensors. These must already be evaluated.
+            outputs: Preallocated arrays to write the outputs into. If this is not provided, outputs are allocated.
+
+        Returns:
+            The pending execution.
+        """
         from tripy.frontend.trace.ops import Storage
 
         in_args = []
+        host_inputs = []
         for inp in inputs:
             assert isinstance(inp.trace_tensor.producer, Storage)
             memref = inp.trace_tensor.producer.data.memref_value
             # HACK (#155): MLIR-TensorRT requires inputs to be on device.
             # Remove explicit copy to device once #155 is addressed.
             if memref.address_space != runtime.PointerType.device:
-                memref = self.runtime_client.copy_to_device(
-                    host_memref=memref,
-                    device=self.runtime_client.get_devices()[0],
-                )
+                host_inputs.append(memref)
+                memref = self.staging_buffer_pool.copy_to_device(memref)
             if not memref:
                 raise_error(
                     "Could not convert tensor to memref",
@@ -168,34 +433,26 @@ class Executor:
         # HACK (#155): Remove `get_devices` once executable output tensor location matches Trace IR.
         out_tensor_info = self.get_output_tensor_runtime_info(inputs, output_devices)
 
-        # Allocate output memory and store buffer pointers.
-        outputs = [Array(None, shape=info.shape, dtype=info.dtype, device=info.device) for info in out_tensor_info]
+        if outputs is not None:
+            self._check_preallocated_outputs(outputs, out_tensor_info)
+        elif self.output_buffer_pool is not None:
+            outputs = [
+                self.output_buffer_pool.allocate(info.shape, info.dtype, info.device) for info in out_tensor_info
+            ]
+        else:
+            # Allocate output memory and store buffer pointers.
+            outputs = [Array(None, shape=info.shape, dtype=info.dtype, device=info.device) for info in out_tensor_info]
 
         out_args = []
         for out in outputs:
             memref = out.memref_value
-            # HACK (#155): MLIR-TensorRT requires inputs to be on device.
-            # Remove explicit copy to device once #155 is addressed.
+            # HACK (#155): MLIR-TensorRT requires outputs to be on device.
+            # Remove staging buffers once #155 is addressed.
             if memref.address_space != runtime.PointerType.device:
-                memref = self.runtime_client.copy_to_device(
-                    host_memref=memref,
-                    device=self.runtime_client.get_devices()[0],
-                )
+                memref = self.staging_buffer_pool.acquire(memref)
             if not memref:
                 raise_error("Could not allocate output memref", details=memref.error_details)
             out_args.append(memref)
 
         # Execute and populate device pointers.
-        self.session.execute_function("main", in_args=in_args, out_args=out_args, stream=self.stream)
-        self.stream.sync()
-        # For outputs that were on the host, do the copy back
-        # TODO(#155): MLIR-TensorRT should allow output tensor placements on host.
-        for idx, out_info in enumerate(out_tensor_info):
-            if out_info.device.kind != "gpu":
-                self.runtime_client.copy_to_host(
-                    device_memref=out_args[idx],
-                    existing_host_memref=outputs[idx].memref_value,
-                    stream=None,
-                )
-
-        return outputs
+        return self.queue.enqueue(self.session, in_args, out_args, outputs, host_inputs)
@@ -45,8 +45,10 @@ def get_max_upper_bounds():
     return sys.maxsize
 
 def make_ir_context() -> ir.Context:
+    import tripy.config as cfg
+
     ctx = MLIRContext()
-    ctx.enable_multithreading(False)
+    ctx.enable_multithreading(cfg.enable_mlir_multithreading)
     # Allow unregistered dialects to assign trt shape_profile attribute to stablehlo program.
     ctx.allow_unregistered_dialects = True
     return ctx
@@ -138,7 +140,22 @@ def remove_constants(mlir_text) -> str:
             return text[:const_start_index] + "..." + text[const_end_index + 1 :]
         return text
 
-    replaced = [replace_dense_data(line) if "stablehlo.constant dense" in line else line for line in lines]
+    def replace_resource_data(text):
+        # Resource blobs are printed as hex strings at the end of the module, e.g. `t0: "0x0400000001000000"`.
+        name, _, blob = text.partition(": ")
+        if blob.startswith('"0x') and len(blob) > 64:
+            return f'{name}: "0x..."' + ("," if blob.endswith(",") else "")
+        return text
+
+    in_resources = False
+    replaced = []
+    for line in lines:
+        in_resources = in_resources or "dialect_resources" in line
+        if in_resources:
+            line = replace_resource_data(line)
+        elif "stablehlo.constant dense" in line:
+            line = replace_dense_data(line)
+        replaced.append(line)
     return "\n".join(replaced)
 
 
@@ -0,0 +1,295 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 1993-2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import argparse
+import json
+import multiprocessing
+import os
+import runpy
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import mlir_tensorrt.runtime.api as runtime
+
+import tripy.config as cfg
+from tripy import export, utils
+from tripy.backend.cache import EXECUTABLE_FILE_EXTENSION
+from tripy.backend.compiler_api import Compiler, Executable
+from tripy.backend.mlir import Compiler as MLIRCompiler
+from tripy.common.exception import raise_error
+from tripy.logging import logger
+
+
+def _compile_in_subprocess(code: str, optimization_level: int, timing_cache_file_path: str) -> Tuple[bytes, float]:
+    # Spawned processes do not inherit configuration changes made at runtime, so the timing cache
+    # path is forwarded explicitly. This lets all workers share one timing cache.
+    cfg.timing_cache_file_path = timing_cache_file_path
+
+    start = time.perf_counter()
+    executable = MLIRCompiler(trt_builder_opt_level=optimization_level).compile_stabehlo_program(code)
+    # Executables cannot be sent between processes, so we return the serialized executable instead.
+    return bytes(executable.serialize()), time.perf_counter() - start
+
+
+def _make_process_pool(num_workers: int) -> ProcessPoolExecutor:
+    # Use spawned processes since forked processes cannot safely use CUDA.
+    return ProcessPoolExecutor(max_workers=num_workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+@export.public_api(document_under="compiler")
+@dataclass
+class CompileJob:
+    """
+    A function to compile with :func:`compile_many` along with the arguments to compile it with.
+    """
+
+    name: str
+    """A unique name for the job. This is used to name the executable when it is saved"""
+
+    compiler: Compiler
+    """The compiler for the function"""
+
+    args: Sequence[Any] = ()
+    """Positional arguments to forward to :func:`Compiler.compile`"""
+
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    """Keyword arguments to forward to :func:`Compiler.compile`"""
+
+
+@export.public_api(document_under="compiler")
+@dataclass
+class CompileResult:
+    """
+    The outcome of a :class:`CompileJob` .
+    """
+
+    name: str
+    """The name of the job"""
+
+    executable: Optional[Executable] = None
+    """The compiled executable or ``None`` if the job failed"""
+
+    error: Optional[str] = None
+    """A description of the error if the job failed"""
+
+    lower_time: float = 0.0
+    """The time, in seconds, spent tracing the function and lowering it to MLIR"""
+
+    build_time: float = 0.0
+    """The time, in seconds, spent building the executable(s) from MLIR"""
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the job succeeded"""
+        return self.error is None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns:
+            A JSON-serializable report of the status and timing of the job.
+        """
+        return {
+            "name": self.name,
+            "succeeded": self.succeeded,
+            "error": self.error,
+            "lower_time": self.lower_time,
+            "build_time": self.build_time,
+        }
+
+
+def _format_error(err: Exception) -> str:
+    return f"{type(err).__name__}: {err}"
+
+
+@export.public_api(document_under="compiler")
+def compile_many(jobs: Sequence[CompileJob], num_workers: Optional[int] = None) -> List[CompileResult]:
+    """
+    Compiles several functions, building their executables in parallel.
+
+    Functions are traced and lowered to MLIR in this process, one after another. Building the executables,
+    which dominates compilation time, is distributed across worker processes that share the timing cache
+    at :attr:`tripy.config.timing_cache_file_path`.
+
+    A job that fails does not affect the other jobs; its error is reported in the corresponding result instead.
+
+    Args:
+        jobs: The jobs to compile. Job names must be unique.
+        num_workers: The number of processes to use to build executables.
+            If this is 1, executables are built in this process. Defaults to the number of CPUs.
+
+    Returns:
+        The result of each job, in the same order as ``jobs``.
+
+    .. code-block:: python
+        :linenos:
+        :caption: Example
+
+        def add(a, b):
+            return a + b
+
+        # doc: no-print-locals jobs results
+        jobs = [
+            tp.CompileJob(
+                f"add_{size}",
+                tp.Compiler(add),
+                args=[tp.InputInfo((size,), dtype=tp.float32), tp.InputInfo((size,), dtype=tp.float32)],
+            )
+            for size in [1, 2]
+        ]
+        results = tp.compile_many(jobs, num_workers=1)
+
+        a = tp.ones((2,), dtype=tp.float32)
+        out = results[1].executable(a, a)
+        assert np.array_equal(cp.from_dlpack(out).get(), np.array([2.0, 2.0], dtype=np.float32))
+    """
+    names = [job.name for job in jobs]
+    duplicate_names = sorted({name for name in names if names.count(name) > 1})
+    if duplicate_names:
+        raise_error("Job names must be unique.", [f"Note: Duplicate names were: {duplicate_names}"])
+
+    num_workers = utils.default(num_workers, os.cpu_count() or 1)
+    results = [CompileResult(job.name) for job in jobs]
+
+    # Tracing is not thread-safe, so every job is traced and lowered here and only the executables are built in parallel.
+    lowered_functions = {}
+    for index, job in enumerate(jobs):
+        logger.verbose(f"Lowering job: {job.name}")
+        start = time.perf_counter()
+        try:
+            lowered_functions[index] = job.compiler._lower(*job.args, **job.kwargs)
+        except Exception as err:
+            results[index].error = _format_error(err)
+        results[index].lower_time = time.perf_counter() - start
+
+    def finish(index: int, build: Callable[[], List[Tuple[runtime.Executable, float]]]) -> None:
+        result = results[index]
+        try:
+            built = build()
+        except Exception as err:
+            result.error = _format_error(err)
+            return
+
+        result.build_time = sum(build_time for _, build_time in built)
+        result.executable = lowered_functions[index].make_executable([executable for executable, _ in built])
+
+    if num_workers > 1 and lowered_functions:
+        with _make_process_pool(num_workers) as executor:
+            futures = {
+                index: [
+                    executor.submit(
+                        _compile_in_subprocess,
+                        str(mlir),
+                        jobs[index].compiler.optimization_level,
+                        cfg.timing_cache_file_path,
+                    )
+                    for mlir, _ in lowered.modules
+                ]
+                for index, lowered in lowered_functions.items()
+            }
+            for index, job_futures in futures.items():
+                finish(
+                    index,
+                    lambda: [
+                        (runtime.Executable(serialized), build_time)
+                        for serialized, build_time in (future.result() for future in job_futures)
+                    ],
+                )
+    else:
+
+        def build_in_process(index):
+            mlir_compiler = MLIRCompiler(trt_builder_opt_level=jobs[index].compiler.optimization_level)
+            built = []
+            for mlir, flat_ir in lowered_functions[index].modules:
+                start = time.perf_counter()
+                executable = mlir_compiler.compile(mlir, flat_ir=flat_ir)
+                built.append((executable, time.perf_counter() - start))
+            return built
+
+        for index in lowered_functions:
+            finish(index, lambda: build_in_process(index))
+
+    for result in results:
+        if result.succeeded:
+            logger.verbose(
+                f"Compiled job: {result.name} (lowering: {result.lower_time:.3f}s, building: {result.build_time:.3f}s)"
+            )
+        else:
+            logger.warning(f"Failed to compile job: {result.name}.\nNote: Error was: {result.error}")
+    return results
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m tripy.backend.parallel_compile",
+        description="Compiles several functions in parallel and saves the resulting executables.",
+    )
+    parser.add_argument(
+        "script", help="A Python script which defines a `jobs` variable containing a list of `tripy.CompileJob`s."
+    )
+    parser.add_argument("-o", "--output-dir", required=True, help="The directory in which to save executables.")
+    parser.add_argument(
+        "-j",
+        "--num-workers",
+        type=int,
+        default=None,
+        help="The number of processes to use to build executables. Defaults to the number of CPUs.",
+    )
+    parser.add_argument(
+        "--timing-cache",
+        help="Path to the timing cache file to use. Defaults to `tripy.config.timing_cache_file_path`.",
+    )
+    parser.add_argument("--report", help="Path at which to write a JSON report of the status and timing of each job.")
+    args = parser.parse_args(argv)
+
+    if args.timing_cache:
+        cfg.timing_cache_file_path = args.timing_cache
+
+    jobs = runpy.run_path(args.script).get("jobs")
+    if jobs is None:
+        raise_error(
+            "Script does not define any jobs.",
+            [f"Note: {args.script} must define a variable called `jobs` containing a list of `tripy.CompileJob`s."],
+        )
+
+    results = compile_many(jobs, num_workers=args.num_workers)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    for result in results:
+        if result.succeeded:
+            path = os.path.join(args.output_dir, result.name + EXECUTABLE_FILE_EXTENSION)
+            result.executable.save(path)
+            print(
+                f"[OK]     {result.name} -> {path} (lowering: {result.lower_time:.3f}s, building: {result.build_time:.3f}s)"
+            )
+        else:
+            print(f"[FAILED] {result.name}: {result.error}")
+
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump([result.to_dict() for result in results], f, indent=4)
+
+    return 0 if all(result.succeeded for result in results) else 1
+
+
+if __name__ == "__main__":
+    # Run the canonical module rather than `__main__` so that worker processes resolve the same functions.
+    from tripy.backend.parallel_compile import main as _main
+
+    sys.exit(_main())
@@ -17,16 +17,17 @@
 
 from typing import Any, List, Optional, Sequence, Tuple, Union
 import array
+import itertools
 
 from tripy import utils
 from tripy.common.device import device as tp_device
 from tripy.common.exception import raise_error
 from tripy.common.utils import (
+    convert_buffer_to_list,
     convert_frontend_dtype_to_tripy_dtype,
     convert_list_to_array,
     get_element_type,
     get_supported_array_type,
-    Float16MemoryView,
 )
 
 import mlir_tensorrt.runtime.api as runtime
@@ -128,6 +129,37 @@ def check_list_consistency(input_list: Any, computed_shape: List[int]) -> None:
         raise_error(msg, details=[f"Input list: {input_list}\n", f"Expected shape: {computed_shape}"])
 
 
+def flatten_list_with_shape(input_list: Any) -> Tuple[List, Tuple[int]]:
+    """
+    Flattens a (possibly nested) list of scalars and computes its shape.
+
+    The list is flattened one dimension at a time so that checking that every sublist has the
+    expected length only requires a single pass over each dimension.
+
+    Returns:
+        The flattened list and the shape of the input list.
+    """
+    computed_shape = tuple(utils.get_shape(input_list))
+    if not computed_shape:
+        return [input_list], computed_shape
+
+    def all_sequences(elements, length):
+        return all(issubclass(typ, Sequence) for typ in set(map(type, elements))) and all(
+            elem_len == length for elem_len in set(map(len, elements))
+        )
+
+    flat_list = [input_list]
+    for dim in computed_shape:
+        if not all_sequences(flat_list, dim):
+            # Only walk the list element by element when we know it is invalid in order to generate a useful error.
+            check_list_consistency(input_list, computed_shape)
+        flat_list = list(itertools.chain.from_iterable(flat_list))
+
+    if any(issubclass(typ, Sequence) for typ in set(map(type, flat_list))):
+        check_list_consistency(input_list, computed_shape)
+    return flat_list, computed_shape
+
+
 # The class abstracts away implementation differences between Torch, Jax, Cupy, NumPy, and List.
 # Data is stored as a byte buffer, enabling interoperability across array libraries.
 # The byte buffer is created using the `convert_to_byte_buffer` function.
@@ -138,6 +170,9 @@ class Array:
     It can be used to store any object implementing dlpack interface.
     """
 
+    # Set while an asynchronous execution that writes to this array has not been synchronized yet.
+    _pending_execution = None
+
     def __init__(
         self,
         data: Union[List, "np.ndarray", "cp.ndarray", "torch.Tensor", "jnp.ndarray"],
@@ -160,6 +195,7 @@ class Array:
         assert shape is None or all(s >= 0 for s in shape)
 
         self.device = device
+        flat_data = None
 
         if data is None:
             if dtype is None:
@@ -176,8 +212,7 @@ class Array:
                 element_type = get_element_type(data)
                 if dtype is not None:
                     element_type = convert_frontend_dtype_to_tripy_dtype(dtype)
-                computed_shape = tuple(utils.get_shape(data))
-                check_list_consistency(data, computed_shape)
+                flat_data, computed_shape = flatten_list_with_shape(data)
                 check_shape_consistency(computed_shape, shape)
                 self.dtype = element_type
                 if shape is None:
@@ -192,24 +227,44 @@ class Array:
         # Store the memref_value
         self.runtime_client = runtime.RuntimeClient()
         self.data_ref = data  # Ensure that data does not go out of scope when we create a view over it.
-        self.memref_value = self._memref(data)
+        self.memref_value = self._memref(data, flat_data)
         self.device = (
             tp_device("gpu") if self.memref_value.address_space == runtime.PointerType.device else tp_device("cpu")
         )
 
+    @classmethod
+    def _from_memref(cls, memref_value, shape: Tuple[int], dtype: "tripy.dtype", data_ref: Any = None) -> "Array":
+        """
+        Creates an Array that wraps an existing memref without copying it.
+        If the memref is a view, `data_ref` should be the object that owns the underlying memory.
+        """
+        arr = cls.__new__(cls)
+        arr.dtype = dtype
+        arr.shape = shape
+        arr.runtime_client = runtime.RuntimeClient()
+        arr.data_ref = data_ref
+        arr.memref_value = memref_value
+        arr.device = tp_device("gpu") if memref_value.address_space == runtime.PointerType.device else tp_device("cpu")
+        return arr
+
+    @property
+    def memref_value(self):
+        # Wait for pending writes so that the memory is never read before it is ready.
+        if self._pending_execution is not None:
+            self._pending_execution.wait()
+        return self._memref_value
+
+    @memref_value.setter
+    def memref_value(self, memref_value):
+        self._memref_value = memref_value
+
     def data(self) -> List[Union[float, int]]:
         memref = self.memref_value
         if self.memref_value.address_space == runtime.PointerType.device:
             memref = self.runtime_client.copy_to_host(
                 device_memref=self.memref_value,
             )
-        try:
-            return memoryview(memref).tolist()
-        except NotImplementedError as e:
-            if "memoryview: format e not supported" in str(e):
-                assert memref.dtype == runtime.ScalarTypeCode.f16
-                return Float16MemoryView(bytearray(memref)).tolist()
-            raise
+        return convert_buffer_to_list(memref, self.dtype, self.shape)
 
     def _prettyprint(self, threshold=1000, linewidth=10, edgeitems=3):
         data = self.data()
@@ -247,7 +302,7 @@ class Array:
         tensor_str = ("," + "\n" * (max(len(self.shape) - indent - 1, 1)) + " " * (indent + 1)).join(slices)
         return "[" + tensor_str + "]"
 
-    def _memref(self, data):
+    def _memref(self, data, flat_data=None):
         from tripy.backend.mlir.utils import convert_tripy_dtype_to_runtime_dtype
 
         if data is None:
@@ -265,7 +320,7 @@ class Array:
                     self.runtime_client.get_devices()[self.device.index] if self.device == tp_device("gpu") else None
                 )
                 assert self.dtype in get_supported_array_type() and f"Unsupported type {self.dtype}"
-                buffer = convert_list_to_array(utils.flatten_list(utils.make_list(data)), self.dtype)
+                buffer = convert_list_to_array(flat_data, self.dtype)
                 return self.runtime_client.create_memref(
                     buffer,
                     shape=list(self.shape),
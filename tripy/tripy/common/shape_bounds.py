@@ -16,7 +16,9 @@
 #
 
 from dataclasses import dataclass
-from typing import Sequence
+from typing import Any, Dict, Optional, Sequence
+
+from tripy.utils.json import Decoder, Encoder
 
 
 @dataclass
@@ -24,3 +26,47 @@ class ShapeBounds:
     min: Sequence[int]
     opt: Sequence[int]
     max: Sequence[int]
+
+    def contains(self, shape: Sequence[int]) -> bool:
+        """
+        Returns whether the given shape lies within these bounds.
+        """
+        return len(shape) == len(self.min) and all(
+            low <= dim <= high for low, dim, high in zip(self.min, shape, self.max)
+        )
+
+
+@Encoder.register(ShapeBounds)
+def encode(shape_bounds: ShapeBounds) -> Dict[str, Any]:
+    return {"min": shape_bounds.min, "opt": shape_bounds.opt, "max": shape_bounds.max}
+
+
+@Decoder.register(ShapeBounds)
+def decode(dct: Dict[str, Any]) -> ShapeBounds:
+    return ShapeBounds(tuple(dct["min"]), tuple(dct["opt"]), tuple(dct["max"]))
+
+
+def select_profile(profiles: Sequence[Sequence[ShapeBounds]], shapes: Sequence[Sequence[int]]) -> Optional[int]:
+    """
+    Selects the optimization profile that is best suited to the given input shapes.
+
+    Args:
+        profiles: The shape bounds of every input for each profile.
+        shapes: The shapes of the inputs.
+
+    Returns:
+        The index of the profile whose bounds contain all of the input shapes and whose optimum shapes
+        are closest to them, or None if no profile supports the input shapes.
+        Ties are broken in favor of the earlier profile.
+    """
+    best_index = None
+    best_distance = None
+    for index, profile in enumerate(profiles):
+        if not all(bounds.contains(shape) for bounds, shape in zip(profile, shapes)):
+            continue
+
+        distance = sum(abs(dim - opt) for bounds, shape in zip(profile, shapes) for dim, opt in zip(shape, bounds.opt))
+        if best_distance is None or distance < best_distance:
+            best_index = index
+            best_distance = distance
+    return best_index
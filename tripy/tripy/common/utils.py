@@ -16,8 +16,10 @@
 #
 
 import array
+import functools
 import re
 import struct
+import sys
 from typing import Any, List, Optional, Tuple, Union
 
 from tripy.common.exception import raise_error
@@ -202,4 +204,108 @@ class Float16MemoryView:
         Returns:
             list: The list of float16 values.
         """
-        return [self[i] for i in range(len(self))]
+        return list(struct.unpack(f"{len(self)}{self.format}", self.buffer))
+
+
+@functools.lru_cache(None)
+def _float8_e4m3fn_values() -> Tuple[float]:
+    # Decodes every possible float8 (E4M3FN) bit pattern: 1 sign bit, 4 exponent bits with a bias of 7
+    # and 3 mantissa bits. There are no infinities and only the all-ones pattern represents NaN.
+    values = []
+    for bits in range(256):
+        sign = -1.0 if bits & 0x80 else 1.0
+        exponent = (bits >> 3) & 0xF
+        mantissa = bits & 0x7
+        if exponent == 0xF and mantissa == 0x7:
+            values.append(float("nan"))
+        elif exponent == 0:
+            values.append(sign * (mantissa / 8) * 2.0**-6)
+        else:
+            values.append(sign * (1 + mantissa / 8) * 2.0 ** (exponent - 7))
+    return tuple(values)
+
+
+def _unflatten_list(flat_list: List[Any], shape: Tuple[int]) -> Union[List, Any]:
+    if not shape:
+        return flat_list[0]
+
+    if 0 in shape:
+        # Slicing cannot recover structure past an empty dimension, so just build the (empty) nested lists directly.
+        def make_empty(dim_idx):
+            if shape[dim_idx] == 0:
+                return []
+            return [make_empty(dim_idx + 1) for _ in range(shape[dim_idx])]
+
+        return make_empty(0)
+
+    for dim in reversed(shape[1:]):
+        flat_list = [flat_list[index : index + dim] for index in range(0, len(flat_list), dim)]
+    return flat_list
+
+
+def convert_buffer_to_list(buffer: Any, dtype: "tripy.dtype", shape: Tuple[int]) -> Union[List, Any]:
+    """
+    Converts a contiguous host buffer containing elements of the given data type to a nested list of
+    Python scalars with the given shape.
+
+    Decoding is done in bulk, using NumPy if it is installed and the buffer protocol otherwise.
+    """
+    # View the buffer as raw bytes without copying; only the widening paths below allocate new storage.
+    raw = memoryview(buffer).cast("B")
+    shape = tuple(shape)
+
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    if np is not None:
+        NUMPY_DTYPES = {
+            tripy.common.datatype.bool: np.bool_,
+            tripy.common.datatype.int8: np.int8,
+            tripy.common.datatype.int32: np.int32,
+            tripy.common.datatype.int64: np.int64,
+            tripy.common.datatype.float16: np.float16,
+            tripy.common.datatype.float32: np.float32,
+        }
+        if dtype in NUMPY_DTYPES:
+            np_array = np.frombuffer(raw, dtype=NUMPY_DTYPES[dtype])
+        elif dtype == tripy.common.datatype.bfloat16:
+            # bfloat16 is the upper half of a float32.
+            np_array = (np.frombuffer(raw, dtype=np.uint16).astype(np.uint32) << 16).view(np.float32)
+        elif dtype == tripy.common.datatype.float8:
+            np_array = np.array(_float8_e4m3fn_values(), dtype=np.float32)[np.frombuffer(raw, dtype=np.uint8)]
+        else:
+            raise_error(f"Cannot convert data of type: {dtype} to a list.")
+        return np_array.reshape(shape).tolist()
+
+    # Formats that memoryview can decode natively.
+    MEMORYVIEW_FORMATS = {
+        tripy.common.datatype.bool: "?",
+        tripy.common.datatype.int8: "b",
+        tripy.common.datatype.int32: "i",
+        tripy.common.datatype.int64: "q",
+        tripy.common.datatype.float32: "f",
+    }
+    if dtype == tripy.common.datatype.float16:
+        return _unflatten_list(Float16MemoryView(raw).tolist(), shape)
+    elif dtype == tripy.common.datatype.bfloat16:
+        # Widen to float32 by copying each bfloat16 into the upper half of a zero-initialized float32.
+        widened = bytearray(2 * len(raw))
+        offset = 2 if sys.byteorder == "little" else 0
+        widened[offset::4] = raw[0::2]
+        widened[offset + 1 :: 4] = raw[1::2]
+        raw, fmt = widened, "f"
+    elif dtype == tripy.common.datatype.float8:
+        encoded_values = [struct.pack("f", value) for value in _float8_e4m3fn_values()]
+        raw, fmt = bytearray(b"".join(map(encoded_values.__getitem__, raw))), "f"
+    elif dtype in MEMORYVIEW_FORMATS:
+        fmt = MEMORYVIEW_FORMATS[dtype]
+    else:
+        raise_error(f"Cannot convert data of type: {dtype} to a list.")
+
+    view = memoryview(raw)
+    # memoryview can only produce a nested list directly for non-empty, non-scalar shapes.
+    if shape and 0 not in shape:
+        return view.cast(fmt, shape).tolist()
+    return _unflatten_list(view.cast(fmt).tolist(), shape)
@@ -38,6 +38,56 @@ mlir_debug_tree_path = os.environ.get("TRIPY_MLIR_DEBUG_PATH", os.path.join("/",
 enable_tensorrt_debug = os.environ.get("TRIPY_TRT_DEBUG_ENABLED", "0") == "1"
 tensorrt_debug_path = os.environ.get("TRIPY_TRT_DEBUG_PATH", os.path.join("/", "tripy", "tensorrt-dumps"))
 
+# Stack information options
+enable_stack_info = os.environ.get("TRIPY_STACK_INFO_ENABLED", "1") == "1"
+"""
+Whether to record where in the Python code each tensor was created.
+Disabling this speeds up tracing, but error messages will no longer point to the offending code.
+"""
+
+# Trace optimization options
+enable_common_subexpression_elimination = os.environ.get("TRIPY_COMMON_SUBEXPRESSION_ELIMINATION_ENABLED", "1") == "1"
+"""
+Whether operations that perform the same computation on the same inputs, like repeated shape extractions or casts,
+should be merged before compilation.
+"""
+
+# Constant options
+enable_constant_folding = os.environ.get("TRIPY_CONSTANT_FOLDING_ENABLED", "1") == "1"
+"""
+Whether operations that can be evaluated ahead of time, like shape arithmetic on tensors with static shapes,
+should be replaced with constants before compilation.
+"""
+
+zero_copy_constant_threshold = int(os.environ.get("TRIPY_ZERO_COPY_CONSTANT_THRESHOLD", str(1 << 20)))
+"""
+The size in bytes at or above which constants are embedded into MLIR as resource blobs that reference
+the constant's host buffer instead of being copied. Set this to a negative value to always copy constants.
+"""
+
+constant_prep_workers = int(os.environ.get("TRIPY_CONSTANT_PREP_WORKERS", str(min(8, os.cpu_count() or 1))))
+"""
+The number of threads used to copy constants to host memory and prepare them for embedding into MLIR
+while the IR is being built. Up to this many constants are prepared ahead of the one being embedded, so this
+also bounds the number of extra host copies that are alive at once. When set to 1, each constant is prepared
+only when it is embedded.
+"""
+
+# Compiler options
+enable_mlir_multithreading = os.environ.get("TRIPY_MLIR_MULTITHREADING_ENABLED", "0") == "1"
+"""Whether the MLIR context may use multiple threads when building IR and running the compilation pipeline"""
+
+# Executor options
+shape_inference_cache_size = int(os.environ.get("TRIPY_SHAPE_INFERENCE_CACHE_SIZE", "64"))
+"""The maximum number of distinct input shapes for which each executor memoizes the output shapes"""
+
+enable_output_buffer_pool = os.environ.get("TRIPY_OUTPUT_BUFFER_POOL_ENABLED", "0") == "1"
+"""
+Whether executors should reuse the memory of output tensors that are no longer referenced.
+When this is enabled, data shared with other frameworks via DLPack must not be used after the
+corresponding output tensor is released.
+"""
+
 # Variables that are exposed to the user are kept lowercase.
 timing_cache_file_path: str = export.public_api(
     document_under="config.rst",
@@ -46,3 +96,26 @@ timing_cache_file_path: str = export.public_api(
     symbol="timing_cache_file_path",
 )(os.path.join(tempfile.gettempdir(), "tripy-cache"))
 """Path to a timing cache file that can be used to speed up compilation time"""
+
+enable_executable_cache = os.environ.get("TRIPY_EXECUTABLE_CACHE_ENABLED", "1") == "1"
+"""Whether executables compiled by ``Tensor.eval()`` should be cached and reused for structurally identical graphs"""
+
+executable_cache_dir = os.environ.get("TRIPY_EXECUTABLE_CACHE_DIR", "")
+"""
+Directory in which cached executables are persisted. This is empty by default, in which case executables are
+only cached in memory. Since loading an executable from an untrusted location is unsafe, this should be
+a directory that only the current user can write to.
+"""
+
+executable_cache_max_entries = int(os.environ.get("TRIPY_EXECUTABLE_CACHE_MAX_ENTRIES", "256"))
+"""The maximum number of executables to keep in memory"""
+
+executable_cache_max_disk_size = int(os.environ.get("TRIPY_EXECUTABLE_CACHE_MAX_DISK_SIZE", str(1 << 30)))
+"""The maximum total size, in bytes, of the executables persisted in ``executable_cache_dir``"""
+
+executable_cache_max_constant_size = int(os.environ.get("TRIPY_EXECUTABLE_CACHE_MAX_CONSTANT_SIZE", str(1 << 16)))
+"""
+The maximum total size, in bytes, of the constants in a graph for its executable to be cached.
+Cache keys depend on the contents of every constant, so larger graphs are compiled without hashing
+their constants and their executables, which embed the constants, are never cached.
+"""
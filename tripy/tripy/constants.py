@@ -20,3 +20,9 @@ CONSTANT_IR_PRINT_VOLUME_THRESHOLD = 5
 A volume threshold for displaying constants in IR logging messages.
 Constants with volumes greater than this threshold will be omitted from logging messages.
 """
+
+CONSTANT_FOLDING_VOLUME_THRESHOLD = 1024
+"""
+The maximum volume of tensors that are evaluated on the host during constant folding.
+This is intended to cover shape tensors without reading back large constants.
+"""
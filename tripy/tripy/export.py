@@ -96,7 +96,9 @@ def public_api(
         if not hasattr(module, "__all__"):
             module.__all__ = []
 
-        module.__all__.append(symbol)
+        # Modules may pre-populate `__all__` (e.g. the top-level module does so to support lazy loading).
+        if symbol not in module.__all__:
+            module.__all__.append(symbol)
         setattr(module, symbol, obj)
 
         return obj
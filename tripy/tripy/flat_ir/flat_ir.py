@@ -15,7 +15,12 @@
 # limitations under the License.
 #
 
-from typing import Dict, List, Sequence, Set
+import contextlib
+import hashlib
+import itertools
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Sequence, Set, Tuple
 
 from tripy import utils
 from tripy.common.shape_bounds import ShapeBounds
@@ -47,12 +52,164 @@ class FlatIR:
             layer_strs.append(f"    {str(out)}")
         return "\n".join(layer_strs)
 
+    def fingerprint(self) -> str:
+        """
+        Returns a fingerprint of the computation represented by this FlatIR.
+        FlatIRs that perform the same computation have the same fingerprint regardless of tensor names.
+        """
+        from tripy.flat_ir.ops import BaseFlatIROp
+        from tripy.frontend.utils import fingerprint_graph
+
+        return fingerprint_graph(self.inputs, self.ops, self.outputs, BaseFlatIROp, self.shapes)
+
+    def canonicalize(self) -> None:
+        """
+        Renames all tensors in this FlatIR based on their topological position.
+        """
+        from tripy.frontend.trace.trace import CANONICAL_NAME_PREFIX
+        from tripy.frontend.utils import get_canonical_names
+
+        names = get_canonical_names(self.inputs, self.ops, self.outputs, prefix=CANONICAL_NAME_PREFIX)
+
+        for tensor in self.tensor_map.values():
+            tensor.name = names.get(tensor.name, tensor.name)
+        self.tensor_map = {tensor.name: tensor for tensor in self.tensor_map.values()}
+
+        # Trace tensor names refer to FlatIR tensors of the same name, so they need to be updated too.
+        for op in self.ops:
+            op.trace_input_names = [names.get(name, name) for name in op.trace_input_names]
+            op.trace_output_names = [names.get(name, name) for name in op.trace_output_names]
+
+    @utils.log_time
+    def eliminate_dead_ops(self) -> int:
+        """
+        Removes operations whose results do not contribute to the outputs of this FlatIR,
+        such as helper computations that were emitted by a trace operation but never used.
+
+        Returns:
+            The number of operations that were removed.
+        """
+        from tripy.logging import logger
+
+        live_tensor_names = {out.name for out in self.outputs}
+        live_ops = []
+        for op in reversed(self.ops):
+            # Operations with multiple results are kept as a whole if any of their results are used.
+            if any(out.name in live_tensor_names for out in op.outputs):
+                live_ops.append(op)
+                live_tensor_names.update(inp.name for inp in op.inputs)
+                continue
+
+            for out in op.outputs:
+                del self.tensor_map[out.name]
+
+        num_removed = len(self.ops) - len(live_ops)
+        if not num_removed:
+            return 0
+
+        self.ops = list(reversed(live_ops))
+        logger.verbose(f"Eliminated {num_removed} dead operation(s).")
+        return num_removed
+
+    @utils.log_time
+    def deduplicate_constants(self) -> int:
+        """
+        Merges constants that have the same data type, shape, device and contents so that
+        each distinct constant is embedded into MLIR only once.
+
+        Returns:
+            The number of bytes of constant data that were deduplicated.
+        """
+        from tripy.flat_ir.ops import ConstantOp
+        from tripy.logging import logger
+
+        # Group constants by their metadata first so that we only need to hash the contents
+        # of constants that could possibly be duplicates.
+        candidates: Dict[Tuple, List[ConstantOp]] = defaultdict(list)
+        for op in self.ops:
+            if isinstance(op, ConstantOp):
+                out = op.outputs[0]
+                candidates[(out.dtype, tuple(op.data.shape), out.device.kind, out.device.index)].append(op)
+
+        output_names = {out.name for out in self.outputs}
+        replacements: Dict[str, "FlatIRTensor"] = {}
+        num_bytes = 0
+        for ops in candidates.values():
+            if len(ops) < 2:
+                continue
+
+            unique_constants: Dict[bytes, ConstantOp] = {}
+            for op in ops:
+                # The host copy is cached on the op so that preparing the constant later does not copy it again.
+                memref = op.get_host_memref()
+                digest = hashlib.sha256(memoryview(memref).cast("B")).digest() if utils.volume(op.data.shape) else b""
+
+                original = unique_constants.setdefault(digest, op)
+                # Graph outputs are kept as-is since their names are visible outside the FlatIR.
+                if original is op or op.outputs[0].name in output_names:
+                    continue
+
+                replacements[op.outputs[0].name] = original.outputs[0]
+                num_bytes += utils.volume(op.data.shape) * op.outputs[0].dtype.itemsize
+
+        if not replacements:
+            return 0
+
+        new_ops = []
+        for op in self.ops:
+            if op.outputs[0].name in replacements:
+                del self.tensor_map[op.outputs[0].name]
+                continue
+            op.inputs = [replacements.get(inp.name, inp) for inp in op.inputs]
+            new_ops.append(op)
+        self.ops = new_ops
+
+        logger.verbose(f"Deduplicated {len(replacements)} constant(s) totalling {num_bytes} bytes.")
+        return num_bytes
+
     def to_mlir(self):
-        def to_mlir_impl():
+        @contextlib.contextmanager
+        def prepare_constants():
+            """
+            Prepares constants ahead of the point where they are embedded into MLIR and yields a function
+            that waits until a given constant is ready.
+            """
+            import tripy.config as cfg
+            from tripy.flat_ir.ops import ConstantOp
+
+            num_workers = cfg.constant_prep_workers
+            if num_workers <= 1:
+                # Each constant is prepared as it is embedded, so at most one host copy is alive at a time.
+                yield lambda constant: None
+                return
+
+            # Preparing a constant may involve a device-to-host copy, so constants are prepared in a thread pool
+            # while earlier ones are being embedded. Only `num_workers` constants are prepared ahead of the one
+            # being embedded, which bounds the number of host copies that are alive at once.
+            constants = iter([op for op in self.ops if isinstance(op, ConstantOp)])
+            pending = deque()
+            with ThreadPoolExecutor(max_workers=num_workers) as executor:
+
+                def prefetch():
+                    for constant in itertools.islice(constants, num_workers - len(pending)):
+                        pending.append((constant, executor.submit(constant.prepare)))
+
+                def wait_for(constant):
+                    prefetch()
+                    prepared_constant, future = pending.popleft()
+                    assert prepared_constant is constant, "Constants must be embedded in the order they appear"
+                    prefetch()
+                    future.result()
+
+                yield wait_for
+
+        @utils.log_time
+        def build_mlir(wait_for_constant):
             from mlir_tensorrt.compiler import ir
             from mlir_tensorrt.compiler.dialects import func as func_dialect
 
             from tripy.backend.mlir.utils import make_ir_context, make_tensor_location
+            from tripy.flat_ir.ops import ConstantOp
 
             with make_ir_context(), ir.Location.unknown():
                 module = ir.Module.create()
@@ -72,6 +229,9 @@ class FlatIR:
                             mlir_ops[inp.name] = entry_block.arguments[index]
 
                         for op in self.ops:
+                            if isinstance(op, ConstantOp):
+                                wait_for_constant(op)
+
                             layer_inputs = [mlir_ops[inp.name] for inp in op.inputs]
 
                             with make_tensor_location(
@@ -111,9 +271,9 @@ class FlatIR:
                     if self.shapes:
                         # Create tensorrt.shape_profile attribute for all function arguments
                         arg_attrs: List[Dict[str, ir.Attribute]] = []
+                        # Only one profile is supported per argument. `tripy.Compiler` handles multiple
+                        # optimization profiles by lowering the FlatIR once for each profile.
                         for bound in self.shapes:
-                            # TODO (#244): Support multiple profiles
-
                             arg_attrs.append(
                                 {
                                     "tensorrt.shape_profile": ir.Attribute.parse(
@@ -141,9 +301,14 @@ class FlatIR:
 
         from tripy.backend.mlir.utils import redirect_stderr
 
+        self.eliminate_dead_ops()
         try:
             with redirect_stderr() as outfile:
-                mlir = to_mlir_impl()
+                # Deduplicating and preparing constants may copy them from the device, so errors from
+                # those steps are mapped back to user code just like errors from building the IR.
+                self.deduplicate_constants()
+                with prepare_constants() as wait_for_constant:
+                    mlir = build_mlir(wait_for_constant)
         except Exception as exc:
             from tripy.backend.mlir.utils import map_error_to_user_code_and_raise
 
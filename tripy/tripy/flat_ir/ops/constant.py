@@ -15,6 +15,8 @@
 # limitations under the License.
 #
 
+import array
+import sys
 from dataclasses import dataclass
 from typing import Sequence, Set
 
@@ -28,6 +30,34 @@ from tripy.flat_ir.ops.base import BaseFlatIROp
 import mlir_tensorrt.runtime.api as runtime
 
 
+def _bool_to_int32(memref_value) -> array.array:
+    # Bools are stored as one byte each, so we can scatter each byte into the least significant byte
+    # of a zero-initialized int32 array with a single strided copy instead of going through a Python list.
+    bool_bytes = memoryview(memref_value).cast("B")
+    int_array = array.array("i", bytes(4 * len(bool_bytes)))
+    offset = 0 if sys.byteorder == "little" else 3
+    memoryview(int_array).cast("B")[offset::4] = bool_bytes
+    return int_array
+
+
+def _make_elements_attr(buffer, name: str, dtype: "tripy.dtype", shape: Sequence[int], nbytes: int):
+    import tripy.config as cfg
+    from tripy.backend.mlir import utils as mlir_utils
+
+    # Large constants are attached as resource blobs that reference `buffer` directly.
+    # Unlike `DenseElementsAttr`, this avoids copying the data into the MLIR context.
+    if (
+        cfg.zero_copy_constant_threshold >= 0
+        and nbytes >= cfg.zero_copy_constant_threshold
+        and hasattr(getattr(ir, "DenseResourceElementsAttr", None), "get_from_buffer")
+    ):
+        return ir.DenseResourceElementsAttr.get_from_buffer(
+            buffer, name, mlir_utils.make_mlir_tensor(dtype, shape), alignment=max(int(dtype.itemsize), 1)
+        )
+
+    return ir.DenseElementsAttr.get(array=buffer, type=mlir_utils.get_mlir_dtype(dtype), shape=shape)
+
+
 @dataclass(repr=False)
 class ConstantOp(BaseFlatIROp):
 
@@ -38,40 +68,59 @@ class ConstantOp(BaseFlatIROp):
             return {"data"}
         return set()
 
-    def to_mlir(self, operands):
-        import array
+    def get_host_memref(self):
+        """
+        Returns the data of this constant in host memory. Device data is copied to the host at most once,
+        so deduplication and preparation can share the same copy.
+        """
+        # TODO(#189): Remove explicit copy to host for constants
+        if getattr(self, "_host_memref", None) is None:
+            memref_value = self.data.memref_value
+            if self.data.device.kind == "gpu":
+                memref_value = runtime.RuntimeClient().copy_to_host(
+                    device_memref=memref_value,
+                    stream=None,
+                )
+            self._host_memref = memref_value
+        return self._host_memref
+
+    def prepare(self) -> None:
+        """
+        Copies the data of this constant to host memory in the form in which it will be embedded into MLIR.
+        This does not use the MLIR context, so multiple constants may be prepared concurrently before lowering.
+        """
         import tripy.common.datatype as datatype
-        from tripy.backend.mlir import utils as mlir_utils
 
-        # TODO(#189): Remove explicit copy to host for constants
         assert isinstance(self.data, Array)
-        memref_value = self.data.memref_value
-        if self.data.device.kind == "gpu":
-            memref_value = runtime.RuntimeClient().copy_to_host(
-                device_memref=memref_value,
-                stream=None,
-            )
+        memref_value = self.get_host_memref()
+        # The host copy is only needed until it has been converted into the buffer that is embedded into MLIR.
+        self._host_memref = None
 
         # Workaround (#208): bools are represented as i1 in MLIR-TRT but they cannot be used for DenseElementsAttr
         # so we have to represent them as ints and then cast the result
         if self.outputs[0].dtype == datatype.bool:
-            # need to use memoryview.cast to ensure that the view will be flattened
-            int_memref = self.data.runtime_client.create_memref(
-                array.array("i", memoryview(memref_value).cast("b").tolist()),
-                shape=self.data.shape,
-                dtype=mlir_utils.convert_tripy_dtype_to_runtime_dtype(datatype.int32),
-                device=None,
-            )
-            attr = ir.DenseElementsAttr.get(
-                array=int_memref, type=mlir_utils.get_mlir_dtype(datatype.int32), shape=self.data.shape
-            )
+            memref_value = _bool_to_int32(memref_value)
+
+        self._host_buffer = memref_value
+
+    def to_mlir(self, operands):
+        import tripy.common.datatype as datatype
+        from tripy.backend.mlir import utils as mlir_utils
+
+        if getattr(self, "_host_buffer", None) is None:
+            self.prepare()
+        # Release the host copy once it has been embedded so that it does not outlive lowering.
+        buffer, self._host_buffer = self._host_buffer, None
+
+        nbytes = utils.volume(self.data.shape) * self.outputs[0].dtype.itemsize
+
+        if self.outputs[0].dtype == datatype.bool:
+            attr = _make_elements_attr(buffer, self.outputs[0].name, datatype.int32, self.data.shape, nbytes * 4)
             cast_output = mlir_utils.make_mlir_tensor(datatype.bool, self.data.shape)
             constant_op = stablehlo.ConstantOp(attr)
             return [stablehlo.ConvertOp(result=cast_output, operand=constant_op)]
 
         assert self.data.dtype == self.outputs[0].dtype
-        attr = ir.DenseElementsAttr.get(
-            array=memref_value, type=mlir_utils.get_mlir_dtype(self.outputs[0].dtype), shape=self.data.shape
-        )
+        attr = _make_elements_attr(buffer, self.outputs[0].name, self.outputs[0].dtype, self.data.shape, nbytes)
 
         return [stablehlo.ConstantOp(attr)]
@@ -20,6 +20,7 @@ import copy
 from dataclasses import dataclass
 from typing import Any, List, Optional
 
+import tripy.config as cfg
 from tripy import utils
 
 _BUILD_CONTEXT: List[List[Any]] = []
@@ -74,7 +75,7 @@ class FlatIRTensor:
             name=None,
             # Include code from the caller of this function up, and not just user code
             # since this is an intermediate tensor created within tripy.
-            stack_info=utils.get_stack_info(include_code_index=1),
+            stack_info=utils.get_stack_info(include_code_index=1) if cfg.enable_stack_info else utils.StackInfo([]),
             dtype=dtype,
             device=device,
             rank=rank,
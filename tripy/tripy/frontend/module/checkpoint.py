@@ -0,0 +1,228 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 1993-2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import ctypes
+import json
+import math
+import mmap
+import os
+import struct
+from typing import Dict, Iterator, Sequence, Tuple
+
+import tripy
+import tripy.common.datatype
+from tripy import utils
+from tripy.common.array import Array
+from tripy.common.device import device
+from tripy.common.exception import raise_error
+from tripy.logging import logger
+
+# Maps the data type names used in safetensors files to Tripy data types.
+SAFETENSORS_DTYPES = {
+    "BOOL": tripy.common.datatype.bool,
+    "I8": tripy.common.datatype.int8,
+    "I32": tripy.common.datatype.int32,
+    "I64": tripy.common.datatype.int64,
+    "F8_E4M3": tripy.common.datatype.float8,
+    "F16": tripy.common.datatype.float16,
+    "BF16": tripy.common.datatype.bfloat16,
+    "F32": tripy.common.datatype.float32,
+}
+
+
+def make_host_array_view(buffer: mmap.mmap, offset: int, shape: Sequence[int], dtype: "tripy.dtype") -> Array:
+    """
+    Creates a host Array that views a region of a memory-mapped file without copying it.
+    The Array keeps the mapping alive for as long as it exists.
+    """
+    import mlir_tensorrt.runtime.api as runtime
+
+    from tripy.backend.mlir.utils import convert_tripy_dtype_to_runtime_dtype
+
+    shape = tuple(shape)
+    if utils.volume(shape) == 0:
+        return Array(None, shape, dtype, device("cpu"))
+
+    # NOTE: `from_buffer` requires a writable buffer, so the file must be mapped with ACCESS_COPY.
+    # Pages are still shared with the page cache until they are written to.
+    ptr = ctypes.addressof(ctypes.c_char.from_buffer(buffer, offset))
+    memref = runtime.RuntimeClient().create_host_memref_view(
+        ptr, shape=list(shape), dtype=convert_tripy_dtype_to_runtime_dtype(dtype)
+    )
+    return Array._from_memref(memref, shape, dtype, data_ref=buffer)
+
+
+def map_file(path: str) -> mmap.mmap:
+    with open(path, "rb") as f:
+        # The mapping remains valid after the file is closed.
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+
+
+def read_safetensors(path: str) -> Iterator[Tuple[str, Array]]:
+    """
+    Reads a safetensors file, yielding each tensor as a host `Array` that views the memory-mapped file.
+
+    Args:
+        path: The path to the safetensors file.
+
+    Returns:
+        An iterator over tuples containing the name of each tensor and its data.
+    """
+    buffer = map_file(path)
+    (header_size,) = struct.unpack_from("<Q", buffer, 0)
+    header = json.loads(buffer[8 : 8 + header_size])
+    header.pop("__metadata__", None)
+    data_start = 8 + header_size
+
+    for name, info in header.items():
+        if info["dtype"] not in SAFETENSORS_DTYPES:
+            raise_error(
+                f"Unsupported data type: '{info['dtype']}' for tensor: '{name}' in: {path}",
+                [f"Note: Supported data types are: {list(SAFETENSORS_DTYPES.keys())}"],
+            )
+        begin, _ = info["data_offsets"]
+        yield name, make_host_array_view(buffer, data_start + begin, info["shape"], SAFETENSORS_DTYPES[info["dtype"]])
+
+
+def read_checkpoint(path: str) -> Iterator[Tuple[str, Array]]:
+    """
+    Reads a checkpoint one shard at a time.
+
+    Args:
+        path: The path to either a single safetensors file or the JSON index of a sharded checkpoint,
+            which maps each tensor name to the shard file containing it under a ``"weight_map"`` key.
+
+    Returns:
+        An iterator over tuples containing the name of each tensor and its data.
+    """
+    if not path.endswith(".json"):
+        yield from read_safetensors(path)
+        return
+
+    with open(path, "r") as f:
+        weight_map: Dict[str, str] = json.load(f)["weight_map"]
+
+    # Preserve the order in which shards are first referenced while visiting each only once.
+    shards = list(dict.fromkeys(weight_map.values()))
+    for shard in shards:
+        yield from read_safetensors(os.path.join(os.path.dirname(path), shard))
+
+
+# Weights are saved as a fixed-size prefix, followed by a JSON header and then the raw data of each tensor.
+# The prefix contains: magic bytes, format version, header size, and the offset of the tensor data.
+# The header records the name, data type, shape, and offset (relative to the start of the data) of each tensor.
+WEIGHTS_MAGIC = b"TRIPYWTS"
+WEIGHTS_FORMAT_VERSION = 1
+WEIGHTS_PREFIX = struct.Struct("<8sIIQ")
+# The data of each tensor is aligned so that it can be used in-place from a memory-mapped file.
+WEIGHTS_DATA_ALIGNMENT = 64
+
+
+def _align(offset: int) -> int:
+    return offset + (-offset % WEIGHTS_DATA_ALIGNMENT)
+
+
+def _get_nbytes(shape: Sequence[int], dtype: "tripy.dtype") -> int:
+    # Sub-byte types like int4 are packed.
+    return math.ceil(utils.volume(shape) * dtype.itemsize)
+
+
+def save_weights(path: str, arrays: Dict[str, Array]) -> None:
+    """
+    Saves arrays to a file that can be read with `read_weights`.
+
+    Arrays are copied to the host one at a time as they are written.
+
+    Args:
+        path: The path at which to save the weights.
+        arrays: A dictionary mapping names to arrays.
+    """
+    import mlir_tensorrt.runtime.api as runtime
+
+    tensors = []
+    offset = 0
+    for name, arr in arrays.items():
+        offset = _align(offset)
+        nbytes = _get_nbytes(arr.shape, arr.dtype)
+        tensors.append({"name": name, "dtype": arr.dtype.name, "shape": list(arr.shape), "offset": offset})
+        offset += nbytes
+
+    header = json.dumps({"tripy_version": tripy.__version__, "tensors": tensors}).encode()
+    data_offset = _align(WEIGHTS_PREFIX.size + len(header))
+
+    with open(path, "wb") as f:
+        f.write(WEIGHTS_PREFIX.pack(WEIGHTS_MAGIC, WEIGHTS_FORMAT_VERSION, len(header), data_offset))
+        f.write(header)
+
+        for info, arr in zip(tensors, arrays.values()):
+            f.write(b"\0" * (data_offset + info["offset"] - f.tell()))
+
+            if utils.volume(arr.shape) == 0:
+                continue
+
+            memref = arr.memref_value
+            if memref.address_space == runtime.PointerType.device:
+                memref = arr.runtime_client.copy_to_host(device_memref=memref)
+
+            data = memoryview(memref)
+            if data.nbytes != _get_nbytes(arr.shape, arr.dtype):
+                raise_error(
+                    f"Cannot save tensor: '{info['name']}' of type: {arr.dtype}.",
+                    [
+                        f"Note: Expected tensor data to occupy {_get_nbytes(arr.shape, arr.dtype)} bytes "
+                        f"but it occupies {data.nbytes} bytes."
+                    ],
+                )
+            f.write(data)
+
+
+def read_weights(path: str) -> Iterator[Tuple[str, Array]]:
+    """
+    Reads weights saved with `save_weights`, yielding each tensor as a host `Array`
+    that views the memory-mapped file.
+
+    Args:
+        path: The path to the weights file.
+
+    Returns:
+        An iterator over tuples containing the name of each tensor and its data.
+    """
+    buffer = map_file(path)
+
+    if len(buffer) < WEIGHTS_PREFIX.size or buffer[: len(WEIGHTS_MAGIC)] != WEIGHTS_MAGIC:
+        raise_error(f"File: {path} is not a Tripy weights file.")
+
+    _, format_version, header_size, data_offset = WEIGHTS_PREFIX.unpack_from(buffer)
+    if format_version > WEIGHTS_FORMAT_VERSION:
+        raise_error(
+            f"Weights file: {path} uses an unsupported format version.",
+            [
+                f"Note: File format version was: {format_version}, "
+                f"but this version of Tripy only supports versions up to: {WEIGHTS_FORMAT_VERSION}"
+            ],
+        )
+
+    header = json.loads(buffer[WEIGHTS_PREFIX.size : WEIGHTS_PREFIX.size + header_size])
+    if header["tripy_version"] != tripy.__version__:
+        logger.warning(
+            f"Weights file: {path} was saved with Tripy version: {header['tripy_version']}, "
+            f"but the current version is: {tripy.__version__}."
+        )
+
+    for info in header["tensors"]:
+        dtype = tripy.common.datatype.DATA_TYPES[info["dtype"]]
+        yield info["name"], make_host_array_view(buffer, data_offset + info["offset"], info["shape"], dtype)
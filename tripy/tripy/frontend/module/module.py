@@ -17,7 +17,7 @@
 
 import copy
 import operator
-from typing import Any, Dict, Iterator, List, Tuple, Union, Sequence, TypeVar
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union, Sequence, TypeVar
 
 from tripy import export
 from tripy.common.exception import raise_error
@@ -183,6 +183,186 @@ class Module:
         .. seealso:: :func:`state_dict`
         """
 
+        for nested_attr_name, param in state_dict.items():
+            self._load_parameter(nested_attr_name, param)
+
+    def load_from_iterator(
+        self, weights: Iterable[Tuple[str, Any]], transform: Optional[Callable[[str, Any], Any]] = None
+    ) -> None:
+        r"""
+        Loads parameters into the current module as they are produced by ``weights``.
+
+        Unlike :func:`load_from_state_dict`, this does not require all of the parameters to be in memory
+        at once, so ``weights`` can be a generator that reads, for example, one tensor at a time from disk.
+        Each parameter is assigned before the next one is requested and the loader holds no references
+        to the source data once it has been assigned.
+
+        Args:
+            weights: An iterable of tuples containing the names of parameters and their values.
+                Values may be :class:`tripy.Parameter` s, :class:`tripy.Tensor` s, or any array type that can
+                be used to construct a :class:`tripy.Tensor`.
+            transform: A function applied to each name and value before the value is assigned, returning
+                the new value. This can be used to, for example, transpose or cast certain weights.
+                Prefer transforming values on the host, e.g. with NumPy as in the example below.
+                If it returns a :class:`tripy.Tensor` that is not yet evaluated, it will be evaluated immediately
+                so that it does not hold on to the source data. Since this compiles a separate program
+                for every such weight, using Tripy operations in ``transform`` is slow for large models.
+
+        .. code-block:: python
+            :linenos:
+            :caption: Example
+
+            # doc: no-print-locals
+
+            class MyModule(tp.Module):
+                def __init__(self):
+                    super().__init__()
+                    self.linear = tp.Linear(3, 2)
+
+            module = MyModule()
+
+            def read_weights():
+                # The checkpoint stores the weight of the linear layer transposed.
+                yield "linear.weight", np.ones((3, 2), dtype=np.float32)
+                yield "linear.bias", np.zeros((2,), dtype=np.float32)
+
+            def transform(name, value):
+                if name.endswith("weight"):
+                    return np.ascontiguousarray(value.T)
+                return value
+
+            module.load_from_iterator(read_weights(), transform=transform)
+
+            assert np.array_equal(np.from_dlpack(module.linear.weight), np.ones((2, 3), dtype=np.float32))
+
+        .. seealso:: :func:`load_from_checkpoint`
+        """
+        from tripy.frontend.tensor import Tensor
+        from tripy.frontend.trace.ops import Storage
+
+        for name, value in weights:
+            if transform is not None:
+                value = transform(name, value)
+
+            if not isinstance(value, Tensor):
+                value = Tensor(value)
+            param = value if isinstance(value, Parameter) else Parameter(value)
+            if not isinstance(param.trace_tensor.producer, Storage):
+                param.eval()
+
+            self._load_parameter(name, param)
+            # Drop our references so that the source data can be released before the next weight is read.
+            del value, param
+
+    def load_from_checkpoint(self, path: str, transform: Optional[Callable[[str, Any], Any]] = None) -> None:
+        r"""
+        Loads parameters from a checkpoint on disk into the current module, one tensor at a time.
+
+        The checkpoint must be in the `safetensors <https://huggingface.co/docs/safetensors>`_ format.
+        Sharded checkpoints are supported by providing the path to the JSON index of the checkpoint
+        (e.g. ``model.safetensors.index.json``), in which case shards are read one after another.
+
+        Files are memory-mapped and parameters are created as views of the mapped data, so the weights are
+        never copied into host memory unless ``transform`` requires it.
+
+        Args:
+            path: The path to a safetensors file or the JSON index of a sharded checkpoint.
+            transform: A function applied to each name and value before the value is assigned.
+                Values are provided as :class:`tripy.Tensor` s in host memory that view the mapped file,
+                so they can be transformed on the host without copying, e.g. via ``np.from_dlpack``.
+                See :func:`load_from_iterator` for details.
+
+        .. code-block:: python
+            :linenos:
+            :caption: Example
+
+            # doc: no-eval
+
+            def transform(name, value):
+                # Transforming weights on the host avoids compiling a separate program for each one.
+                value = np.from_dlpack(value)
+                if name.endswith("attn.c_attn.weight"):
+                    value = value.T
+                return np.ascontiguousarray(value, dtype=np.float16)
+
+            model.load_from_checkpoint("model.safetensors.index.json", transform=transform)
+
+        .. seealso:: :func:`load_from_iterator`
+        """
+        from tripy.frontend.module.checkpoint import read_checkpoint
+        from tripy.frontend.tensor import Tensor
+
+        self.load_from_iterator(((name, Tensor(data)) for name, data in read_checkpoint(path)), transform)
+
+    def save_weights(self, path: str) -> None:
+        r"""
+        Saves the parameters of this module to a file, which can be loaded with :func:`load_weights`.
+
+        The file consists of a JSON header describing the name, data type, shape, and location of each
+        parameter, followed by the raw data of each parameter, aligned so that it can be used in-place
+        from a memory-mapped file.
+
+        Args:
+            path: The path at which to save the weights.
+
+        .. code-block:: python
+            :linenos:
+            :caption: Example
+
+            import os, tempfile
+
+            # doc: no-print-locals module weights_file
+            module = tp.Linear(2, 3)
+
+            with tempfile.TemporaryDirectory() as temp_dir:
+                weights_file = os.path.join(temp_dir, "linear.tpwts")
+                module.save_weights(weights_file)
+                assert os.path.exists(weights_file)
+
+        .. seealso:: :func:`load_weights`
+        """
+        from tripy.frontend.module.checkpoint import save_weights
+
+        save_weights(path, {name: param.eval() for name, param in self.state_dict().items()})
+
+    def load_weights(self, path: str, transform: Optional[Callable[[str, Any], Any]] = None) -> None:
+        r"""
+        Loads parameters saved with :func:`save_weights` into the current module.
+
+        The file is memory-mapped and parameters are created as views of the mapped data,
+        so the weights are never copied into host memory unless ``transform`` requires it.
+
+        Args:
+            path: The path to the weights file.
+            transform: A function applied to each name and value before the value is assigned.
+                Values are provided as :class:`tripy.Tensor` s in host memory that view the mapped file.
+                See :func:`load_from_iterator` for details.
+
+        .. code-block:: python
+            :linenos:
+            :caption: Example
+
+            import os, tempfile
+
+            # doc: no-print-locals module new_module weights_file
+            module = tp.Linear(2, 3)
+            new_module = tp.Linear(2, 3)
+
+            with tempfile.TemporaryDirectory() as temp_dir:
+                weights_file = os.path.join(temp_dir, "linear.tpwts")
+                module.save_weights(weights_file)
+                new_module.load_weights(weights_file)
+
+            assert tp.allclose(new_module.weight, module.weight)
+
+        .. seealso:: :func:`save_weights`
+        """
+        from tripy.frontend.module.checkpoint import read_weights
+        from tripy.frontend.tensor import Tensor
+
+        self.load_from_iterator(((name, Tensor(data)) for name, data in read_weights(path)), transform)
+
+    def _load_parameter(self, nested_attr_name: str, param: Parameter) -> None:
         def find_module(module: Union[Module, List, Dict], sub_strs: List[str]):
             while sub_strs:
                 child_name = sub_strs.pop(0)
@@ -194,28 +374,27 @@ class Module:
                     module = operator.attrgetter(child_name)(module)
             return module
 
-        for nested_attr_name, param in state_dict.items():
-            submodule_name, _, param_name = nested_attr_name.rpartition(".")
-            # If there is no submodule, it means we are accessing a parameter of self
-            module = self
-            if submodule_name:
-                try:
-                    # try to access module.submodule_name as it's the most common case
-                    module = operator.attrgetter(submodule_name)(self)
-                except AttributeError:
-                    logger.verbose(f"Cannot access {submodule_name} directly, trying to find the correct module.")
-                    # find module starting from the beginning
-                    module = find_module(module, submodule_name.split("."))
-
-            if isinstance(module, Module):
-                _check_param_compatible(getattr(module, param_name), param, nested_attr_name)
-                setattr(module, param_name, param)
-            elif isinstance(module, list):
-                _check_param_compatible(module[int(param_name)], param, nested_attr_name)
-                module[int(param_name)] = param
-            elif isinstance(module, dict):
-                _check_param_compatible(module[param_name], param, nested_attr_name)
-                module[param_name] = param
+        submodule_name, _, param_name = nested_attr_name.rpartition(".")
+        # If there is no submodule, it means we are accessing a parameter of self
+        module = self
+        if submodule_name:
+            try:
+                # try to access module.submodule_name as it's the most common case
+                module = operator.attrgetter(submodule_name)(self)
+            except AttributeError:
+                logger.verbose(f"Cannot access {submodule_name} directly, trying to find the correct module.")
+                # find module starting from the beginning
+                module = find_module(module, submodule_name.split("."))
+
+        if isinstance(module, Module):
+            _check_param_compatible(getattr(module, param_name), param, nested_attr_name)
+            setattr(module, param_name, param)
+        elif isinstance(module, list):
+            _check_param_compatible(module[int(param_name)], param, nested_attr_name)
+            module[int(param_name)] = param
+        elif isinstance(module, dict):
+            _check_param_compatible(module[param_name], param, nested_attr_name)
+            module[param_name] = param
 
     def named_children(self) -> Iterator[Tuple[str, "Module"]]:
         r"""
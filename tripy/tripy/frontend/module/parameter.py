@@ -15,14 +15,22 @@
 # limitations under the License.
 #
 
-from typing import Sequence
+from typing import List, Sequence
 
 import tripy.frontend.utils as frontend_utils
 from tripy import export, utils
 from tripy.frontend.tensor import Tensor
+from tripy.frontend.trace.ops import Storage
 from tripy.utils import Result
 
 
+def _get_shape(tensor: "tripy.Tensor") -> List[int]:
+    # Use the statically known shape if possible so we don't need to compile and run a program just to determine it.
+    if isinstance(tensor.trace_tensor.producer, Storage):
+        return list(tensor.trace_tensor.producer.shape)
+    return list(tensor.shape.eval().data())
+
+
 @export.public_api(document_under="modules", autodoc_options=[":no-members:", ":no-special-members:"])
 class Parameter(Tensor):
     """
@@ -61,7 +69,7 @@ class Parameter(Tensor):
     def _is_compatible(self, other: "Parameter") -> Result:
         # Determines whether another parameter has the same shape and
         # data type as this one.
-        return self._is_compatible_helper(self.shape.eval(), other.shape.eval(), self.dtype, other.dtype)
+        return self._is_compatible_helper(_get_shape(self), _get_shape(other), self.dtype, other.dtype)
 
 
 class DefaultParameter(Parameter):
@@ -81,6 +89,4 @@ class DefaultParameter(Parameter):
         self._dtype = dtype
 
     def _is_compatible(self, other: "Parameter") -> Result:
-        return self._is_compatible_helper(
-            tuple(self._shape), tuple(other.shape.eval().data()), self._dtype, other.dtype
-        )
+        return self._is_compatible_helper(list(self._shape), _get_shape(other), self._dtype, other.dtype)
@@ -94,15 +94,19 @@ class Tensor(metaclass=TensorMeta):
 
             tensor = tp.Tensor([1.0, 2.0, 3.0], shape=(3,), dtype=tp.float32)
         """
+        import tripy.config as cfg
         from tripy.frontend.trace.tensor import TraceTensor
 
         # We include code for everything above the `BaseTraceOp.build` function, which is called at most
         # this many stack frames above the constructor.
         STACK_DEPTH_OF_BUILD = 4
         # not using utils.default() because it always evaluates the `default` argument.
-        stack_info = (
-            stack_info if stack_info is not None else utils.get_stack_info(include_code_index=STACK_DEPTH_OF_BUILD)
-        )
+        if stack_info is None:
+            stack_info = (
+                utils.get_stack_info(include_code_index=STACK_DEPTH_OF_BUILD)
+                if cfg.enable_stack_info
+                else utils.StackInfo([])
+            )
 
         name = name if name is not None else Tensor._get_unique_name()
 
@@ -185,6 +189,8 @@ class Tensor(metaclass=TensorMeta):
         return self.trace_tensor.rank
 
     def eval(self) -> Array:
+        import tripy.config as cfg
+        from tripy.backend.cache import compute_cache_key, get_executable_cache, is_cacheable
         from tripy.backend.mlir.compiler import Compiler
         from tripy.backend.mlir.executor import Executor
         from tripy.frontend.trace import Trace
@@ -192,12 +198,29 @@ class Tensor(metaclass=TensorMeta):
         if isinstance(self.trace_tensor.producer, Storage):
             return self.trace_tensor.producer.data
 
+        TRT_BUILDER_OPT_LEVEL = 0
+
         trace = Trace([self])
+        if cfg.enable_constant_folding:
+            trace.fold_constants()
+        if cfg.enable_common_subexpression_elimination:
+            trace.eliminate_common_subexpressions()
         flat_ir = trace.to_flat_ir()
-        mlir = flat_ir.to_mlir()
 
-        compiler = Compiler(trt_builder_opt_level=0)
-        executable = compiler.compile(mlir, flat_ir=flat_ir)
+        executable = None
+        use_cache = cfg.enable_executable_cache and is_cacheable(flat_ir)
+        if use_cache:
+            cache = get_executable_cache()
+            cache_key = compute_cache_key(flat_ir, TRT_BUILDER_OPT_LEVEL)
+            executable = cache.get(cache_key)
+
+        if executable is None:
+            mlir = flat_ir.to_mlir()
+            compiler = Compiler(trt_builder_opt_level=TRT_BUILDER_OPT_LEVEL)
+            executable = compiler.compile(mlir, flat_ir=flat_ir)
+            if use_cache:
+                cache.put(cache_key, executable)
+
         executor = Executor(executable)
         # Upon computing the value of this tensor, we switch it to have a `Storage`
         # parameter so that it does not need to be computed again.
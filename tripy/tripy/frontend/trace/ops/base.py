@@ -126,10 +126,26 @@ class BaseTraceOp(abc.ABC):
 
     def infer_shapes(self):
         """
-        Infers shapes for the operation and updates output tensor shapes accordingly.
+        Infers static shapes for the operation and updates output tensor shapes accordingly.
+        This is only called when the shapes of all inputs are static.
         """
-        # Default implementation of infer_shapes fills dynamic dim for all elements.
-        self.outputs[0].shape = [-1] * self.outputs[0].rank
+        # By default, output shapes are left unknown.
+        pass
+
+    def fold(self, inputs: List[Optional[Union[int, bool, List]]]) -> Optional[Union[int, bool, List]]:
+        """
+        Evaluates the operation on the host for constant folding.
+        This is only called for operations with a single output of rank 0 or 1.
+
+        Args:
+            inputs: The values of the inputs as Python scalars (for rank 0) or lists (for rank 1),
+                or None for inputs whose values are not known ahead of time.
+
+        Returns:
+            The value of the output, or None if it cannot be computed ahead of time.
+        """
+        # By default, operations are not folded.
+        return None
 
     def infer_dtypes(self):
         """
@@ -15,6 +15,7 @@
 # limitations under the License.
 #
 
+import operator
 from dataclasses import dataclass
 from typing import Any, Union
 
@@ -74,6 +75,34 @@ class BinaryElementwise(BaseTraceOp):
         op_utils.check_input_dtypes_match(self, self.kind.strip())
         self.outputs[0].dtype = self.inputs[0].dtype
 
+    def infer_shapes(self):
+        shape1, shape2 = op_utils.get_broadcast_compatible_shapes(
+            tuple(self.inputs[0].shape), tuple(self.inputs[1].shape)
+        )
+        if op_utils.is_broadcast_compatible(shape1, shape2):
+            self.outputs[0].shape = [dim2 if dim1 == 1 else dim1 for dim1, dim2 in zip(shape1, shape2)]
+
+    def fold(self, inputs):
+        def divide(lhs, rhs):
+            if rhs == 0:
+                return None
+            # Integer division in StableHLO rounds towards zero.
+            quotient = abs(lhs) // abs(rhs)
+            return quotient if (lhs < 0) == (rhs < 0) else -quotient
+
+        func = {
+            BinaryElementwise.Kind.SUM: operator.add,
+            BinaryElementwise.Kind.SUB: operator.sub,
+            BinaryElementwise.Kind.MUL: operator.mul,
+            BinaryElementwise.Kind.DIV: divide,
+            BinaryElementwise.Kind.MAXIMUM: max,
+            BinaryElementwise.Kind.MINIMUM: min,
+        }.get(self.kind)
+
+        if func is None or self.outputs[0].dtype == datatype.bool:
+            return None
+        return op_utils.fold_elementwise(func, *inputs)
+
     def broadcast_inputs(self, inputs, outputs):
         from tripy.common.datatype import int32
         from tripy.flat_ir.ops import MaxOp
@@ -157,6 +186,17 @@ class Comparison(BinaryElementwise):
         op_utils.check_input_dtypes_match(self, self.kind.strip())
         self.outputs[0].dtype = datatype.bool
 
+    def fold(self, inputs):
+        func = {
+            "LT": operator.lt,
+            "LE": operator.le,
+            "EQ": operator.eq,
+            "NE": operator.ne,
+            "GE": operator.ge,
+            "GT": operator.gt,
+        }[self.kind.compare_direction]
+        return op_utils.fold_elementwise(func, *inputs)
+
     def to_flat_ir(self, inputs, outputs):
         from tripy.flat_ir.ops import CompareOp
 
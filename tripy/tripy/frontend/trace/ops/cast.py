@@ -17,6 +17,7 @@
 
 from dataclasses import dataclass
 from tripy import export, dtype_info
+from tripy.frontend.trace.ops import utils as op_utils
 from tripy.frontend.trace.ops.base import BaseTraceOp
 
 
@@ -38,6 +39,14 @@ class Cast(BaseTraceOp):
     def infer_dtypes(self):
         self.outputs[0].dtype = self.dtype
 
+    def infer_shapes(self):
+        self.outputs[0].shape = self.inputs[0].shape
+
+    def fold(self, inputs):
+        from tripy.common.datatype import bool as tp_bool
+
+        return op_utils.fold_elementwise(bool if self.dtype == tp_bool else int, *inputs)
+
     def to_flat_ir(self, inputs, outputs):
         from tripy.common.array import Array
         from tripy.common.datatype import int32, int64, float32, bool as tp_bool
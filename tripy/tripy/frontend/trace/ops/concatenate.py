@@ -29,6 +29,11 @@ class Concatenate(BaseTraceOp):
     def infer_devices(self):
         self.outputs[0].device = self.inputs[0].device
 
+    def fold(self, inputs):
+        if self.outputs[0].rank != 1 or any(value is None for value in inputs):
+            return None
+        return [elem for value in inputs for elem in value]
+
     def to_flat_ir(self, inputs, outputs):
         from tripy.flat_ir.ops import ConcatenateOp
 
@@ -55,6 +55,25 @@ class Reshape(BaseTraceOp):
         else:
             self.outputs[0].rank = self.output_rank
 
+    def infer_shapes(self):
+        from tripy.frontend.trace.ops.storage import Storage
+
+        # The output shape is only static if the requested shape is a constant.
+        if isinstance(self.inputs[1].producer, Storage):
+            out_shape = self.inputs[1].producer.data.data()
+            if all(dim >= 0 for dim in out_shape):
+                self.outputs[0].shape = out_shape
+
+    def fold(self, inputs):
+        value, out_shape = inputs
+        if value is None or out_shape is None:
+            return None
+
+        values = value if isinstance(value, list) else [value]
+        if out_shape == []:
+            return values[0] if len(values) == 1 else None
+        return values if out_shape == [len(values)] else None
+
     def to_flat_ir(self, inputs, outputs):
         from tripy.flat_ir.ops import DynamicReshapeOp
 
@@ -169,6 +188,13 @@ class Squeeze(BaseTraceOp):
             self.outputs[0].rank = len(out_shape)
             self.out_shape = out_shape
 
+    def fold(self, inputs):
+        # Only rank 1 tensors with a single element can be squeezed into a rank 0 result.
+        value = inputs[0]
+        if not isinstance(value, list) or len(value) != 1:
+            return None
+        return value[0]
+
     def to_flat_ir(self, inputs, outputs):
         from tripy.flat_ir.ops import DynamicReshapeOp
 
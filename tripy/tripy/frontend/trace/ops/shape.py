@@ -38,6 +38,16 @@ class Shape(BaseTraceOp):
 
         self.outputs[0].dtype = int32
 
+    def infer_shapes(self):
+        self.outputs[0].shape = [self.inputs[0].rank]
+
+    def fold(self, inputs):
+        # The shape of the input is static if it was inferred ahead of time.
+        shape = self.inputs[0].shape
+        if shape is None or any(dim < 0 for dim in shape):
+            return None
+        return list(shape)
+
     def to_flat_ir(self, inputs, outputs):
         import tripy.frontend.trace.ops.utils as op_utils
 
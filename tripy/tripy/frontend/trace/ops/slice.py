@@ -40,6 +40,21 @@ class Slice(BaseTraceOp):
     # we only care about the data input
     infer_shape_output_idxs = op_utils.ShapeOutputIdxPolicies.infer_from_first_input_only
 
+    def fold(self, inputs):
+        value, *slice_params = inputs
+        if not isinstance(value, list) or any(param is None for param in slice_params):
+            return None
+        if not slice_params:
+            return value
+
+        if len(slice_params) != 3 or any(isinstance(param, list) and len(param) != 1 for param in slice_params):
+            return None
+        start, limit, stride = [param[0] if isinstance(param, list) else param for param in slice_params]
+        # Out of bounds indices are clamped in the frontend, so we leave anything else to the runtime.
+        if not (0 <= start <= len(value) and 0 <= limit <= len(value) and stride > 0):
+            return None
+        return value[start:limit:stride]
+
     def to_flat_ir(self, inputs, outputs):
         from tripy.flat_ir.ops import DynamicReshapeOp, DynamicSliceOp
         from tripy.flat_ir.tensor import FlatIRTensor
@@ -58,6 +58,9 @@ class Storage(BaseTraceOp):
     def infer_rank(self):
         self.outputs[0].rank = len(self.shape)
 
+    def infer_shapes(self):
+        self.outputs[0].shape = self.shape
+
     def infer_devices(self):
         # This is different from self.device
         # Constants are always on device when executed by mlir
@@ -40,6 +40,9 @@ class UnaryElementwise(BaseTraceOp):
     # Note: shape inputs will fail because the StableHLO implementations of these ops
     # require float inputs but shapes are always int
 
+    def infer_shapes(self):
+        self.outputs[0].shape = self.inputs[0].shape
+
     def to_flat_ir(self, inputs, outputs):
         from tripy.flat_ir.ops import ExpOp, LogOp, RsqrtOp, TanhOp, SineOp, CosineOp, SqrtOp, AbsOp
 
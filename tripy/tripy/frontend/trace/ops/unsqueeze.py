@@ -37,6 +37,13 @@ class Unsqueeze(BaseTraceOp):
     def infer_rank(self):
         self.outputs[0].rank = self.inputs[0].rank + 1
 
+    def fold(self, inputs):
+        # Only scalars can be unsqueezed into a rank 1 result.
+        value = inputs[0]
+        if value is None or isinstance(value, list):
+            return None
+        return [value]
+
     def to_flat_ir(self, inputs, outputs):
         from tripy.flat_ir.ops import DynamicBroadcastOp
 
@@ -427,6 +427,48 @@ def slice_rank1_tensor(rank1_tensor: "FlatIRTensor", slice_index: int, reason_de
     return result_slice
 
 
+##
+## Constant folding
+##
+
+
+def broadcast_folded_values(*values):
+    """
+    Broadcasts the values of rank 0 or rank 1 tensors, as passed to `BaseTraceOp.fold`, against each other.
+
+    Returns:
+        A tuple containing the values as lists of the same length and the rank of the result,
+        or None if the values are not broadcast compatible.
+    """
+    rank = 1 if any(isinstance(value, list) for value in values) else 0
+    values = [value if isinstance(value, list) else [value] for value in values]
+
+    lengths = {len(value) for value in values} - {1}
+    if len(lengths) > 1:
+        return None
+    length = lengths.pop() if lengths else 1
+    return [value * length if len(value) == 1 else value for value in values], rank
+
+
+def fold_elementwise(func, *values):
+    """
+    Applies `func` elementwise to the broadcasted values of rank 0 or rank 1 tensors, as passed to `BaseTraceOp.fold`.
+    If any value is unknown, the values cannot be broadcast, or `func` returns None for any element, this returns None.
+    """
+    if any(value is None for value in values):
+        return None
+
+    broadcasted = broadcast_folded_values(*values)
+    if broadcasted is None:
+        return None
+    values, rank = broadcasted
+
+    result = [func(*elements) for elements in zip(*values)]
+    if any(elem is None for elem in result):
+        return None
+    return result if rank == 1 else result[0]
+
+
 ##
 ## Quantize
 ##
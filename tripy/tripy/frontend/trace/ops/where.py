@@ -68,6 +68,9 @@ class Where(BaseTraceOp):
         op_utils.check_input_dtypes_match(self, op_details="where", start_index=1)
         self.outputs[0].dtype = self.inputs[1].dtype
 
+    def fold(self, inputs):
+        return op_utils.fold_elementwise(lambda cond, lhs, rhs: lhs if cond else rhs, *inputs)
+
     def to_flat_ir(self, inputs, outputs):
         from tripy.flat_ir.tensor import FlatIRTensor
         from tripy.common.datatype import bool as tp_bool, int32
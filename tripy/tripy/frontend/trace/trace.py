@@ -16,16 +16,21 @@
 #
 
 import copy
-from typing import List, Sequence, Set
+from typing import List, Sequence, Set, Tuple
 
+from tripy import constants, utils
 from tripy.common.exception import raise_error
 from tripy.common.shape_bounds import ShapeBounds
 from tripy.frontend.trace.ops import BaseTraceOp
 from tripy.frontend.trace.tensor import TraceTensor
-from tripy.frontend.utils import topological_sort
+from tripy.frontend.utils import fingerprint_graph, get_canonical_names
 from tripy.logging import logger
 
 
+# Canonical names use a prefix that cannot collide with names generated for frontend tensors.
+CANONICAL_NAME_PREFIX = "%"
+
+
 class Trace:
     """
     A flattened representation of a computation graph expressed by one or more Tensors.
@@ -61,10 +66,8 @@ class Trace:
         self.outputs: List[TraceTensor] = [tensor.trace_tensor for tensor in tensors]
         self.shapes = shapes
 
-        exprs = [tensor.trace_tensor.producer for tensor in tensors]
-
         input_op_ids = set(id(inp.trace_tensor.producer) for inp in inputs)
-        seen_op_ids: Set[int] = set()
+        visited_op_ids: Set[int] = set()
 
         # Check all tensors for duplicate names. We currently rely on tensor names being
         # unique in the trace/flatIR. We could potentially change this in the future to
@@ -80,23 +83,30 @@ class Trace:
                 )
             _tensor_map[tensor.name] = tensor
 
-        while exprs:
-            head = exprs.pop(0)
+        # Discover the ops using an iterative post-order DFS starting from the outputs.
+        # Since an op is only emitted once all of its inputs have been emitted, this yields the ops
+        # in topologically sorted order while visiting each op and tensor only once.
+        stack: List[Tuple[BaseTraceOp, bool]] = [(tensor.trace_tensor.producer, False) for tensor in reversed(tensors)]
+        while stack:
+            op, inputs_emitted = stack.pop()
+            if inputs_emitted:
+                self.ops.append(op)
+                continue
 
-            if id(head) in seen_op_ids:
+            if id(op) in visited_op_ids:
                 continue
-            seen_op_ids.add(id(head))
+            visited_op_ids.add(id(op))
 
-            for io in head.inputs + head.outputs:
+            for io in op.inputs + op.outputs:
                 check_name(io)
 
-            if id(head) not in input_op_ids:
-                # not as an input
-                self.ops.append(head)
-                exprs.extend([inp.producer for inp in head.inputs])
+            if id(op) in input_op_ids:
+                continue
 
-        # Reverse the order of the layers so they are topologically sorted
-        self.ops = topological_sort(self.ops)
+            stack.append((op, True))
+            for inp in reversed(op.inputs):
+                if id(inp.producer) not in visited_op_ids:
+                    stack.append((inp.producer, False))
 
         # Perform shape/dtype/device inference to fill shape information for all tensors.
         self._infer_tensor_info()
@@ -116,6 +126,178 @@ class Trace:
             layer_strs.append(f"    {str(out)}")
         return "\n".join(layer_strs)
 
+    def fingerprint(self) -> str:
+        """
+        Returns a fingerprint of the computation represented by this trace.
+        Traces that perform the same computation have the same fingerprint regardless of tensor names.
+        """
+        return fingerprint_graph(self.inputs, self.ops, self.outputs, BaseTraceOp, self.shapes)
+
+    def canonicalize(self) -> None:
+        """
+        Renames all tensors in the trace based on their topological position.
+
+        NOTE: Trace tensors are shared with frontend tensors, so this will also rename the frontend tensors.
+        """
+        names = get_canonical_names(self.inputs, self.ops, self.outputs, prefix=CANONICAL_NAME_PREFIX)
+
+        tensors = {id(tensor): tensor for op in self.ops for tensor in op.inputs + op.outputs}
+        tensors.update({id(tensor): tensor for tensor in self.inputs + self.outputs})
+        for tensor in tensors.values():
+            tensor.name = names[tensor.name]
+
+    def fold_constants(self) -> int:
+        """
+        Evaluates operations whose outputs can be computed ahead of time on the host, like shape arithmetic
+        on tensors with static shapes, and replaces them with constants. Operations that are no longer
+        needed afterwards are removed from the trace.
+
+        NOTE: Trace tensors are shared with frontend tensors, so folded frontend tensors will also become constants.
+
+        Returns:
+            The number of operations that were folded.
+        """
+        from tripy.common.array import Array
+        from tripy.common.datatype import bool as tp_bool
+        from tripy.common.datatype import int32, int64
+        from tripy.common.device import device
+        from tripy.frontend.trace.ops import Storage
+
+        FOLDABLE_DTYPES = {int32: 32, int64: 64, tp_bool: None}
+
+        def is_static(tensor):
+            return tensor.shape is not None and all(dim >= 0 for dim in tensor.shape)
+
+        def get_value(tensor):
+            if (
+                not isinstance(tensor.producer, Storage)
+                or tensor.dtype not in FOLDABLE_DTYPES
+                or len(tensor.producer.shape) > 1
+                or utils.volume(tensor.producer.shape) > constants.CONSTANT_FOLDING_VOLUME_THRESHOLD
+            ):
+                return None
+            return tensor.producer.data.data()
+
+        def is_representable(value, dtype):
+            bits = FOLDABLE_DTYPES[dtype]
+            if bits is None:
+                return True
+            return all(-(2 ** (bits - 1)) <= elem < 2 ** (bits - 1) for elem in utils.make_list(value))
+
+        # Tensors that depend on the inputs of the trace may have different values at runtime.
+        dynamic_tensor_ids = {id(inp) for inp in self.inputs}
+        num_folded = 0
+        new_ops = []
+        for op in self.ops:
+            if any(id(inp) in dynamic_tensor_ids for inp in op.inputs):
+                dynamic_tensor_ids.update(id(out) for out in op.outputs)
+                new_ops.append(op)
+                continue
+
+            if all(is_static(inp) for inp in op.inputs):
+                op.infer_shapes()
+
+            value = None
+            if (
+                not isinstance(op, Storage)
+                and len(op.outputs) == 1
+                and op.outputs[0].rank <= 1
+                and op.outputs[0].dtype in FOLDABLE_DTYPES
+                and op.outputs[0].device.kind == "gpu"
+            ):
+                value = op.fold([get_value(inp) for inp in op.inputs])
+
+            if value is None or not is_representable(value, op.outputs[0].dtype):
+                new_ops.append(op)
+                continue
+
+            out = op.outputs[0]
+            shape = (len(value),) if isinstance(value, list) else ()
+            storage = Storage.build_internal(
+                [], [out], Array(value, shape=shape, dtype=out.dtype, device=device("cpu"))
+            )
+            storage.infer_shapes()
+            storage.infer_devices()
+            new_ops.append(storage)
+            num_folded += 1
+
+        if not num_folded:
+            return 0
+
+        # Remove operations whose outputs are no longer used.
+        live_tensor_ids = {id(out) for out in self.outputs}
+        live_ops = []
+        for op in reversed(new_ops):
+            if any(id(out) in live_tensor_ids for out in op.outputs):
+                live_ops.append(op)
+                live_tensor_ids.update(id(inp) for inp in op.inputs)
+        self.ops = list(reversed(live_ops))
+
+        logger.verbose(f"Folded {num_folded} operation(s) into constants.")
+        logger.trace(lambda: f"{self}\n")
+        return num_folded
+
+    def eliminate_common_subexpressions(self) -> int:
+        """
+        Merges operations that perform the same computation on the same inputs so that each computation
+        is only performed once. Small constants with identical contents are merged as well.
+
+        NOTE: Trace tensors are shared with frontend tensors, so this also rewires the inputs of frontend operations.
+
+        Returns:
+            The number of operations that were removed.
+        """
+        from tripy.frontend.trace.ops import Plugin, Storage
+
+        def get_key(op):
+            # Plugins are opaque to us, so we cannot assume that they are free of side effects.
+            if isinstance(op, Plugin):
+                return None
+
+            if isinstance(op, Storage):
+                if utils.volume(op.shape) > constants.CONSTANT_FOLDING_VOLUME_THRESHOLD:
+                    return None
+                return (Storage, op.dtype, tuple(op.shape), repr(op.device), repr(op.data.data()))
+
+            fields = utils.get_dataclass_fields(op, BaseTraceOp)
+            return (
+                type(op),
+                tuple(id(inp) for inp in op.inputs),
+                len(op.outputs),
+                tuple((field.name, repr(getattr(op, field.name))) for field in fields),
+            )
+
+        # Outputs of the trace must keep their producers since they are returned to the caller.
+        output_ids = {id(out) for out in self.outputs}
+        replacements = {}
+        op_by_key = {}
+        new_ops = []
+        for op in self.ops:
+            op.inputs = [replacements.get(id(inp), inp) for inp in op.inputs]
+
+            key = get_key(op)
+            if key is None:
+                new_ops.append(op)
+                continue
+
+            existing_op = op_by_key.get(key)
+            if existing_op is None or any(id(out) in output_ids for out in op.outputs):
+                op_by_key.setdefault(key, op)
+                new_ops.append(op)
+                continue
+
+            for out, existing_out in zip(op.outputs, existing_op.outputs):
+                replacements[id(out)] = existing_out
+
+        num_removed = len(self.ops) - len(new_ops)
+        if not num_removed:
+            return 0
+
+        self.ops = new_ops
+        logger.verbose(f"Eliminated {num_removed} common subexpression(s).")
+        logger.trace(lambda: f"{self}\n")
+        return num_removed
+
     def to_flat_ir(self):
         from tripy.flat_ir.flat_ir import FlatIR
 
@@ -16,8 +16,9 @@
 #
 
 import functools
+import hashlib
 import inspect
-from typing import List, Optional, Sequence, Tuple, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 from collections import deque
 
 from tripy import utils
@@ -80,6 +81,10 @@ def convert_inputs_to_tensors(
                 assert not isinstance(arg, Tensor)
                 arg = Tensor(arg, dtype=dtype)
 
+                # Stack information may not have been captured, e.g. if it was disabled in the config.
+                if not arg.stack_info:
+                    return arg
+
                 # This is the stack depth in arg.stack_info where we find the function
                 # that's decorated with `convert_inputs_to_tensors()`.
                 for idx, source_info in enumerate(arg.stack_info):
@@ -296,3 +301,101 @@ def topological_sort(ops: List[Union[BaseTraceOp, BaseFlatIROp]]) -> List[Union[
 
     assert len(ops) == len(result), f"Num original ops {len(ops)}, got num {len(result)}"
     return result
+
+
+GraphOp = Union[BaseTraceOp, BaseFlatIROp]
+GraphTensor = Union["TraceTensor", "FlatIRTensor"]
+
+
+def get_canonical_names(
+    inputs: List[GraphTensor], ops: List[GraphOp], outputs: List[GraphTensor], prefix: str = "t"
+) -> Dict[str, str]:
+    """
+    Maps the names of all tensors in a Trace or FlatIR graph to names derived from the position at which
+    each tensor is first encountered in the (topologically sorted) graph. Unlike the original names, which
+    come from global counters, the canonical names only depend on the structure of the graph.
+    """
+    names = {}
+
+    def add(tensor):
+        if tensor.name not in names:
+            names[tensor.name] = f"{prefix}{len(names)}"
+
+    for inp in inputs:
+        add(inp)
+
+    for op in ops:
+        for tensor in op.inputs + op.outputs:
+            add(tensor)
+
+    for out in outputs:
+        add(out)
+
+    return names
+
+
+def _update_hash(hasher: "hashlib._Hash", value: Any) -> None:
+    from tripy.common.array import Array
+
+    if isinstance(value, Array):
+        import mlir_tensorrt.runtime.api as runtime
+
+        memref = value.memref_value
+        if memref.address_space == runtime.PointerType.device:
+            memref = value.runtime_client.copy_to_host(device_memref=memref)
+
+        # Hash the contents of constants instead of their string representations, which may be summarized.
+        hasher.update(f"Array(dtype={value.dtype}, shape={tuple(value.shape)}):".encode())
+        hasher.update(memoryview(memref).cast("B"))
+    else:
+        hasher.update(repr(value).encode())
+    hasher.update(b";")
+
+
+def fingerprint_graph(
+    inputs: List[GraphTensor],
+    ops: List[GraphOp],
+    outputs: List[GraphTensor],
+    BaseOpClass: type,
+    shapes: Optional[Sequence["ShapeBounds"]] = None,
+) -> str:
+    """
+    Computes a stable fingerprint for a Trace or FlatIR graph. The fingerprint covers op kinds,
+    op dataclass fields, connectivity, data types, ranks, shapes, devices, and the contents of constants,
+    but not tensor names or stack information. Hence, two graphs performing the same computation
+    will have the same fingerprint.
+
+    Args:
+        inputs: The inputs of the graph.
+        ops: The topologically sorted operations of the graph.
+        outputs: The outputs of the graph.
+        BaseOpClass: The base class of the operations. Dataclass fields inherited from this class are not hashed.
+        shapes: The shape profiles of the inputs, if any.
+
+    Returns:
+        A hex digest identifying the graph.
+    """
+    names = get_canonical_names(inputs, ops, outputs)
+    hasher = hashlib.sha256()
+
+    def update_tensor(tensor):
+        _update_hash(hasher, (names[tensor.name], tensor.dtype, tensor.rank, tensor.shape, tensor.device))
+
+    _update_hash(hasher, shapes)
+
+    for inp in inputs:
+        update_tensor(inp)
+
+    for op in ops:
+        _update_hash(hasher, f"{type(op).__module__}.{type(op).__qualname__}")
+        for tensor in op.inputs + op.outputs:
+            update_tensor(tensor)
+        for field in utils.get_dataclass_fields(op, BaseOpClass):
+            _update_hash(hasher, field.name)
+            _update_hash(hasher, getattr(op, field.name))
+
+    _update_hash(hasher, "outputs")
+    for out in outputs:
+        update_tensor(out)
+
+    return hasher.hexdigest()
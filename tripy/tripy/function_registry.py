@@ -195,11 +195,20 @@ class FunctionRegistry(dict):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.overloads: Dict[str, List[Callable]] = defaultdict(list)
+        # Caches the overload selected for each combination of argument types and keyword argument names.
+        # Overload resolution depends only on these, so once an overload has matched, we can skip the
+        # (comparatively expensive) type checks for subsequent calls with the same signature.
+        self.dispatch_cache: Dict[str, Dict[Tuple, FuncOverload]] = defaultdict(dict)
 
     # NOTE: If you change this signature, also update `stack_info.py` - it currently relies on getting `key` to determine function names.
     def find_overload(self, key: str, args: List, kwargs: Dict) -> Callable:
-        # NOTE: We could introduce a fast path when len(overloads) == 1, but it seems worth the overhead
-        # to have the type checks and nice error messages. Note that this overhead will not be a factor when we compile.
+        # NOTE: We only cache successful matches, so mismatches always go through the full type checks
+        # below and retain the detailed error messages.
+        cache = self.dispatch_cache[key]
+        cache_key = (tuple(map(type, args)), tuple(kwargs))
+        overload = cache.get(cache_key)
+        if overload is not None:
+            return overload
 
         def raise_overload_error(msg, candidate_overloads, mismatch_reasons=None, extra_info=""):
             arg_type_strs = []
@@ -227,9 +236,18 @@ class FunctionRegistry(dict):
                 ],
             )
 
+        overloads = self.overloads[key]
+        if len(overloads) == 1:
+            # Fast path: with only a single candidate, there is no ambiguity to check for.
+            matched = overloads[0].matches_arg_types(args, kwargs)
+            if not matched:
+                raise_overload_error("Could not find an implementation", overloads, [matched.error_details])
+            cache[cache_key] = overloads[0]
+            return overloads[0]
+
         matched_overloads = []
         mismatch_reasons = []
-        for overload in self.overloads[key]:
+        for overload in overloads:
             matched = overload.matches_arg_types(args, kwargs)
             if matched:
                 matched_overloads.append(overload)
@@ -243,9 +261,10 @@ class FunctionRegistry(dict):
                 extra_info="Hint: Try using keyword arguments to help disambiguate between overloads.",
             )
         elif matched_overloads:
+            cache[cache_key] = matched_overloads[0]
             return matched_overloads[0]
 
-        raise_overload_error("Could not find an implementation", self.overloads[key], mismatch_reasons)
+        raise_overload_error("Could not find an implementation", overloads, mismatch_reasons)
 
     def __call__(self, key: Any):
         """
@@ -264,6 +283,8 @@ class FunctionRegistry(dict):
                 self[key] = func
             else:
                 self.overloads[key].append(FuncOverload(func))
+                # Previously cached dispatch decisions may no longer be valid with the new overload.
+                self.dispatch_cache.pop(key, None)
                 # The dispatch function needs to look and feel like the underlying function to make docs
                 # work correctly. When there are multiple overloads, we concatenate the docstrings together
                 # for the dispatch function.
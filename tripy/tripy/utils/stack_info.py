@@ -15,9 +15,12 @@
 # limitations under the License.
 #
 
-import inspect
+import itertools
+import linecache
+import sys
 from dataclasses import dataclass
-from typing import Tuple, Optional
+from types import CodeType
+from typing import Optional, Tuple
 
 
 @dataclass
@@ -47,6 +50,44 @@ class SourceInfo:
         module = self.module or ""
         return "tripy" not in module.split(".")
 
+    def _defer_code(self, code_obj: CodeType, instruction_index: int) -> None:
+        """
+        Defers retrieving `code` and `column_range` until they are first accessed.
+        Reading source files is expensive and the code is only needed when we report errors.
+        """
+        # We only keep the code object and not the frame itself so that we don't keep the frame's locals alive.
+        self._code_location = (code_obj, instruction_index)
+        del self.code
+        del self.column_range
+
+    def __getattr__(self, name):
+        # This is only called if the attribute does not exist, i.e. if we deferred retrieving the code.
+        if name in {"code", "column_range"} and "_code_location" in self.__dict__:
+            code_obj, instruction_index = self.__dict__.pop("_code_location")
+            # Note that in some cases, e.g. when code is being provided via the interactive shell, we may not be able to retrieve it.
+            # In that case we just leave it empty.
+            self.code = linecache.getline(self.file, self.line).rstrip()
+
+            column_range = None
+            # In Python 3.11, code objects contain column offset information.
+            if hasattr(code_obj, "co_positions") and instruction_index >= 0:
+                _, _, col_offset, end_col_offset = next(
+                    itertools.islice(code_obj.co_positions(), instruction_index // 2, None), (None,) * 4
+                )
+                column_range = (col_offset, end_col_offset)
+            # The column range may have already been set explicitly.
+            self.__dict__.setdefault("column_range", column_range)
+            return getattr(self, name)
+
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def __getstate__(self):
+        # Code objects cannot be pickled, so resolve any deferred fields before serializing.
+        # This also releases the reference to the code object.
+        if "_code_location" in self.__dict__:
+            self.code
+        return self.__dict__.copy()
+
 
 class StackInfo(list):
     def get_first_user_frame_index(self) -> int:
@@ -62,6 +103,9 @@ def get_stack_info(include_code_index: int = None) -> StackInfo:
     """
     Returns stack information for the current call stack.
 
+    This only walks the frames and records their locations, which is cheap. The code for each frame
+    is only read from the source file when it is first accessed.
+
     Args:
         include_code_index: The index of a frame after which to include code.
                 Code is only included up to the first user frame.
@@ -74,45 +118,35 @@ def get_stack_info(include_code_index: int = None) -> StackInfo:
 
     stack_info = StackInfo([])
     # Exclude the current stack frame since we don't care about the get_stack_info() function itself.
-    stack = inspect.stack()[1:]
+    frame = sys._getframe(1)
 
     first_user_frame_found = False
 
-    for index, frame in enumerate(stack):
-        module = inspect.getmodule(frame.frame)
+    index = 0
+    while frame is not None:
+        code_obj = frame.f_code
 
         source_info = SourceInfo(
-            module=module.__name__ if module else None,
-            file=frame.filename,
-            line=frame.lineno,
-            function=frame.function,
+            module=frame.f_globals.get("__name__"),
+            file=code_obj.co_filename,
+            line=frame.f_lineno,
+            function=code_obj.co_name,
             code=None,
             _dispatch_target="",
             column_range=None,
         )
         if source_info.module == tripy.function_registry.__name__ and source_info.function == "wrapper":
-            source_info._dispatch_target = frame.frame.f_locals.get("key", "")
-
-        def add_code():
-            # Note that in some cases, e.g. when code is being provided via the interactive shell, we may not be able to retrieve it.
-            # In that case we just leave it empty.
-            source_info.code = frame.code_context[0].rstrip() if frame.code_context else ""
-
-            try:
-                # In Python 3.11, frames contain column offset information.
-                frame.positions
-            except AttributeError:
-                pass
-            else:
-                source_info.column_range = (frame.positions.col_offset, frame.positions.end_col_offset)
+            source_info._dispatch_target = frame.f_locals.get("key", "")
 
         if not first_user_frame_found:
             if source_info.is_user_frame():
-                add_code()
+                source_info._defer_code(code_obj, frame.f_lasti)
                 first_user_frame_found = True
             elif include_code_index is not None and index >= include_code_index:
-                add_code()
+                source_info._defer_code(code_obj, frame.f_lasti)
 
         stack_info.append(source_info)
+        frame = frame.f_back
+        index += 1
 
     return stack_info
@@ -164,22 +164,6 @@ def volume(shape):
     return volume
 
 
-def flatten_list(data):
-    """
-    Flattens a nested list into a single list.
-    """
-    if isinstance(data, (int, float)):
-        # Need to return a list here as array.array require input to be a list.
-        return [data]
-    flat_list = []
-    for element in data:
-        if isinstance(element, list):
-            flat_list.extend(flatten_list(element))
-        else:
-            flat_list.append(element)
-    return flat_list
-
-
 def get_shape(data):
     """
     Find the shape of a nested list.